@@ -3,12 +3,31 @@
 from openpyxl.compat import safe_string
 from openpyxl.xml.functions import Element, SubElement, whitespace, XML_NS
 from openpyxl import LXML
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.datetime import to_excel, to_ISO8601
 from datetime import timedelta
 
 from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula
 from openpyxl.cell.rich_text import CellRichText
 
+def _shared_string(wb, value):
+    """
+    Index of a string in the workbook's shared string table or None if it
+    should be written inline. The limit is the size of the encoded strings
+    in the table.
+    """
+    if not wb.use_shared_strings or not isinstance(value, str) or not value:
+        return
+    strings = wb.shared_strings
+    limit = wb.shared_strings_limit
+    if limit is not None and value not in strings:
+        size = wb._shared_strings_size + len(value.encode("utf-8"))
+        if size > limit:
+            return
+        wb._shared_strings_size = size
+    return strings.add(value)
+
+
 def _set_attributes(cell, styled=None):
     """
     Set coordinate and datatype
@@ -18,13 +37,17 @@ def _set_attributes(cell, styled=None):
     if styled:
         attrs['s'] = f"{cell.style_id}"
 
+    value = cell._value
+
     if cell.data_type == "s":
         attrs['t'] = "inlineStr"
+        idx = _shared_string(cell.parent.parent, value)
+        if idx is not None:
+            attrs['t'] = "s"
+            value = idx
     elif cell.data_type != 'f':
         attrs['t'] = cell.data_type
 
-    value = cell._value
-
     if cell.data_type == "d":
         if hasattr(value, "tzinfo") and value.tzinfo is not None:
             raise TypeError("Excel does not support timezones in datetimes. "
@@ -67,7 +90,7 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             formula.text = value[1:]
             value = None
 
-    if cell.data_type == 's':
+    if attributes.get('t') == "inlineStr":
         if isinstance(value, CellRichText):
             el.append(value.to_tree())
         else:
@@ -110,7 +133,7 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                     xf.write(value[1:])
                     value = None
 
-        if cell.data_type == 's':
+        if attributes.get('t') == "inlineStr":
             if isinstance(value, CellRichText):
                 el = value.to_tree()
                 xf.write(el)
@@ -130,6 +153,54 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                     xf.write(safe_string(value))
 
 
+def _escape(text):
+    """
+    Escape text in the same way as lxml
+    """
+    return (text.replace("&", "&amp;").replace("<", "&lt;")
+            .replace(">", "&gt;").replace("\r", "&#13;"))
+
+
+def raw_content(data_type, value, wb):
+    """
+    Type and content of a cell with a number, boolean or plain string
+    serialised as text, starting after the other attributes
+    """
+    if data_type == "s":
+        idx = _shared_string(wb, value)
+        if idx is not None:
+            return f' t="s"><v>{idx}</v></c>'
+        if not value:
+            return ' t="inlineStr"></c>'
+        space = ""
+        if value != value.strip():
+            space = ' xml:space="preserve"'
+        return f' t="inlineStr"><is><t{space}>{_escape(value)}</t></is></c>'
+
+    if value is None or value == "":
+        return f' t="{data_type}"></c>'
+    return f' t="{data_type}"><v>{safe_string(value)}</v></c>'
+
+
+def raw_write_cell(cell, styled=False):
+    """
+    Serialise cells with numbers, booleans or plain strings as text.
+    Returns None for anything that needs the element-based writer.
+    """
+    data_type = cell.data_type
+    if data_type not in ("n", "b", "s") or cell.hyperlink:
+        return
+
+    value = cell._value
+    if data_type == "s" and not isinstance(value, str):
+        return
+
+    attrs = f'r="{get_column_letter(cell.column)}{cell.row}"'
+    if styled:
+        attrs = f'{attrs} s="{cell.style_id}"'
+    return f'<c {attrs}{raw_content(data_type, value, cell.parent.parent)}'
+
+
 if LXML:
     write_cell = lxml_write_cell
 else:
@@ -282,3 +282,123 @@ def test_rich_text(worksheet, write_cell_implementation):
     xml = out.getvalue()
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+def test_shared_string(worksheet, write_cell_implementation):
+    write_cell = write_cell_implementation
+    ws = worksheet
+    wb = ws.parent
+    wb.use_shared_strings = True
+    wb.shared_strings.add("first")
+    cell = ws['A1']
+    cell.value = "second"
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell)
+
+    expected = """<c t="s" r="A1"><v>1</v></c>"""
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert wb.shared_strings == ["first", "second"]
+
+
+@pytest.mark.parametrize("value, result, attrs",
+                         [
+                             ("known", 0, {'r': 'A1', 't': 's'}),
+                             ("unknown", "unknown", {'r': 'A1', 't': 'inlineStr'}),
+                             ("", "", {'r': 'A1', 't': 'inlineStr'}),
+                         ]
+                         )
+def test_shared_strings_limit(worksheet, value, result, attrs):
+    from .._writer import _set_attributes, _shared_string
+
+    ws = worksheet
+    wb = ws.parent
+    wb.use_shared_strings = True
+    wb.shared_strings_limit = 6
+    _shared_string(wb, "known")
+    cell = ws['A1']
+    cell.value = value
+
+    assert _set_attributes(cell) == (result, attrs)
+    assert wb.shared_strings == ["known"]
+
+
+def test_shared_strings_limit_size(worksheet):
+    from .._writer import _shared_string
+
+    wb = worksheet.parent
+    wb.use_shared_strings = True
+    wb.shared_strings_limit = 10
+    assert _shared_string(wb, "x" * 11) is None
+    assert _shared_string(wb, "abcd") == 0
+    assert _shared_string(wb, "\u00e9" * 3) == 1
+    assert _shared_string(wb, "a") is None
+    assert _shared_string(wb, "abcd") == 0
+    assert wb.shared_strings == ["abcd", "\u00e9" * 3]
+
+
+@pytest.mark.parametrize("value, expected",
+                         [
+                             (1234567890, """<c r="A1" t="n"><v>1234567890</v></c>"""),
+                             (decimal.Decimal('3.14'), """<c r="A1" t="n"><v>3.14</v></c>"""),
+                             (True, """<c r="A1" t="b"><v>1</v></c>"""),
+                             ("Hello", """<c r="A1" t="inlineStr"><is><t>Hello</t></is></c>"""),
+                             ("a & <b>\r", """<c r="A1" t="inlineStr"><is><t xml:space="preserve">a &amp; &lt;b&gt;&#13;</t></is></c>"""),
+                             ("", """<c r="A1" t="inlineStr"></c>"""),
+                             (None, """<c r="A1" t="n"></c>"""),
+                         ])
+def test_raw_write_cell(worksheet, lxml_write_cell, value, expected):
+    from .._writer import raw_write_cell
+
+    ws = worksheet
+    cell = ws['A1']
+    cell.value = value
+
+    assert raw_write_cell(cell, cell.has_style) == expected
+
+    if LXML:
+        out = BytesIO()
+        with xmlfile(out) as xf:
+            lxml_write_cell(xf, ws, cell, cell.has_style)
+        assert out.getvalue().decode("utf-8") == expected
+
+
+def test_raw_write_cell_styled(worksheet):
+    from .._writer import raw_write_cell
+    from openpyxl.styles import Font
+
+    ws = worksheet
+    cell = ws['B2']
+    cell.value = 1
+    cell.font = Font(bold=True)
+
+    assert raw_write_cell(cell, cell.has_style) == """<c r="B2" s="1" t="n"><v>1</v></c>"""
+
+
+@pytest.mark.parametrize("value",
+                         [
+                             "=SUM(1+1)",
+                             datetime.date(2011, 12, 25),
+                             "#N/A",
+                         ])
+def test_raw_write_cell_fallback(worksheet, value):
+    from .._writer import raw_write_cell
+
+    ws = worksheet
+    cell = ws['A1']
+    cell.value = value
+
+    assert raw_write_cell(cell) is None
+
+
+def test_raw_write_cell_hyperlink(worksheet):
+    from .._writer import raw_write_cell
+
+    ws = worksheet
+    cell = ws['A1']
+    cell.hyperlink = "http://example.com"
+
+    assert raw_write_cell(cell) is None
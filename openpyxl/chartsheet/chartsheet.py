@@ -32,6 +32,7 @@ class Chartsheet(_WorkbookChild, Serialisable):
     _rel_type = "chartsheet"
     _path = "/xl/chartsheets/sheet{0}.xml"
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.chartsheet+xml"
+    _raw_drawing = None # drawing kept unchanged when charts are skipped
 
     sheetPr = Typed(expected_type=ChartsheetProperties, allow_none=True)
     sheetViews = Typed(expected_type=ChartsheetViewList)
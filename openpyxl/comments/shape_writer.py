@@ -22,6 +22,23 @@ VML_ROOT = """
  xmlns:x="urn:schemas-microsoft-com:office:excel" />
 """
 
+def remove_comment_shapes(vml):
+    """
+    Remove the shapes of comments from VML. Returns None if there are no
+    other shapes.
+    """
+    root = fromstring(vml)
+    for shape in root.findall("{%s}shape" % vmlns):
+        data = shape.find("{%s}ClientData" % excelns)
+        if data is not None and data.get("ObjectType") == "Note":
+            root.remove(shape)
+
+    layout = ("{%s}shapelayout" % officens, "{%s}shapetype" % vmlns)
+    if all(child.tag in layout for child in root if isinstance(child.tag, str)):
+        return None
+    return tostring(root)
+
+
 class ShapeWriter(object):
     """
     Create VML for comments
@@ -13,6 +13,7 @@ from ..comments import Comment
 from ..comment_sheet import CommentRecord
 from ..shape_writer import (
     ShapeWriter,
+    remove_comment_shapes,
     vmlns,
     excelns,
 )
@@ -47,6 +48,21 @@ def test_merge_comments_vml(datadir):
     assert len(content.findall('{%s}shapetype' % vmlns)) == 2
 
 
+def test_remove_comment_shapes(datadir):
+    datadir.chdir()
+    with open('control+comments.vml', 'rb') as existing:
+        content = fromstring(remove_comment_shapes(existing.read()))
+    types = [shape.find("{%s}ClientData" % excelns).get("ObjectType")
+             for shape in content.findall('{%s}shape' % vmlns)]
+    assert types == ["Button", "Radio"]
+
+
+def test_remove_only_comment_shapes(datadir):
+    datadir.chdir()
+    with open('commentsDrawing1.vml', 'rb') as existing:
+        assert remove_comment_shapes(existing.read()) is None
+
+
 def test_write_comments_vml(datadir):
     datadir.chdir()
     cw = ShapeWriter(create_comments())
@@ -12,7 +12,7 @@ from openpyxl.descriptors.serialisable import Serialisable
 
 from .rule import Rule
 
-from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange, RangeIndex
 
 class ConditionalFormatting(Serialisable):
 
@@ -59,6 +59,42 @@ class ConditionalFormattingList(object):
     def __init__(self):
         self._cf_rules = OrderedDict()
         self.max_priority = 0
+        self._index = None
+        self._indexed = None
+
+
+    def _get_index(self):
+        """
+        Index of the formats by their ranges. Formats are keyed by their
+        ranges, so changing the ranges means replacing the rules, as moving
+        cells does, which rebuilds the index.
+        """
+        if (self._index is None
+            or self._indexed is not self._cf_rules):
+            items = []
+            for cf in self._cf_rules:
+                items.extend((r.bounds, cf) for r in cf.sqref)
+            self._index = RangeIndex(items)
+            self._indexed = self._cf_rules
+        return self._index
+
+
+    def intersecting(self, coord):
+        """
+        Return the formats which apply to any cells of a cell or range
+        """
+        if isinstance(coord, str):
+            coord = CellRange(coord)
+        return self._get_index().intersecting(coord.bounds)
+
+
+    def containing(self, coord):
+        """
+        Return the formats which apply to a cell or every cell of a range
+        """
+        if isinstance(coord, str):
+            coord = CellRange(coord)
+        return [cf for cf in self.intersecting(coord) if coord in cf]
 
 
     def add(self, range_string, cfRule):
@@ -76,7 +112,14 @@ class ConditionalFormattingList(object):
         if not rule.priority:
             rule.priority = self.max_priority
 
-        self._cf_rules.setdefault(cf, []).append(rule)
+        if cf in self._cf_rules:
+            self._cf_rules[cf].append(rule)
+            return
+
+        index = self._get_index()
+        for r in cf.sqref:
+            index.add(r.bounds, cf)
+        self._cf_rules[cf] = [rule]
 
 
     def __bool__(self):
@@ -105,6 +148,7 @@ class ConditionalFormattingList(object):
     def __delitem__(self, key):
         key = ConditionalFormatting(sqref=key)
         del self._cf_rules[key]
+        self._index = None
 
 
     def __setitem__(self, key, rule):
@@ -200,3 +200,28 @@ class TestConditionalFormatting:
     def test_contains(self, ConditionalFormatting):
         c2 = ConditionalFormatting("A1:A5 B1:B5")
         assert "B2" in c2
+
+
+class TestConditionalFormattingList:
+
+    def test_containing(self):
+        cfs = ConditionalFormattingList()
+        rule = CellIsRule(operator="equal", formula=["1"])
+        cfs.add("A1:A10 C1:C10", rule)
+        cfs.add("B5:D6", rule)
+        assert [str(cf.sqref) for cf in cfs.containing("C5")] == ["A1:A10 C1:C10", "B5:D6"]
+        assert [str(cf.sqref) for cf in cfs.containing("B2")] == []
+        assert [str(cf.sqref) for cf in cfs.intersecting("A5:B5")] == ["A1:A10 C1:C10", "B5:D6"]
+        del cfs["A1:A10 C1:C10"]
+        assert [str(cf.sqref) for cf in cfs.containing("C5")] == ["B5:D6"]
+
+
+    def test_containing_after_insert(self):
+        from openpyxl import Workbook
+        ws = Workbook().active
+        rule = CellIsRule(operator="equal", formula=["1"])
+        ws.conditional_formatting.add("A1:A10", rule)
+        assert len(ws.conditional_formatting.containing("A5")) == 1
+        ws.insert_cols(1)
+        assert ws.conditional_formatting.containing("A5") == []
+        assert [str(cf.sqref) for cf in ws.conditional_formatting.containing("B5")] == ["B1:B10"]
@@ -172,3 +172,34 @@ def get_rel(archive, deps, id=None, cls=None):
         obj.deps = []
 
     return obj
+
+
+class RawPart:
+    """
+    A part and the parts it depends upon, read without being parsed so that
+    they can be written unchanged
+    """
+
+    def __init__(self, path, parts):
+        self.path = path
+        self.parts = parts # path: (contents, content type, relationships)
+
+
+    @classmethod
+    def from_archive(cls, archive, path, types):
+        """
+        Read a part and its dependencies. Content types are looked up by part name.
+        """
+        parts = {}
+        todo = [path]
+        while todo:
+            name = todo.pop()
+            if name in parts or name not in archive.NameToInfo:
+                continue
+            rels = RelationshipList()
+            rels_path = get_rels_path(name)
+            if rels_path in archive.NameToInfo:
+                rels = get_dependents(archive, rels_path)
+                todo.extend(r.target for r in rels if r.TargetMode != "External")
+            parts[name] = archive.read(name), types.get("/" + name), rels
+        return cls(path, parts)
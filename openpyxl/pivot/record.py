@@ -1,5 +1,9 @@
 # Copyright (c) 2010-2024 openpyxl
 
+from shutil import copyfileobj
+from tempfile import SpooledTemporaryFile
+from zipfile import ZIP64_LIMIT
+
 from openpyxl.descriptors.serialisable import Serialisable
 from openpyxl.descriptors import (
     Typed,
@@ -16,8 +20,9 @@ from openpyxl.descriptors.nested import (
     NestedBool,
 )
 
+from openpyxl.utils.datetime import from_ISO8601
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import tostring, fromstring, get_iterparse
 
 from .fields import (
     Boolean,
@@ -109,3 +114,165 @@ class RecordList(Serialisable):
 
     def _write_rels(self, archive, manifest):
         pass
+
+
+RECORD_TAG = "{%s}r" % SHEET_MAIN_NS
+
+
+def _shared_values(field):
+    """
+    Values of the shared items of a cache field
+    """
+    if field.sharedItems is None:
+        return []
+    return [getattr(item, "v", None) for item in field.sharedItems._fields]
+
+
+def _decode(tag, value, shared):
+    """
+    Convert a value from a record in the source.
+    Indices are returned unchanged if there are no shared items.
+    """
+    if tag == "x":
+        if not shared:
+            return int(value)
+        return shared[int(value)]
+    elif tag == "n":
+        return float(value)
+    elif tag == "b":
+        return value in ("1", "true")
+    elif tag == "d":
+        return from_ISO8601(value)
+    elif tag == "m":
+        return None
+    return value
+
+
+class LazyRecordList:
+
+    """
+    Pivot cache records which are only parsed when they are used.
+
+    Records can be read as a stream of tuples with `iter_rows()` without
+    parsing them. Records which have not been parsed are saved unchanged.
+    """
+
+    mime_type = RecordList.mime_type
+    rel_type = RecordList.rel_type
+    _id = 1
+    _path = RecordList._path
+    # everything else belongs to the records
+    _own = ("_records", "_source", "_id", "cache", "_member", "_copy")
+    _copy = None # copies the member from the source archive
+
+    def __init__(self, src, cache=None, member=None):
+        self._records = None
+        self.cache = cache
+        self._member = member # name in the source archive
+        self._source = SpooledTemporaryFile(max_size=2**20)
+        copyfileobj(src, self._source)
+
+
+    @property
+    def parsed(self):
+        return self._records is not None
+
+
+    def _parse(self):
+        if self._records is None:
+            self._source.seek(0)
+            self._records = RecordList.from_tree(fromstring(self._source.read()))
+        return self._records
+
+
+    def __getattr__(self, name):
+        # anything else requires the records
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._parse(), name)
+
+
+    def __setattr__(self, name, value):
+        if name in self._own:
+            super().__setattr__(name, value)
+        else:
+            setattr(self._parse(), name, value)
+
+
+    def iter_rows(self):
+        """
+        Produce the values of the records with indices resolved against the
+        shared items of the cache fields.
+
+        With a cache there is a value for each cache field. Records have no
+        values for calculated fields so these are None.
+        """
+        if self.cache is None:
+            for record in self._iter_fields():
+                yield tuple(_decode(tag, value, None) for tag, value in record)
+            return
+
+        shared = [_shared_values(field) for field in self.cache.cacheFields]
+        # records only have values for fields from the source
+        stored = [idx for idx, field in enumerate(self.cache.cacheFields)
+                  if field.databaseField is not False]
+        for record in self._iter_fields():
+            row = [None] * len(shared)
+            for idx, (tag, value) in zip(stored, record):
+                row[idx] = _decode(tag, value, shared[idx])
+            yield tuple(row)
+
+
+    def _iter_fields(self):
+        """
+        Produce the tags and values of the fields of each record. Only
+        indices are left to be decoded if the records have been parsed.
+        """
+        if self._records is not None:
+            for record in self._records.r:
+                yield [("x", field.v) if isinstance(field, Index)
+                       else (None, getattr(field, "v", None))
+                       for field in record._fields]
+            return
+
+        self._source.seek(0)
+        iterparse = get_iterparse()
+        ns = len(SHEET_MAIN_NS) + 2
+        for _, element in iterparse(self._source, tag=RECORD_TAG):
+            yield [(child.tag[ns:], child.get("v")) for child in element]
+            element.clear()
+
+
+    @property
+    def path(self):
+        return self._path.format(self._id)
+
+
+    def _write(self, archive, manifest):
+        """
+        Write to zipfile and update manifest
+        """
+        if self._records is not None:
+            self._records._id = self._id
+            self._records._write(archive, manifest)
+            return
+
+        if self._copy is not None:
+            self._copy(self._member, self.path[1:])
+        else:
+            large = self._source.seek(0, 2) > ZIP64_LIMIT
+            self._source.seek(0)
+            with archive.open(self.path[1:], "w", force_zip64=large) as dst:
+                copyfileobj(self._source, dst)
+        manifest.append(self)
+
+
+    def _write_rels(self, archive, manifest):
+        pass
+
+
+    def close(self):
+        """
+        Remove the source of the records
+        """
+        self._source.close()
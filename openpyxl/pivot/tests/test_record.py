@@ -110,3 +110,90 @@ class TestRecordList:
 
         assert archive.namelist() == [records.path[1:]]
         assert manifest.find(records.mime_type)
+
+
+@pytest.fixture
+def LazyRecordList(datadir):
+    from ..record import LazyRecordList
+    from ..cache import CacheDefinition
+    datadir.chdir()
+    with open("pivotCacheDefinition.xml", "rb") as src:
+        cache = CacheDefinition.from_tree(fromstring(src.read()))
+    with open("pivotCacheRecords.xml", "rb") as src:
+        return LazyRecordList(src, cache)
+
+
+class TestLazyRecordList:
+
+    def test_iter_rows(self, LazyRecordList):
+        records = LazyRecordList
+        rows = list(records.iter_rows())
+        assert len(rows) == 17
+        assert rows[0] == (1, 'Stanford', '2014-03-24', 10, 25, 'Jack')
+        assert not records.parsed
+
+
+    def test_parse(self, LazyRecordList):
+        records = LazyRecordList
+        expected = list(records.iter_rows())
+        assert records.count == 17
+        assert records.parsed
+        assert list(records.iter_rows()) == expected
+
+
+    def test_write_unchanged(self, LazyRecordList):
+        records = LazyRecordList
+        out = BytesIO()
+        archive = ZipFile(out, mode="w")
+        manifest = Manifest()
+        records._id = 2
+        records._write(archive, manifest)
+
+        with open("pivotCacheRecords.xml", "rb") as src:
+            assert archive.read("xl/pivotCache/pivotCacheRecords2.xml") == src.read()
+        assert manifest.find(records.mime_type).PartName == "/xl/pivotCache/pivotCacheRecords2.xml"
+
+
+    def test_write_parsed(self, LazyRecordList):
+        records = LazyRecordList
+        records.r = records.r[:2]
+        out = BytesIO()
+        archive = ZipFile(out, mode="w")
+        records._write(archive, Manifest())
+
+        xml = fromstring(archive.read(records.path[1:]))
+        assert xml.get("count") == "2"
+
+
+    def test_calculated_field(self, datadir):
+        from ..record import LazyRecordList
+        from ..cache import CacheDefinition, CacheField
+        datadir.chdir()
+        with open("pivotCacheDefinition.xml", "rb") as src:
+            cache = CacheDefinition.from_tree(fromstring(src.read()))
+        calculated = CacheField(name="double", formula="impressions*2", databaseField=False)
+        cache.cacheFields.insert(3, calculated)
+        with open("pivotCacheRecords.xml", "rb") as src:
+            records = LazyRecordList(src, cache)
+        rows = list(records.iter_rows())
+        assert rows[0] == (1, 'Stanford', '2014-03-24', None, 10, 25, 'Jack')
+        records._parse()
+        assert list(records.iter_rows()) == rows
+
+
+    def test_without_cache(self, datadir):
+        from ..record import LazyRecordList
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            records = LazyRecordList(src)
+        rows = list(records.iter_rows())
+        assert rows[0] == (1, 0, '2014-03-24', 0, 25, 0)
+        assert list(records.iter_rows()) == rows
+        records._parse()
+        assert list(records.iter_rows()) == rows
+
+
+    def test_close(self, LazyRecordList):
+        records = LazyRecordList
+        records.close()
+        assert records._source.closed
@@ -11,11 +11,13 @@ from openpyxl.chart.chartspace import ChartSpace
 from openpyxl.chart.reader import read_chart
 
 
-def find_images(archive, path):
+def find_images(archive, path, read_charts=True, read_images=True):
     """
     Given the path to a drawing file extract charts and images and supported shapes
 
     Ignore errors due to unsupported parts of DrawingML
+
+    Reading charts or images can be disabled.
     """
 
     charts = []
@@ -45,7 +47,7 @@ def find_images(archive, path):
             link.mode = deps.get(link.id).TargetMode
             link.id = None
 
-    for rel in drawing._chart_rels:
+    for rel in drawing._chart_rels if read_charts else ():
         try:
             cs = get_rel(archive, deps, rel.id, ChartSpace)
         except TypeError as e:
@@ -57,7 +59,7 @@ def find_images(archive, path):
             chart.hidden = True
         charts.append(chart)
 
-    if not PILImage: # Pillow not installed, drop images
+    if not PILImage or not read_images: # Pillow not installed, drop images
         return charts, images, shapes
 
     for blip in drawing._blip_rels:
@@ -4,6 +4,8 @@
 """Read an xlsx file into Python"""
 
 # Python stdlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from zipfile import (
     ZipFile,
 
@@ -37,8 +39,9 @@ from openpyxl.xml.constants import (
 )
 from openpyxl.cell import MergedCell
 from openpyxl.comments.comment_sheet import CommentSheet
+from openpyxl.comments.shape_writer import remove_comment_shapes
 
-from .strings import read_string_table, read_rich_text
+from .strings import read_string_table, read_rich_text, LazyStringTable
 from .workbook import WorkbookParser
 from openpyxl.styles.stylesheet import apply_stylesheet
 
@@ -47,16 +50,20 @@ from openpyxl.packaging.custom import CustomPropertyList
 from openpyxl.packaging.manifest import Manifest, Override
 
 from openpyxl.packaging.relationship import (
+    RawPart,
     RelationshipList,
     get_dependents,
     get_rels_path,
 )
 
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
-from openpyxl.worksheet._reader import WorksheetReader
+from openpyxl.worksheet._lazy import LazyWorksheet
+from openpyxl.writer._zip import fingerprint
+from openpyxl.worksheet._reader import WorksheetReader, WorkSheetParser
 from openpyxl.chartsheet import Chartsheet
 from openpyxl.worksheet.table import Table
 from openpyxl.worksheet.controls import (
+    ControlList,
     FormControl,
     ActiveXControl
 )
@@ -66,13 +73,16 @@ from openpyxl.drawing.image import Image
 
 from openpyxl.volatile.volatile_deps import VolTypesList
 
-from openpyxl.xml.functions import fromstring
+from openpyxl.xml.functions import fromstring, get_iterparse
 
 from .drawings import find_images
 
 
 SUPPORTED_FORMATS = ('.xlsx', '.xlsm', '.xltx', '.xltm')
 
+# parts which need not be read
+SKIPPABLE = frozenset(["charts", "images", "comments", "pivots", "controls", "external_links"])
+
 
 def _validate_archive(filename):
     """
@@ -123,6 +133,50 @@ def _find_workbook_part(package):
     raise IOError("File contains no valid workbook part")
 
 
+# state of worker processes used to parse worksheets in parallel
+_worker = {}
+
+
+def _init_worker(filename, shared_strings, data_only, epoch, date_formats,
+                 timedelta_formats, rich_text, engine, strings_path=None):
+    """
+    Each process opens the archive independently.
+    Lazy shared strings are indexed by each process.
+    """
+    _worker['archive'] = ZipFile(filename, 'r')
+    if strings_path is not None:
+        with _worker['archive'].open(strings_path) as src:
+            shared_strings = LazyStringTable(src, rich_text)
+    _worker['options'] = dict(
+        shared_strings=shared_strings,
+        data_only=data_only,
+        epoch=epoch,
+        date_formats=date_formats,
+        timedelta_formats=timedelta_formats,
+        rich_text=rich_text,
+        engine=engine,
+    )
+
+
+def _parse_worksheet(path):
+    """
+    Parse a worksheet in a worker process.
+    Returns the parser, so that it can be bound in the main process, the rows
+    and any warnings raised.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with _worker['archive'].open(path) as src:
+            parser = WorkSheetParser(src, **_worker['options'])
+            rows = list(parser.parse())
+
+    # drop anything that cannot or should not be sent back
+    parser.source = None
+    parser.shared_strings = None
+    parser.shared_formulae = {}
+    return parser, rows, [(str(w.message), w.category) for w in caught]
+
+
 class ExcelReader:
 
     """
@@ -130,15 +184,35 @@ class ExcelReader:
     """
 
     def __init__(self, fn, read_only=False, keep_vba=KEEP_VBA,
-                 data_only=False, keep_links=True, rich_text=False):
+                 data_only=False, keep_links=True, rich_text=False, workers=None,
+                 engine=None, lazy_strings=False, lazy=False, sheets=None, skip=(),
+                 compact_cells=False):
+        skip = frozenset(skip)
+        if not skip <= SKIPPABLE:
+            raise ValueError(f"Unable to skip {', '.join(sorted(skip - SKIPPABLE))}. "
+                             f"Parts that can be skipped are: {', '.join(sorted(SKIPPABLE))}")
         self.archive = _validate_archive(fn)
+        self.filename = None
+        if not hasattr(fn, 'read'):
+            self.filename = fn
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
         self.keep_vba = keep_vba
         self.data_only = data_only
-        self.keep_links = keep_links
+        self.keep_links = keep_links and "external_links" not in skip
         self.rich_text = rich_text
+        self.workers = workers
+        get_iterparse(engine) # fail early for unknown engines
+        self.engine = engine
+        self.lazy_strings = lazy_strings
+        self.lazy = lazy and not read_only
+        self.sheets = sheets
+        if sheets is not None:
+            self.sheets = set(sheets)
+        self.skip = skip
+        self.compact_cells = compact_cells
         self.shared_strings = []
+        self.strings_path = None
         self.volatile_deps = None
 
 
@@ -146,6 +220,7 @@ class ExcelReader:
         src = self.archive.read(ARC_CONTENT_TYPES)
         root = fromstring(src)
         self.package = Manifest.from_tree(root)
+        self.content_types = {ct.PartName: ct.ContentType for ct in self.package.Override}
 
 
     def read_strings(self):
@@ -156,7 +231,11 @@ class ExcelReader:
         if ct is not None:
             strings_path = ct.PartName[1:]
             with self.archive.open(strings_path,) as src:
-                self.shared_strings = reader(src)
+                if self.lazy_strings:
+                    self.shared_strings = LazyStringTable(src, self.rich_text)
+                    self.strings_path = strings_path
+                else:
+                    self.shared_strings = reader(src, self.engine)
 
 
     def read_workbook(self):
@@ -167,14 +246,18 @@ class ExcelReader:
         wb._sheets = []
         wb._data_only = self.data_only
         wb._read_only = self.read_only
+        wb.compact_cells = self.compact_cells
         wb.template = wb_part.ContentType in (XLTX, XLTM)
 
         if "xl/vbaProject.bin" in self.archive.namelist():
             # might also want to search the manifest by content type
             wb._vba = self.archive.read("xl/vbaProject.bin")
 
-        if self.read_only:
+        if self.read_only or self.deferred:
             wb._archive = self.archive
+        if self.filename is not None and not self.read_only:
+            # unchanged parts can be copied from the source if it is unchanged
+            wb._source = self.filename, fingerprint(self.archive)
 
         self.wb = wb
 
@@ -199,7 +282,7 @@ class ExcelReader:
     def read_chartsheet(self, sheet, rel):
         sheet_path = rel.target
         rels_path = get_rels_path(sheet_path)
-        rels = []
+        rels = RelationshipList()
         if rels_path in self.valid_files:
             rels = get_dependents(self.archive, rels_path)
 
@@ -212,15 +295,98 @@ class ExcelReader:
         self.wb._add_sheet(cs)
 
         drawings = rels.find(SpreadsheetDrawing._rel_type)
+        if "charts" in self.skip:
+            # a chartsheet must have a drawing so keep it as it is
+            for rel in drawings:
+                cs._raw_drawing = RawPart.from_archive(self.archive, rel.target,
+                                                       self.content_types)
+            return
         for rel in drawings:
-            charts, images, shapes = find_images(self.archive, rel.target)
+            charts, images, shapes = find_images(self.archive, rel.target, read_images=False)
             for c in charts:
                 cs.add_chart(c)
 
 
+    @property
+    def deferred(self):
+        """
+        Whether some worksheets may only be read when they are used
+        """
+        return not self.read_only and (self.lazy or self.sheets is not None)
+
+
+    def _defer(self, sheet):
+        return self.lazy or (self.sheets is not None and sheet.name not in self.sheets)
+
+
+    def create_pool(self, size):
+        """
+        Create a pool of processes which can parse worksheets
+        """
+        wb = self.wb
+        strings = self.shared_strings
+        if self.strings_path is not None:
+            strings = None
+        return ProcessPoolExecutor(
+            max_workers=min(self.workers, size),
+            initializer=_init_worker,
+            initargs=(self.filename, strings, self.data_only,
+                      wb.epoch, wb._date_formats, wb._timedelta_formats,
+                      self.rich_text, self.engine, self.strings_path)
+        )
+
+
+    def parse_worksheets(self, sheets, pool):
+        """
+        Submit worksheets to be parsed by a pool of processes.
+        Returns futures by worksheet path.
+        """
+        futures = {}
+        for sheet, rel in sheets:
+            if self._defer(sheet):
+                continue
+            if rel.target in self.valid_files and "chartsheet" not in rel.Type:
+                futures[rel.target] = pool.submit(_parse_worksheet, rel.target)
+        return futures
+
+
+    def _use_workers(self, sheets):
+        """
+        Parsing in parallel is only possible if the source can be reopened
+        """
+        return (not self.read_only
+                and not self.lazy
+                and self.filename is not None
+                and self.workers is not None
+                and self.workers > 1
+                and len(sheets) > 1)
+
+
     def read_worksheets(self):
 
-        for sheet, rel in self.parser.find_sheets():
+        sheets = list(self.parser.find_sheets())
+        if self.sheets is not None:
+            missing = self.sheets - {sheet.name for sheet, rel in sheets}
+            if missing:
+                raise KeyError(f"Worksheet {', '.join(sorted(missing))} does not exist.")
+        parsed = {}
+        pool = None
+        if self._use_workers(sheets):
+            pool = self.create_pool(len(sheets))
+            parsed = self.parse_worksheets(sheets, pool)
+
+        try:
+            self._read_worksheets(sheets, parsed)
+        finally:
+            if pool is not None:
+                for future in parsed.values():
+                    future.cancel()
+                pool.shutdown()
+
+
+    def _read_worksheets(self, sheets, parsed):
+
+        for sheet, rel in sheets:
             if rel.target not in self.valid_files:
                 continue
 
@@ -229,33 +395,68 @@ class ExcelReader:
                 continue
 
             if self.read_only:
-                ws = ReadOnlyWorksheet(self.wb, sheet.name, rel.target, self.shared_strings)
+                ws = ReadOnlyWorksheet(self.wb, sheet.name, rel.target, self.shared_strings, self.engine)
                 ws.sheet_state = sheet.state
                 self.wb._sheets.append(ws)
                 continue
 
-            fh = self.archive.open(rel.target)
-            ws = self.wb.create_sheet(sheet.name)
-
-            processor = WorksheetProcessor(ws, self.archive)
-            processor.find_children((rel.target))
-            ws._rels = processor.rels
+            if self._defer(sheet):
+                ws = LazyWorksheet(self.wb, sheet.name, rel.target, self.bind_worksheet)
+                processor = WorksheetProcessor(ws, self.archive)
+                processor.find_children(rel.target)
+                ws._rels = processor.rels
+                ws.sheet_state = sheet.state
+                self.wb._add_sheet(ws)
+                continue
 
-            ws_parser = WorksheetReader(ws, fh, self.shared_strings, self.data_only, self.rich_text)
-            ws_parser.bind_all()
+            if self.filename is not None:
+                # changes are recorded so that unchanged worksheets can be copied
+                loader = partial(self.bind_worksheet, parsed=parsed.get(rel.target))
+                ws = LazyWorksheet(self.wb, sheet.name, rel.target, loader)
+                self.wb._add_sheet(ws)
+                ws._load()
+            else:
+                ws = self.wb.create_sheet(sheet.name)
+                self.bind_worksheet(ws, rel.target, parsed.get(rel.target))
             ws.sheet_state = sheet.state
 
-            processor.get_comments()
+
+    def bind_worksheet(self, ws, path, parsed=None):
+        """
+        Read the contents of a worksheet and its related parts
+        """
+        processor = WorksheetProcessor(ws, self.archive, self.skip, self.content_types)
+        processor.find_children(path)
+        ws._rels = processor.rels
+
+        rows = None
+        if parsed is not None:
+            parser, rows, caught = parsed.result()
+            for msg, category in caught:
+                warnings.warn(msg, category)
+            ws_parser = WorksheetReader(ws, None, self.shared_strings, self.data_only, self.rich_text, self.engine)
+            ws_parser.parser = parser
+        else:
+            fh = self.archive.open(path)
+            ws_parser = WorksheetReader(ws, fh, self.shared_strings, self.data_only, self.rich_text, self.engine)
+        ws_parser.bind_all(rows)
+
+        processor.get_comments()
+        if processor.rels.pivotTable and "pivots" not in self.skip:
             processor.get_pivots(self.parser.pivot_caches)
-            processor.get_drawings()
-            processor.get_activex()
-            processor.get_controls()
-            processor.get_legacy()
-
-            for t in ws_parser.tables:
-                src = self.archive.read(t)
-                xml = fromstring(src)
-                table = Table.from_tree(xml)
+        processor.get_drawings()
+        processor.get_activex()
+        processor.get_controls()
+        processor.get_legacy()
+
+        for t in ws_parser.tables:
+            src = self.archive.read(t)
+            xml = fromstring(src)
+            table = Table.from_tree(xml)
+            if self.deferred:
+                # other worksheets may not have been loaded
+                ws._tables.add(table)
+            else:
                 ws.add_table(table)
 
 
@@ -288,8 +489,13 @@ class ExcelReader:
             self.parser.assign_names()
             action = "read volatile deps"
             self.read_volatile_deps()
-            if not self.read_only:
+            if not (self.read_only or self.deferred):
                 self.archive.close()
+                if self.strings_path is not None:
+                    self.shared_strings.close()
+            elif self.strings_path is not None:
+                # the strings are still needed and closed with the workbook
+                self.wb._string_table = self.shared_strings
         except ValueError as e:
             raise ValueError(
                 f"Unable to read workbook: could not {action} from {self.archive.filename}.\n"
@@ -304,9 +510,11 @@ class WorksheetProcessor:
     Collect and assign child objects
     """
 
-    def __init__(self, ws, archive):
+    def __init__(self, ws, archive, skip=(), content_types=None):
         self.ws = ws
         self.archive = archive
+        self.skip = frozenset(skip)
+        self.content_types = content_types or {}
 
 
     def find_children(self, path):
@@ -333,9 +541,19 @@ class WorksheetProcessor:
         if self.ws.legacy_drawing is None:
             return
 
+        if {"comments", "controls"} <= self.skip:
+            # nothing else is stored in VML
+            self.ws.legacy_drawing = None
+            return
+
         rel = self.rels.get(self.ws.legacy_drawing)
         vml = self.archive.read(rel.target)
         vml = vml.replace(b"<br>", b"<br/>")
+        if "comments" in self.skip:
+            vml = remove_comment_shapes(vml)
+            if vml is None:
+                self.ws.legacy_drawing = None
+                return
         drawing = LegacyDrawing(vml)
         self.ws.legacy_drawing = drawing
         rels_path = get_rels_path(rel.target)
@@ -363,6 +581,9 @@ class WorksheetProcessor:
     def get_comments(self):
         """Assign comments"""
 
+        if "comments" in self.skip:
+            return
+
         comment_warning = """Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."""
 
         for rel in self.rels.comments:
@@ -379,8 +600,21 @@ class WorksheetProcessor:
 
 
     def get_drawings(self):
+        """
+        Drawings from which nothing is read because charts or images are
+        skipped are kept as they are.
+        """
+        read_charts = "charts" not in self.skip
+        read_images = "images" not in self.skip
+
         for rel in self.rels.drawing:
-            charts, images, shapes = find_images(self.archive, rel.target)
+            charts = images = shapes = ()
+            if read_charts or read_images:
+                charts, images, shapes = find_images(self.archive, rel.target, read_charts, read_images)
+            if not (charts or images or shapes) and not (read_charts and read_images):
+                self.ws._raw_drawing = RawPart.from_archive(self.archive, rel.target,
+                                                            self.content_types)
+                continue
             for c in charts:
                 self.ws.add_chart(c, c.anchor)
             for im in images:
@@ -403,6 +637,10 @@ class WorksheetProcessor:
         """
         Get related objects for ctrlProps
         """
+        if "controls" in self.skip:
+            self.ws.controls = ControlList()
+            return
+
         ctrlProps = {}
 
         for rel in self.rels.ctrlProp:
@@ -424,6 +662,9 @@ class WorksheetProcessor:
         """
         Get related objects for ActiveX Controls
         """
+        if "controls" in self.skip:
+            return
+
         active = {}
 
         for rel in self.rels.control:
@@ -453,7 +694,9 @@ class WorksheetProcessor:
 
 
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=False, rich_text=False):
+                  data_only=False, keep_links=False, rich_text=False,
+                  workers=None, engine=None, lazy_strings=False, lazy=False,
+                  sheets=None, skip=(), compact_cells=False):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -474,6 +717,27 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param rich_text: if set to True openpyxl will preserve any rich text formatting in cells. The default is False
     :type rich_text: bool
 
+    :param workers: number of processes used to parse worksheets in parallel. Only used when opening a file by name and not in read-only mode. The default is None
+    :type workers: int
+
+    :param engine: XML parser for worksheets and shared strings, either "stdlib" or "lxml". The default is "stdlib" and can be set with the OPENPYXL_PARSER environment variable
+    :type engine: string
+
+    :param lazy_strings: only decode shared strings when they are used. This reduces memory use for workbooks with very many strings at the cost of a temporary file. The default is False
+    :type lazy_strings: bool
+
+    :param lazy: only read worksheets when they are used. Worksheets which are never changed are saved unchanged if possible. The source must remain available until the workbook is closed. The default is False
+    :type lazy: bool
+
+    :param sheets: names of the worksheets to read. Other worksheets are treated as if `lazy` were set. Has no effect in read-only mode. The default is None
+    :type sheets: list
+
+    :param skip: parts of the workbook not to read: "charts", "images", "comments", "pivots", "controls" or "external_links". Drawings which only contain skipped charts or images are kept unchanged, other skipped parts will be lost when the workbook is saved. The default is to read all parts
+    :type skip: tuple
+
+    :param compact_cells: keep the contents of worksheets in arrays rather than as cell objects. This uses much less memory for large worksheets but accessing cells is slower. The default is False
+    :type compact_cells: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -483,6 +747,7 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
 
     """
     reader = ExcelReader(filename, read_only, keep_vba,
-                         data_only, keep_links, rich_text)
+                         data_only, keep_links, rich_text, workers, engine,
+                         lazy_strings, lazy, sheets, skip, compact_cells)
     reader.read()
     return reader.wb
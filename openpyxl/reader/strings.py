@@ -1,22 +1,44 @@
 # Copyright (c) 2010-2024 openpyxl
 
+from array import array
+from functools import lru_cache
+import mmap
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from xml.parsers import expat
+from xml.sax.saxutils import quoteattr
+
 from openpyxl.cell.text import Text
 
-from openpyxl.xml.functions import iterparse
+from openpyxl.xml.functions import get_iterparse, fromstring
 from openpyxl.xml.constants import SHEET_MAIN_NS
 from openpyxl.cell.rich_text import CellRichText
 
 
-def read_string_table(xml_source):
+def _string_from_tree(node):
+    text = Text.from_tree(node).content
+    return text.replace('x005F_', '')
+
+
+def _rich_text_from_tree(node):
+    text = CellRichText.from_tree(node)
+    if len(text) == 0:
+        text = ''
+    elif len(text) == 1 and isinstance(text[0], str):
+        text = text[0]
+    return text
+
+
+def read_string_table(xml_source, engine=None):
     """Read in all shared strings in the table"""
 
     strings = []
     STRING_TAG = '{%s}si' % SHEET_MAIN_NS
+    iterparse = get_iterparse(engine)
 
-    for _, node in iterparse(xml_source):
+    for _, node in iterparse(xml_source, tag=STRING_TAG):
         if node.tag == STRING_TAG:
-            text = Text.from_tree(node).content
-            text = text.replace('x005F_', '')
+            text = _string_from_tree(node)
             node.clear()
 
             strings.append(text)
@@ -24,21 +46,154 @@ def read_string_table(xml_source):
     return strings
 
 
-def read_rich_text(xml_source):
+def read_rich_text(xml_source, engine=None):
     """Read in all shared strings in the table"""
 
     strings = []
     STRING_TAG = '{%s}si' % SHEET_MAIN_NS
+    iterparse = get_iterparse(engine)
 
-    for _, node in iterparse(xml_source):
+    for _, node in iterparse(xml_source, tag=STRING_TAG):
         if node.tag == STRING_TAG:
-            text = CellRichText.from_tree(node)
-            if len(text) == 0:
-                text = ''
-            elif len(text) == 1 and isinstance(text[0], str):
-                text = text[0]
+            text = _rich_text_from_tree(node)
             node.clear()
 
             strings.append(text)
 
     return strings
+
+
+# size of the blocks in which the source is indexed
+BLOCK_SIZE = 2**20
+
+
+class LazyStringTable:
+
+    """
+    Shared strings which are only decoded when they are looked up.
+
+    The decompressed source is spilled to a temporary file which is memory
+    mapped and a single pass records where each string is. Decoded strings
+    are kept in a bounded cache.
+    """
+
+    cache_size = 2**16
+
+    def __init__(self, xml_source, rich_text=False, cache_size=None):
+        self._file = TemporaryFile()
+        copyfileobj(xml_source, self._file)
+        self._file.flush()
+        self._data = b""
+        if self._file.tell():
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._decode_node = rich_text and _rich_text_from_tree or _string_from_tree
+        self._starts = array("Q")
+        self._sizes = array("I")
+        self._index()
+
+        if cache_size is None:
+            cache_size = self.cache_size
+        self._cached = lru_cache(maxsize=cache_size)(self._decode)
+
+
+    def _index(self):
+        """
+        Find the root element and the position of every string.
+        The source is parsed without building any elements and the parser
+        reports the offset of each tag.
+        """
+        data = self._data
+        parser = expat.ParserCreate()
+        starts = self._starts
+        sizes = self._sizes
+        decl = []
+        root = []
+        depth = 0
+        start = 0
+
+        def declaration(version, encoding, standalone):
+            decl.append(encoding)
+
+        def forbid(*args):
+            raise ValueError("Shared strings must not declare entities")
+
+        def start_element(name, attrs):
+            nonlocal depth, start
+            if depth == 0:
+                root.append(name)
+                root.extend(attrs.items())
+            elif depth == 1:
+                start = parser.CurrentByteIndex
+            depth += 1
+
+        def end_element(name):
+            nonlocal depth
+            depth -= 1
+            if depth != 1:
+                return
+            pos = parser.CurrentByteIndex
+            end_tag = b"</" + name.encode()
+            starts.append(start)
+            if data[pos:pos + len(end_tag)] == end_tag:
+                sizes.append(data.find(b">", pos) + 1 - start)
+            else: # empty element
+                sizes.append(0)
+
+        parser.XmlDeclHandler = declaration
+        parser.EntityDeclHandler = forbid
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        try:
+            for pos in range(0, len(data), BLOCK_SIZE):
+                parser.Parse(data[pos:pos + BLOCK_SIZE], False)
+            parser.Parse(b"", True)
+        except expat.ExpatError as e:
+            raise ValueError(f"Shared strings cannot be indexed: {e}") from e
+
+        if not root or root[0].rpartition(":")[2] != "sst":
+            raise ValueError("Shared strings do not contain a string table")
+        tag, attrs = root[0], root[1:]
+        prefix = "".join(f" {k}={quoteattr(v)}" for k, v in attrs)
+        prefix = f"<{tag}{prefix}>"
+        encoding = decl and decl[0]
+        if encoding:
+            prefix = f'<?xml version="1.0" encoding="{encoding}"?>{prefix}'
+        self._prefix = prefix.encode(encoding or "utf-8")
+        self._suffix = f"</{tag}>".encode(encoding or "utf-8")
+
+
+    def _decode(self, idx):
+        size = self._sizes[idx]
+        if not size:
+            return ""
+        start = self._starts[idx]
+        fragment = self._data[start:start + size]
+        node = fromstring(self._prefix + fragment + self._suffix)
+        return self._decode_node(node[0])
+
+
+    def __getitem__(self, idx):
+        if not -len(self) <= idx < len(self):
+            raise IndexError("String index out of range")
+        return self._cached(idx % len(self))
+
+
+    def __len__(self):
+        return len(self._starts)
+
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
+    def close(self):
+        """
+        Release the index and remove the temporary file
+        """
+        self._cached.cache_clear()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        self._file.close()
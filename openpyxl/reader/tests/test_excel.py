@@ -161,6 +161,176 @@ def test_file_closes(datadir, load_workbook):
     os.remove(filename)
 
 
+@pytest.mark.parametrize("filename", ["empty_with_no_properties.xlsx", "legacy_drawing.xlsm"])
+def test_load_in_parallel(datadir, load_workbook, filename):
+    datadir.chdir()
+    serial = load_workbook(filename)
+    parallel = load_workbook(filename, workers=2)
+
+    assert parallel.sheetnames == serial.sheetnames
+    for ws1, ws2 in zip(serial.worksheets, parallel.worksheets):
+        assert ws1.calculate_dimension() == ws2.calculate_dimension()
+        assert [c.value for c in ws1._cells.values()] == [c.value for c in ws2._cells.values()]
+        assert [c.style_id for c in ws1._cells.values()] == [c.style_id for c in ws2._cells.values()]
+        assert ws1.merged_cells.ranges == ws2.merged_cells.ranges
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_lazy_strings(datadir, load_workbook, workers):
+    datadir.chdir()
+    expected = load_workbook("hidden_sheets.xlsx")
+    wb = load_workbook("hidden_sheets.xlsx", lazy_strings=True, workers=workers)
+    for ws1, ws2 in zip(expected.worksheets, wb.worksheets):
+        assert [c.value for c in ws1._cells.values()] == [c.value for c in ws2._cells.values()]
+
+
+def test_lazy_strings_read_only(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("sample.xlsx", lazy_strings=True, read_only=True)
+    values = list(wb.active.values)
+    wb.close()
+    assert wb._string_table._file.closed
+    assert values == list(load_workbook("sample.xlsx").active.values)
+
+
+def test_lazy_strings_closed_with_workbook(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("sample.xlsx", lazy_strings=True, lazy=True)
+    table = wb._string_table
+    assert not table._file.closed
+    wb.close()
+    assert table._file.closed
+
+
+def test_pivot_records_closed_with_workbook(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("pivot.xlsx")
+    records = wb._pivot_records
+    assert records
+    wb.close()
+    assert all(r._source.closed for r in records)
+
+
+def test_pivot_caches_read_once(datadir):
+    datadir.chdir()
+    reader = ExcelReader("pivot.xlsx")
+    reader.read()
+    caches = reader.parser.pivot_caches
+    assert reader.parser.pivot_caches is caches
+    assert reader.wb._pivot_records == [caches[68].records]
+
+
+@pytest.mark.parametrize("filename", ["hidden_sheets.xlsx", "legacy_drawing.xlsm", "print_settings.xlsx", "pivot.xlsx"])
+def test_load_lazy(datadir, load_workbook, filename):
+    from openpyxl.worksheet._lazy import LazyWorksheet
+    datadir.chdir()
+    expected = load_workbook(filename)
+    wb = load_workbook(filename, lazy=True)
+
+    assert wb.sheetnames == expected.sheetnames
+    for ws in wb.worksheets:
+        assert isinstance(ws, LazyWorksheet)
+        assert not ws._loaded
+
+    for ws1, ws2 in zip(expected.worksheets, wb.worksheets):
+        assert ws2.sheet_state == ws1.sheet_state
+        assert ws2.print_area == ws1.print_area
+        assert not ws2._loaded
+        assert ws2.calculate_dimension() == ws1.calculate_dimension()
+        assert ws2._loaded
+        assert [c.value for c in ws1._cells.values()] == [c.value for c in ws2._cells.values()]
+        assert len(ws2._pivots) == len(ws1._pivots)
+        assert ws2.legacy_drawing is not None or ws1.legacy_drawing is None
+    wb.close()
+
+
+def test_lazy_read_only(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("hidden_sheets.xlsx", lazy=True, read_only=True)
+    assert wb.read_only
+    wb.close()
+
+
+def test_load_sheets(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("hidden_sheets.xlsx", sheets=["Hidden"])
+    ws1, ws2, ws3 = wb.worksheets
+    assert not ws1._loaded
+    assert ws2["A1"].value is not None
+    assert not ws3._loaded
+    assert ws1.max_row == load_workbook("hidden_sheets.xlsx").worksheets[0].max_row
+    wb.close()
+
+
+def test_load_missing_sheet(datadir, load_workbook):
+    datadir.chdir()
+    with pytest.raises(KeyError):
+        load_workbook("hidden_sheets.xlsx", sheets=["Hidden", "Missing"])
+
+
+def test_skip_invalid(datadir):
+    datadir.chdir()
+    with pytest.raises(ValueError):
+        ExcelReader("hidden_sheets.xlsx", skip=["cells"])
+
+
+def test_skip_external_links(datadir):
+    datadir.chdir()
+    reader = ExcelReader("bug137.xlsx", keep_links=True, skip=["external_links"])
+    assert reader.keep_links is False
+
+
+@pytest.mark.parametrize("skip", [(), ("comments",), ("controls",), ("comments", "controls")])
+def test_skip_legacy(datadir, load_workbook, skip):
+    datadir.chdir()
+    wb = load_workbook("legacy_drawing.xlsm", skip=skip)
+    ws1, ws2 = wb.worksheets
+    assert (ws1["B5"].comment is None) == ("comments" in skip)
+    assert len(ws2.controls.control) == int("controls" not in skip)
+    # the VML of the first worksheet only contains comments
+    assert (ws1.legacy_drawing is None) == ("comments" in skip)
+    wb.save(BytesIO())
+
+
+def test_skip_images(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("sample_with_images.xlsx", skip=["images"])
+    assert wb.active._images == []
+    assert wb.active._raw_drawing is not None
+
+    out = BytesIO()
+    wb.save(out)
+    wb = load_workbook(out)
+    assert len(wb.active._images) == 3
+
+
+def test_skip_charts(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("contains_chartsheets.xlsx", skip=["charts"])
+    assert [len(ws._charts) for ws in wb._sheets] == [0, 0, 0]
+
+    # charts are written unchanged
+    out = BytesIO()
+    wb.save(out)
+    wb = load_workbook(out)
+    assert [len(ws._charts) for ws in wb._sheets] == [0, 1, 1]
+
+
+def test_skip_pivots(datadir, load_workbook):
+    datadir.chdir()
+    wb = load_workbook("pivot.xlsx", skip=["pivots"])
+    assert wb.worksheets[0]._pivots == []
+    wb.save(BytesIO())
+
+
+def test_parallel_needs_filename(datadir):
+    from ..excel import ExcelReader
+    datadir.chdir()
+    with open("empty_with_no_properties.xlsx", "rb") as src:
+        reader = ExcelReader(src, workers=2)
+        assert reader._use_workers([None, None]) is False
+
+
 from ..excel import ExcelReader
 
 
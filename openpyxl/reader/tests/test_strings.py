@@ -35,3 +35,81 @@ def test_formatted_string_table(datadir):
             TextBlock(font=InlineFont(rFont='Calibri', sz="11", family="2", scheme="minor", color=Color(theme=1), b=True, u='single'), text=u'town')]),
             u"     let's play "
         ])
+
+
+import pytest
+from io import BytesIO
+
+
+class TestLazyStringTable:
+
+    @pytest.mark.parametrize("filename", ["sharedStrings.xml", "sharedStrings-emptystring.xml"])
+    def test_same_as_table(self, datadir, filename):
+        from ..strings import LazyStringTable
+        datadir.chdir()
+        with open(filename, "rb") as src:
+            expected = read_string_table(src)
+            src.seek(0)
+            table = LazyStringTable(src)
+        assert len(table) == len(expected)
+        assert list(table) == expected
+        assert table[-1] == expected[-1]
+
+
+    def test_rich_text(self, datadir):
+        from ..strings import LazyStringTable
+        datadir.chdir()
+        with open("shared-strings-rich.xml", "rb") as src:
+            expected = read_rich_text(src)
+            src.seek(0)
+            table = LazyStringTable(src, rich_text=True)
+        assert repr(list(table)) == repr(expected)
+
+
+    def test_prefixed(self):
+        from ..strings import LazyStringTable
+        src = b"""<x:sst xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <x:si><x:t>Hello</x:t></x:si><x:si/><x:si><x:r><x:t>World</x:t></x:r></x:si><x:si/></x:sst>"""
+        table = LazyStringTable(BytesIO(src))
+        assert list(table) == ["Hello", "", "World", ""]
+
+
+    def test_markup(self):
+        from ..strings import LazyStringTable
+        src = b"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <!-- <si><t>comment</t></si> -->
+        <si><t><![CDATA[</si><si>]]></t></si>
+        <?pi <si>?>
+        <si ><t xml:space="preserve"> a > b </t></si >
+        </sst>"""
+        table = LazyStringTable(BytesIO(src))
+        assert list(table) == ["</si><si>", " a > b "]
+
+
+    def test_entities(self):
+        from ..strings import LazyStringTable
+        src = b"""<!DOCTYPE sst [<!ENTITY a "aaaaaaaaaa">]>
+        <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <si><t>&a;</t></si>
+        </sst>"""
+        with pytest.raises(ValueError):
+            LazyStringTable(BytesIO(src))
+
+
+    def test_empty(self):
+        from ..strings import LazyStringTable
+        src = b"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" />"""
+        table = LazyStringTable(BytesIO(src))
+        assert len(table) == 0
+        with pytest.raises(IndexError):
+            table[0]
+
+
+    def test_close(self, datadir):
+        from ..strings import LazyStringTable
+        datadir.chdir()
+        with open("sharedStrings.xml", "rb") as src:
+            table = LazyStringTable(src, cache_size=1)
+        assert table[1] == "This is cell G5"
+        table.close()
+        assert table._file.closed
@@ -14,7 +14,7 @@ from openpyxl.workbook import Workbook
 from openpyxl.workbook.defined_name import DefinedNameList
 from openpyxl.workbook.external_link.external import read_external_link
 from openpyxl.pivot.cache import CacheDefinition
-from openpyxl.pivot.record import RecordList
+from openpyxl.pivot.record import LazyRecordList
 from openpyxl.worksheet.print_settings import PrintTitles, PrintArea
 
 from openpyxl.utils.datetime import CALENDAR_MAC_1904
@@ -23,6 +23,7 @@ from openpyxl.utils.datetime import CALENDAR_MAC_1904
 class WorkbookParser:
 
     _rels = None
+    _pivot_caches = None
 
     def __init__(self, archive, workbook_part_name, keep_links=True):
         self.archive = archive
@@ -121,13 +122,21 @@ class WorkbookParser:
     @property
     def pivot_caches(self):
         """
-        Get PivotCache objects
+        Get PivotCache objects. These are read once and shared by all pivot
+        tables which use them.
         """
+        if self._pivot_caches is not None:
+            return self._pivot_caches
+
         d = {}
         for c in self.caches:
             cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
             if cache.deps:
-                records = get_rel(self.archive, cache.deps, cache.id, RecordList)
-                cache.records = records
+                # records are only parsed when they are used
+                rel = cache.deps.get(cache.id)
+                with self.archive.open(rel.target) as src:
+                    cache.records = LazyRecordList(src, cache, rel.target)
+                self.wb._pivot_records.append(cache.records)
             d[c.cacheId] = cache
+        self._pivot_caches = d
         return d
@@ -220,6 +220,7 @@ def apply_stylesheet(archive, wb):
     else:
         warn("Workbook contains no stylesheet, using openpyxl's defaults")
 
+    complete = bool(stylesheet.cell_styles and wb._named_styles)
     if not wb._named_styles:
         normal = styles['Normal']
         wb.add_named_style(normal)
@@ -228,6 +229,25 @@ def apply_stylesheet(archive, wb):
     if stylesheet.colors is not None:
         wb._colors = stylesheet.colors.index
 
+    if complete:
+        # the stylesheet can be copied as long as this does not change
+        wb._source_styles = style_state(wb)
+
+
+def style_state(wb):
+    """
+    Summary of the styles of a workbook. Styles are only ever added, apart
+    from named styles and colours which can be changed.
+    """
+    collections = [wb._fonts, wb._fills, wb._borders, wb._number_formats,
+                   wb._protections, wb._alignments, wb._cell_styles,
+                   wb._differential_styles.styles]
+    if wb._table_styles is not None:
+        collections.append(wb._table_styles.tableStyle)
+    return ([len(coll) for coll in collections],
+            [(ns.name, tuple(ns.as_tuple())) for ns in wb._named_styles],
+            list(wb._colors))
+
 
 def write_stylesheet(wb):
     stylesheet = Stylesheet()
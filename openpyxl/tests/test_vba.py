@@ -70,12 +70,14 @@ def test_save_with_saved_comments(datadir):
     tmp = NamedTemporaryFile()
     wb.save(tmp)
     files = set(zipfile.ZipFile(tmp, 'r').namelist())
+    # the unchanged worksheet is copied with its comments and strings
     expected = set([
         'xl/styles.xml',
         'docProps/core.xml',
         'xl/_rels/workbook.xml.rels',
         'xl/drawings/vmlDrawing1.vml',
-        'xl/comments/comment1.xml',
+        'xl/comments1.xml',
+        'xl/sharedStrings.xml',
         'docProps/app.xml',
         '[Content_Types].xml',
         'xl/worksheets/sheet1.xml',
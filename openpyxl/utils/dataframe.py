@@ -1,5 +1,6 @@
 # Copyright (c) 2010-2024 openpyxl
 
+import datetime
 from itertools import accumulate
 import operator
 import numpy
@@ -85,3 +86,185 @@ def expand_index(index, header=False):
         result = numpy.array(result).transpose().tolist()
         for row in result:
             yield row
+
+
+def _frame_values(values):
+    """
+    Convert a pandas Series or Index to an array.
+    Missing values in extension types become None.
+    """
+    if isinstance(values.dtype, numpy.dtype):
+        return values.to_numpy()
+    return values.to_numpy(dtype=object, na_value=None)
+
+
+def _frame_label(value):
+    """
+    Column labels with NumPy types are converted like dataframe_to_rows
+    """
+    if isinstance(value, numpy.datetime64):
+        from pandas import Timestamp
+        value = Timestamp(value)
+    elif isinstance(value, numpy.generic):
+        value = value.item()
+    return value
+
+
+def _header_rows(columns):
+    """
+    Return the rows of column labels and the runs of repeated labels which
+    should be merged as (level, first, last).
+    As with expand_index() a label is only included when it or one of the
+    labels above it changes.
+    """
+    if columns.nlevels == 1:
+        return [[_frame_label(v) for v in columns]], []
+
+    codes = numpy.array(columns.codes)
+    changed = numpy.ones(codes.shape, dtype=bool)
+    changed[:, 1:] = codes[:, 1:] != codes[:, :-1]
+    changed = numpy.logical_or.accumulate(changed, axis=0)
+
+    rows = []
+    merges = []
+    size = len(columns)
+    for level, starts in enumerate(changed):
+        labels = columns.get_level_values(level)
+        first = numpy.flatnonzero(starts)
+        row = [None] * size
+        for idx in first.tolist():
+            row[idx] = _frame_label(labels[idx])
+        rows.append(row)
+        if level < columns.nlevels - 1:
+            last = numpy.append(first[1:], size) - 1
+            merges.extend((level, a, b) for a, b in zip(first.tolist(), last.tolist())
+                          if b > a)
+    return rows, merges
+
+
+def _write_column(ws, values, row, column, style=None, number_format=None):
+    """
+    Add the values of a column to a standard worksheet.
+    The type and style of the cells are decided once for the whole column.
+    """
+    from pandas import isna
+    from openpyxl.cell import Cell
+
+    template = None
+    data_type = None
+    kind = values.dtype.kind
+    if kind == "M":
+        values = values.astype("datetime64[us]")
+        template = datetime.datetime(1900, 1, 1)
+        data_type = "d"
+    elif kind == "m":
+        values = values.astype("timedelta64[us]")
+        template = datetime.timedelta()
+        data_type = "d"
+    elif kind == "b":
+        data_type = "b"
+    elif kind in "iuf":
+        template = 0
+        data_type = "n"
+
+    cell = Cell(ws)
+    if style is not None:
+        cell.style = style
+    if number_format is not None:
+        cell.number_format = number_format
+    cell.value = template
+    style = cell._style
+
+    cells = ws._cells
+    missing = isna(values).tolist()
+    for row_idx, (value, skip) in enumerate(zip(values.tolist(), missing), row):
+        if skip:
+            continue
+        cell = Cell(ws, row_idx, column, style_array=style)
+        if data_type is None:
+            cell.value = value
+        else:
+            cell._value = value
+            cell.data_type = data_type
+        cells[row_idx, column] = cell
+    ws._current_row = max(ws._current_row, row + len(missing) - 1)
+
+
+def write_dataframe(ws, df, index=True, header=True, start="A1",
+                    number_formats=None, styles=None):
+    """
+    Write a Pandas dataframe to a worksheet column by column.
+
+    The type and number format of the cells are decided once for each column
+    from its dtype rather than for each value. Missing values are skipped.
+    Repeated labels of MultiIndex columns are merged. If index is True then the
+    index will be written in the first columns with its names in the last row
+    of the header.
+
+    Both standard and write-only worksheets are supported. Write-only
+    worksheets can only be written below the rows already appended.
+
+    :param start: the top-left cell
+    :type start: str
+
+    :param number_formats: number formats by column label or index name
+    :type number_formats: dict
+
+    :param styles: optional named style, or its name, for each column
+        including those of the index
+    :type styles: sequence
+    """
+    from openpyxl.utils.cell import coordinate_to_tuple
+    from openpyxl.worksheet.cell_range import CellRange
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
+    min_row, min_col = coordinate_to_tuple(start)
+    nlevels = df.index.nlevels if index else 0
+
+    labels = list(df.index.names[:nlevels]) + list(df.columns)
+    if styles is None:
+        styles = [None] * len(labels)
+    elif len(styles) != len(labels):
+        raise ValueError("There must be a style for each column")
+    number_formats = number_formats or {}
+    number_formats = [number_formats.get(label) for label in labels]
+
+    rows = []
+    merges = []
+    if header:
+        rows, merges = _header_rows(df.columns)
+        rows[-1] = list(df.index.names[:nlevels]) + rows[-1]
+        for row in rows[:-1]:
+            row[:0] = [None] * nlevels
+
+    columns = [_frame_values(df.index.get_level_values(level))
+               for level in range(nlevels)]
+    columns.extend(_frame_values(df.iloc[:, idx]) for idx in range(df.shape[1]))
+
+    write_only = isinstance(ws, WriteOnlyWorksheet)
+    if write_only:
+        if min_row <= ws._max_row:
+            raise ValueError("Write-only worksheets can only be written below the last row")
+        for _ in range(ws._max_row + 1, min_row):
+            ws.append([])
+        for row in rows:
+            ws.append([None] * (min_col - 1) + row)
+        ws.append_columns(columns, styles, number_formats, min_col)
+    else:
+        for row_idx, row in enumerate(rows, min_row):
+            for col_idx, value in enumerate(row, min_col):
+                if value is not None:
+                    ws.cell(row_idx, col_idx, value)
+        first = min_row + len(rows)
+        for col_idx, values in enumerate(columns):
+            _write_column(ws, values, first, min_col + col_idx,
+                          styles[col_idx], number_formats[col_idx])
+
+    for level, first, last in merges:
+        cr = CellRange(min_row=min_row + level, max_row=min_row + level,
+                       min_col=min_col + nlevels + first,
+                       max_col=min_col + nlevels + last)
+        if write_only:
+            ws.merged_cells.add(cr)
+        else:
+            ws.merge_cells(cr.coord)
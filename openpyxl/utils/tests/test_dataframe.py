@@ -1,5 +1,7 @@
 # Copyright (c) 2010-2024 openpyxl
 
+import datetime
+
 import pytest
 
 
@@ -130,3 +132,80 @@ def test_dataframe_categorical():
 
     rows = list(dataframe_to_rows(df, header=False, index=False))
     assert(rows == arrays)
+
+
+@pytest.mark.pandas_required
+def test_header_rows():
+    from ..dataframe import _header_rows, expand_index
+    from pandas import MultiIndex
+    from itertools import product
+
+    levels = [
+        ['2016', '2017'],
+        ['Major', 'Minor',],
+        ['a', 'b'],
+    ]
+    columns = MultiIndex.from_tuples(product(*levels))
+    rows, merges = _header_rows(columns)
+    assert rows == list(expand_index(columns, header=True))
+    assert merges == [(0, 0, 3), (0, 4, 7), (1, 0, 1), (1, 2, 3), (1, 4, 5), (1, 6, 7)]
+
+
+@pytest.mark.pandas_required
+def test_write_dataframe(sample_data):
+    from openpyxl import Workbook
+    from ..dataframe import write_dataframe
+
+    wb = Workbook()
+    ws = wb.active
+    write_dataframe(ws, sample_data, start="B2", number_formats={"B": "0.00"})
+
+    assert [c.value for c in ws[2]] == [None, "openpyxl test", "A", "B", "C", "D"]
+    assert [c.value for c in ws[3]] == [None, 0, None, None, None, None]
+    row = ws[5]
+    assert [c.value for c in row] == [None, 2, 2.0, 0.0, "foo3", datetime.datetime(2009, 1, 3)]
+    assert [c.data_type for c in row[1:]] == ["n", "n", "n", "s", "d"]
+    assert row[3].number_format == "0.00"
+    assert row[5].number_format == "yyyy-mm-dd h:mm:ss"
+    assert ws.max_row == 7
+
+    ws.append(["next"])
+    assert ws["A8"].value == "next"
+
+
+@pytest.mark.pandas_required
+def test_write_dataframe_multiindex():
+    from pandas import DataFrame, MultiIndex
+    from openpyxl import Workbook
+    from ..dataframe import write_dataframe
+
+    columns = MultiIndex.from_tuples([("a", "x"), ("a", "y"), ("b", "x")])
+    df = DataFrame([[1, 2, 3]], columns=columns)
+
+    for write_only in (False, True):
+        wb = Workbook(write_only=write_only)
+        ws = wb.create_sheet()
+        write_dataframe(ws, df, index=False)
+        assert [str(cr) for cr in ws.merged_cells] == ["A1:B1"]
+
+
+@pytest.mark.pandas_required
+def test_write_dataframe_write_only(sample_data, tmpdir):
+    from openpyxl import Workbook, load_workbook
+    from ..dataframe import write_dataframe
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["title"])
+    with pytest.raises(ValueError):
+        write_dataframe(ws, sample_data, start="A1")
+    write_dataframe(ws, sample_data, index=False, start="B3", number_formats={"B": "0.00"})
+    out = str(tmpdir.join("frame.xlsx"))
+    wb.save(out)
+
+    ws = load_workbook(out).active
+    assert ws["A1"].value == "title"
+    assert [c.value for c in ws[3]] == [None, "A", "B", "C", "D"]
+    row = ws[6]
+    assert [c.value for c in row] == [None, 2.0, 0.0, "foo3", datetime.datetime(2009, 1, 3)]
+    assert row[2].number_format == "0.00"
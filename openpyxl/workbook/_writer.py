@@ -102,7 +102,8 @@ class WorkbookWriter:
                     n.localSheetId = idx
                 defined_names.extend(names)
 
-            if sheet.auto_filter:
+            if getattr(sheet, "_changed", True) and sheet.auto_filter:
+                # worksheets copied from the source keep their own filters
                 name = DefinedName(name='_FilterDatabase', localSheetId=idx, hidden=True)
                 name.value = f"{quoted}!{sheet.auto_filter}"
                 defined_names.append(name)
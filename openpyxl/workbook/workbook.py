@@ -2,6 +2,7 @@
 
 """Workbook is the top-level container for all document information."""
 from copy import copy
+from zipfile import ZIP_DEFLATED
 
 from openpyxl.compat import deprecated
 from openpyxl.worksheet.worksheet import Worksheet
@@ -59,9 +60,14 @@ class Workbook(object):
     def __init__(self,
                  write_only=False,
                  iso_dates=True,
+                 use_shared_strings=False,
+                 shared_strings_limit=None,
+                 spool_size=None,
+                 compact_cells=False,
                  ):
         self._sheets = []
         self._pivots = []
+        self._pivot_records = []
         self._active_sheet_index = 0
         self.defined_names = DefinedNameDict()
         self._external_links = []
@@ -70,6 +76,7 @@ class Workbook(object):
         self.security = DocumentSecurity()
         self.__write_only = write_only
         self.shared_strings = IndexedList()
+        self._shared_strings_size = 0
 
         self._setup_styles()
 
@@ -81,6 +88,10 @@ class Workbook(object):
         self.epoch = WINDOWS_EPOCH
         self.encoding = "utf-8"
         self.iso_dates = iso_dates
+        self.use_shared_strings = use_shared_strings
+        self.shared_strings_limit = shared_strings_limit
+        self.spool_size = spool_size
+        self.compact_cells = compact_cells
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -371,10 +382,15 @@ class Workbook(object):
         return ct
 
 
-    def save(self, filename):
+    def save(self, filename, workers=None, compression=ZIP_DEFLATED,
+             compresslevel=None):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        Worksheets can be written in parallel by a number of `workers`.
+        See :func:`openpyxl.writer.excel.save_workbook` for the compression
+        options.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequent attempts to
@@ -384,7 +400,7 @@ class Workbook(object):
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
-        save_workbook(self, filename)
+        save_workbook(self, filename, workers, compression, compresslevel)
 
 
     @property
@@ -417,10 +433,15 @@ class Workbook(object):
 
     def close(self):
         """
-        Close workbook file if open. Only affects read-only and write-only modes.
+        Close workbook file if open. Only affects read-only, lazy and write-only modes.
+        Temporary files used for pivot cache records are also removed.
         """
         if hasattr(self, '_archive'):
             self._archive.close()
+        if hasattr(self, '_string_table'):
+            self._string_table.close()
+        for records in self._pivot_records:
+            records.close()
 
 
     def _duplicate_name(self, name):
@@ -430,7 +451,10 @@ class Workbook(object):
         """
         name = name.lower()
         for sheet in self.worksheets:
-            for t in sheet.tables:
+            # worksheets read from a source are not changed by reading their tables
+            unused = getattr(sheet, "_unused", {})
+            tables = unused["_tables"] if "_tables" in unused else sheet.tables
+            for t in tables:
                 if name == t.lower():
                     return True
 
@@ -0,0 +1,723 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Storage for the cells of a worksheet
+"""
+
+from array import array
+from collections import defaultdict
+from collections.abc import MutableMapping
+from itertools import groupby
+from operator import itemgetter
+
+from openpyxl.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
+
+
+class _Bounds:
+    """
+    Count the cells in each row and column so that the bounds of the
+    worksheet are known without looking at every cell. Bounds are only
+    recalculated from the counts when a row or column at the edge is emptied.
+    """
+
+    __slots__ = ()
+
+    def _setup_bounds(self):
+        self.rows = {}
+        self.columns = {}
+        self._row_range = None
+        self._col_range = None
+
+
+    def _add(self, row, column):
+        rows = self.rows
+        columns = self.columns
+        if row in rows:
+            rows[row] += 1
+        else:
+            rows[row] = 1
+            self._extend(row, column)
+        if column in columns:
+            columns[column] += 1
+        else:
+            columns[column] = 1
+            self._extend(row, column)
+
+
+    def _extend(self, row, column):
+        """
+        Widen the bounds for a new row or column
+        """
+        if self._row_range is not None:
+            lo, hi = self._row_range
+            self._row_range = min(lo, row), max(hi, row)
+        if self._col_range is not None:
+            lo, hi = self._col_range
+            self._col_range = min(lo, column), max(hi, column)
+
+
+    def _remove(self, row, column):
+        rows = self.rows
+        count = rows[row] - 1
+        if count:
+            rows[row] = count
+        else:
+            del rows[row]
+            if self._row_range is not None and row in self._row_range:
+                self._row_range = None
+
+        columns = self.columns
+        count = columns[column] - 1
+        if count:
+            columns[column] = count
+        else:
+            del columns[column]
+            if self._col_range is not None and column in self._col_range:
+                self._col_range = None
+
+
+    def _shift_counts(self, start, offset, axis):
+        """
+        Move the counts of rows (axis 0) or columns (axis 1) from start
+        """
+        counts = self.columns if axis else self.rows
+        shifted = {(idx + offset if idx >= start else idx): count
+                   for idx, count in counts.items()}
+        counts.clear()
+        counts.update(shifted)
+        if axis:
+            self._col_range = None
+        else:
+            self._row_range = None
+
+
+    def _remove_span(self, start, offset, axis):
+        """
+        Remove the cells which will be moved over when shifting backwards
+        """
+        if offset >= 0:
+            return
+        others = self.rows if axis else self.columns
+        for idx in range(start + offset, start):
+            for other in list(others):
+                key = (other, idx) if axis else (idx, other)
+                if key in self:
+                    del self[key]
+
+
+    @property
+    def row_range(self):
+        """
+        The first and last rows containing cells, or None if there are none
+        """
+        if self._row_range is None and self.rows:
+            self._row_range = min(self.rows), max(self.rows)
+        return self._row_range
+
+
+    @property
+    def col_range(self):
+        """
+        The first and last columns containing cells, or None if there are none
+        """
+        if self._col_range is None and self.columns:
+            self._col_range = min(self.columns), max(self.columns)
+        return self._col_range
+
+
+class CellStore(_Bounds, dict):
+    """
+    Cells of a worksheet keyed by (row, column).
+    """
+
+    __slots__ = ("rows", "columns", "_row_range", "_col_range")
+
+    def __init__(self, cells=()):
+        super().__init__()
+        self._setup_bounds()
+        self.update(cells)
+
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+    def __setitem__(self, key, cell):
+        if key not in self:
+            self._add(*key)
+        dict.__setitem__(self, key, cell)
+
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._remove(*key)
+
+
+    def pop(self, key, *default):
+        if key in self:
+            self._remove(*key)
+        return super().pop(key, *default)
+
+
+    def popitem(self):
+        key, cell = super().popitem()
+        self._remove(*key)
+        return key, cell
+
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+    def update(self, *args, **kw):
+        for key, cell in dict(*args, **kw).items():
+            self[key] = cell
+
+
+    def clear(self):
+        super().clear()
+        self._setup_bounds()
+
+
+    def shift(self, start, offset, axis=0):
+        """
+        Move the cells in rows (axis 0) or columns (axis 1) from start onwards
+        by offset. Cells which are moved over are removed.
+        """
+        self._remove_span(start, offset, axis)
+        counts = self.columns if axis else self.rows
+        affected = sum(count for idx, count in counts.items() if idx >= start)
+        if affected < len(self) // 4:
+            moved = [key for key in self if key[axis] >= start]
+            moved.sort(key=itemgetter(axis), reverse=offset > 0)
+            for key in moved:
+                cell = dict.pop(self, key)
+                row, column = key
+                if axis:
+                    column += offset
+                    cell.column = column
+                else:
+                    row += offset
+                    cell.row = row
+                dict.__setitem__(self, (row, column), cell)
+            self._shift_counts(start, offset, axis)
+            return
+
+        # rebuilding is faster than moving most of the cells
+        cells = {}
+        if axis:
+            for (row, column), cell in dict.items(self):
+                if column >= start:
+                    column += offset
+                    cell.column = column
+                cells[row, column] = cell
+        else:
+            for (row, column), cell in dict.items(self):
+                if row >= start:
+                    row += offset
+                    cell.row = row
+                cells[row, column] = cell
+        dict.clear(self)
+        dict.update(self, cells)
+        self._shift_counts(start, offset, axis)
+
+
+    def sorted_rows(self):
+        """
+        Return the index and cells of each row containing cells in order
+        """
+        cells = sorted(self.items())
+        for row, group in groupby(cells, key=lambda item: item[0][0]):
+            yield row, [cell for _, cell in group]
+
+
+# how values are stored in a ColumnarCellStore
+NO_CELL = 0
+EMPTY = 1
+FLOAT = 2
+INT = 3
+BOOL = 4
+OBJECT = 5
+
+MAX_EXACT = 2**53 # largest integer stored exactly as a float
+
+DATA_TYPES = ("n", "s", "f", "b", "d", "e", "inlineStr", "str")
+DATA_TYPE_CODES = {dt: idx for idx, dt in enumerate(DATA_TYPES)}
+
+CHUNK_SHIFT = 7
+CHUNK_ROWS = 1 << CHUNK_SHIFT
+CHUNK_MASK = CHUNK_ROWS - 1
+
+
+class _Chunk:
+    """
+    Consecutive rows of a column
+    """
+
+    __slots__ = ("kinds", "types", "numbers", "styles", "objects", "count")
+
+    def __init__(self):
+        self.kinds = bytearray(CHUNK_ROWS)
+        self.types = bytearray(CHUNK_ROWS)
+        self.numbers = array("d", bytes(8 * CHUNK_ROWS))
+        self.styles = array("I", bytes(4 * CHUNK_ROWS))
+        self.objects = None
+        self.count = 0
+
+
+class _StyleView(StyleArray):
+    """
+    Style of a cell which is stored again whenever it is changed
+    """
+
+    __slots__ = ("_cell",)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._cell._style = self
+
+
+class CellView(Cell):
+    """
+    Cell whose contents are kept by a ColumnarCellStore.
+
+    Views are created when cells are used and changes are written back
+    immediately, so any number of views of the same cell can exist.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if not isinstance(other, CellView):
+            return NotImplemented
+        return (self.parent is other.parent and self.row == other.row
+                and self.column == other.column)
+
+
+    def __hash__(self):
+        return hash((id(self.parent), self.row, self.column))
+
+
+    def _find(self):
+        return self.parent._cells._find(self.row, self.column)
+
+
+    def _chunk(self):
+        """
+        Return the chunk and index of the cell. Cells which have been removed
+        from the worksheet are added again.
+        """
+        store = self.parent._cells
+        chunk, idx = store._find(self.row, self.column)
+        if chunk is None:
+            store[self.row, self.column] = self
+            chunk, idx = store._find(self.row, self.column)
+        return chunk, idx
+
+
+    @property
+    def _value(self):
+        chunk, idx = self._find()
+        if chunk is None:
+            return None
+        return _get_value(chunk, idx)
+
+
+    @_value.setter
+    def _value(self, value):
+        chunk, idx = self._chunk()
+        _set_value(chunk, idx, value)
+
+
+    @property
+    def data_type(self):
+        chunk, idx = self._find()
+        if chunk is None:
+            return "n"
+        return DATA_TYPES[chunk.types[idx]]
+
+
+    @data_type.setter
+    def data_type(self, value):
+        chunk, idx = self._chunk()
+        chunk.types[idx] = DATA_TYPE_CODES[value]
+
+
+    @property
+    def _style(self):
+        chunk, idx = self._find()
+        style_id = chunk is not None and chunk.styles[idx] or 0
+        style = _StyleView(self.parent.parent._cell_styles[style_id])
+        style._cell = self
+        return style
+
+
+    @_style.setter
+    def _style(self, value):
+        chunk, idx = self._chunk()
+        style_id = 0
+        if value is not None:
+            style_id = self.parent.parent._cell_styles.add(StyleArray(value))
+        chunk.styles[idx] = style_id
+
+
+    @property
+    def _hyperlink(self):
+        return self.parent._cells.hyperlinks.get((self.row, self.column))
+
+
+    @_hyperlink.setter
+    def _hyperlink(self, value):
+        if value is not None:
+            self._chunk()
+        self.parent._cells._set_extra("hyperlinks", (self.row, self.column), value)
+
+
+    @property
+    def _comment(self):
+        return self.parent._cells.comments.get((self.row, self.column))
+
+
+    @_comment.setter
+    def _comment(self, value):
+        if value is not None:
+            self._chunk()
+        self.parent._cells._set_extra("comments", (self.row, self.column), value)
+
+
+def _get_value(chunk, idx):
+    kind = chunk.kinds[idx]
+    if kind == FLOAT:
+        return chunk.numbers[idx]
+    elif kind == INT:
+        return int(chunk.numbers[idx])
+    elif kind == BOOL:
+        return bool(chunk.numbers[idx])
+    elif kind == OBJECT:
+        return chunk.objects[idx]
+
+
+def _set_value(chunk, idx, value):
+    t = type(value)
+    if t is float:
+        kind = FLOAT
+    elif t is int and -MAX_EXACT <= value <= MAX_EXACT:
+        kind = INT
+    elif t is bool:
+        kind = BOOL
+    elif value is None:
+        kind = EMPTY
+        value = 0
+    else:
+        kind = OBJECT
+
+    if chunk.objects is not None:
+        chunk.objects[idx] = None
+    if kind == OBJECT:
+        if chunk.objects is None:
+            chunk.objects = [None] * CHUNK_ROWS
+        chunk.objects[idx] = value
+        value = 0
+    chunk.numbers[idx] = value
+    chunk.kinds[idx] = kind
+
+
+class ColumnarCellStore(_Bounds, MutableMapping):
+    """
+    Cells of a worksheet kept in arrays for each column instead of as Cell
+    objects. Values, types and style ids are stored in chunks of consecutive
+    rows and cells are returned as views of these. Hyperlinks and comments
+    are kept separately, as are merged cells.
+
+    Numbers use about a tenth of the memory of Cell objects.
+    """
+
+    view = CellView # class of the views of cells
+
+    def __init__(self, ws, cells=()):
+        self.ws = ws
+        self._setup_bounds()
+        self._data = defaultdict(dict) # column: {chunk index: chunk}
+        self._other = {}
+        self.hyperlinks = {}
+        self.comments = {}
+        self.update(cells)
+
+
+    def _find(self, row, column):
+        """
+        Return the chunk and index of a cell if it is in the arrays
+        """
+        chunks = self._data.get(column)
+        if chunks is None:
+            return None, 0
+        chunk = chunks.get((row - 1) >> CHUNK_SHIFT)
+        idx = (row - 1) & CHUNK_MASK
+        if chunk is None or not chunk.kinds[idx]:
+            return None, idx
+        return chunk, idx
+
+
+    def _set_extra(self, name, key, value):
+        extra = getattr(self, name)
+        if value is None:
+            extra.pop(key, None)
+        else:
+            extra[key] = value
+
+
+    def _view(self, row, column):
+        cell = CellView.__new__(CellView)
+        cell.parent = self.ws
+        cell.row = row
+        cell.column = column
+        cell.__class__ = self.view
+        return cell
+
+
+    def __contains__(self, key):
+        return key in self._other or self._find(*key)[0] is not None
+
+
+    def __getitem__(self, key):
+        if key in self._other:
+            return self._other[key]
+        if self._find(*key)[0] is None:
+            raise KeyError(key)
+        return self._view(*key)
+
+
+    def __setitem__(self, key, cell):
+        row, column = key
+        existed = key in self
+        if not existed:
+            self._add(row, column)
+
+        if not isinstance(cell, Cell):
+            # merged cells
+            self._clear(row, column)
+            self._other[key] = cell
+            return
+
+        self._other.pop(key, None)
+        src, src_idx = None, 0
+        if isinstance(cell, CellView) and cell.parent._cells is self:
+            src, src_idx = self._find(cell.row, cell.column)
+            if (cell.row, cell.column) == key and src is not None:
+                return
+
+        if src is not None:
+            # moved
+            values = (_get_value(src, src_idx), DATA_TYPES[src.types[src_idx]],
+                      src.styles[src_idx])
+            extra = [(name, getattr(self, name).get((cell.row, cell.column)))
+                     for name in ("hyperlinks", "comments")]
+        elif isinstance(cell, CellView):
+            # deleted
+            values = (None, "n", 0)
+            extra = ()
+        else:
+            style_id = 0
+            if cell._style is not None:
+                style_id = self.ws.parent._cell_styles.add(StyleArray(cell._style))
+            values = (cell._value, cell.data_type, style_id)
+            extra = [("hyperlinks", cell._hyperlink), ("comments", cell._comment)]
+
+        chunks = self._data[column]
+        chunk_idx = (row - 1) >> CHUNK_SHIFT
+        chunk = chunks.get(chunk_idx)
+        if chunk is None:
+            chunk = chunks[chunk_idx] = _Chunk()
+        idx = (row - 1) & CHUNK_MASK
+        if not chunk.kinds[idx]:
+            chunk.count += 1
+        value, data_type, style_id = values
+        _set_value(chunk, idx, value)
+        chunk.types[idx] = DATA_TYPE_CODES[data_type]
+        chunk.styles[idx] = style_id
+        for name, value in extra:
+            self._set_extra(name, key, value)
+
+
+    def _clear(self, row, column):
+        """
+        Remove a cell from the arrays
+        """
+        chunk, idx = self._find(row, column)
+        if chunk is None:
+            return
+        chunk.kinds[idx] = NO_CELL
+        chunk.types[idx] = 0
+        chunk.numbers[idx] = 0
+        chunk.styles[idx] = 0
+        if chunk.objects is not None:
+            chunk.objects[idx] = None
+        chunk.count -= 1
+        if not chunk.count:
+            chunks = self._data[column]
+            del chunks[(row - 1) >> CHUNK_SHIFT]
+            if not chunks:
+                del self._data[column]
+        key = row, column
+        self.hyperlinks.pop(key, None)
+        self.comments.pop(key, None)
+
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if self._other.pop(key, None) is None:
+            self._clear(*key)
+        self._remove(*key)
+
+
+    def __iter__(self):
+        for column, chunks in list(self._data.items()):
+            for chunk_idx, chunk in list(chunks.items()):
+                start = (chunk_idx << CHUNK_SHIFT) + 1
+                kinds = chunk.kinds
+                for idx in range(CHUNK_ROWS):
+                    if kinds[idx]:
+                        yield start + idx, column
+        yield from list(self._other)
+
+
+    def __len__(self):
+        return sum(chunk.count for chunks in self._data.values()
+                   for chunk in chunks.values()) + len(self._other)
+
+
+    def clear(self):
+        self._setup_bounds()
+        self._data.clear()
+        self._other.clear()
+        self.hyperlinks.clear()
+        self.comments.clear()
+
+
+    def shift(self, start, offset, axis=0):
+        """
+        Move the cells in rows (axis 0) or columns (axis 1) from start onwards
+        by offset. Cells which are moved over are removed.
+
+        Columns are moved by renumbering their chunks. Rows are moved by
+        slicing the arrays of each column from the chunk containing start.
+        """
+        self._remove_span(start, offset, axis)
+        if axis:
+            self._data = defaultdict(dict, self._shift_keys(self._data, start, offset))
+        else:
+            for column in list(self._data):
+                self._shift_rows(column, start, offset)
+
+        for name in ("hyperlinks", "comments", "_other"):
+            setattr(self, name, self._shift_keys(getattr(self, name), start, offset, axis))
+        for (row, column), cell in self._other.items():
+            cell.row = row
+            cell.column = column
+        self._shift_counts(start, offset, axis)
+
+
+    @staticmethod
+    def _shift_keys(mapping, start, offset, axis=None):
+        """
+        Renumber the keys of a mapping from start. Keys are either indices
+        or coordinates with the index at axis.
+        """
+        shifted = {}
+        for key, value in mapping.items():
+            if axis is None:
+                if key >= start:
+                    key += offset
+            elif key[axis] >= start:
+                key = list(key)
+                key[axis] += offset
+                key = tuple(key)
+            shifted[key] = value
+        return shifted
+
+
+    def _shift_rows(self, column, start, offset):
+        chunks = self._data[column]
+        first = (min(start, start + offset) - 1) >> CHUNK_SHIFT
+        ids = [idx for idx in chunks if idx >= first]
+        if not ids:
+            return
+
+        kinds = bytearray()
+        types = bytearray()
+        numbers = array("d")
+        styles = array("I")
+        objects = []
+        blank = _Chunk()
+        for idx in range(first, max(ids) + 1):
+            chunk = chunks.pop(idx, blank)
+            kinds += chunk.kinds
+            types += chunk.types
+            numbers += chunk.numbers
+            styles += chunk.styles
+            objects += chunk.objects or [None] * CHUNK_ROWS
+
+        pos = start - 1 - (first << CHUNK_SHIFT)
+        if offset > 0:
+            kinds[pos:pos] = bytes(offset)
+            types[pos:pos] = bytes(offset)
+            numbers[pos:pos] = array("d", bytes(8 * offset))
+            styles[pos:pos] = array("I", bytes(4 * offset))
+            objects[pos:pos] = [None] * offset
+        else:
+            for seq in (kinds, types, numbers, styles, objects):
+                del seq[pos + offset:pos]
+
+        for idx in range(0, len(kinds), CHUNK_ROWS):
+            end = min(idx + CHUNK_ROWS, len(kinds))
+            size = end - idx
+            count = size - kinds.count(0, idx, end)
+            if not count:
+                continue
+            chunk = _Chunk()
+            chunk.kinds[:size] = kinds[idx:end]
+            chunk.types[:size] = types[idx:end]
+            chunk.numbers[:size] = numbers[idx:end]
+            chunk.styles[:size] = styles[idx:end]
+            values = objects[idx:end]
+            if any(value is not None for value in values):
+                chunk.objects = values + [None] * (CHUNK_ROWS - size)
+            chunk.count = count
+            chunks[first + (idx >> CHUNK_SHIFT)] = chunk
+
+        if not chunks:
+            del self._data[column]
+
+
+    def sorted_rows(self):
+        """
+        Return the index and cells of each row containing cells in order.
+        Cells are created one row at a time.
+        """
+        other = defaultdict(list)
+        for (row, column), cell in self._other.items():
+            other[row].append((column, cell))
+
+        chunk_ids = {row - 1 >> CHUNK_SHIFT for row in other}
+        for chunks in self._data.values():
+            chunk_ids.update(chunks)
+
+        for chunk_idx in sorted(chunk_ids):
+            columns = sorted(
+                (column, chunks[chunk_idx]) for column, chunks in self._data.items()
+                if chunk_idx in chunks
+            )
+            start = (chunk_idx << CHUNK_SHIFT) + 1
+            for idx in range(CHUNK_ROWS):
+                row = start + idx
+                cells = [(column, self._view(row, column)) for column, chunk in columns
+                         if chunk.kinds[idx]]
+                if row in other:
+                    cells.extend(other[row])
+                    cells.sort(key=itemgetter(0))
+                if cells:
+                    yield row, [cell for _, cell in cells]
@@ -0,0 +1,196 @@
+# Copyright (c) 2010-2024 openpyxl
+
+""" Worksheets which are read from the source when they are first used
+"""
+
+from openpyxl.cell import Cell
+from .worksheet import Worksheet
+from .header_footer import HeaderFooter
+from ._cell_store import CellView, ColumnarCellStore
+
+
+# attributes which are assigned from the workbook and not the worksheet source
+KEEP = frozenset([
+    '_id',
+    '_parent',
+    '_WorkbookChild__title',
+    'sheet_state',
+    'defined_names',
+    '_print_rows',
+    '_print_cols',
+    '_print_area',
+    '_rels',
+    # properties which only change the attributes above
+    'title',
+    'print_area',
+    'print_title_rows',
+    'print_title_cols',
+])
+
+# attributes of a loaded worksheet which can be used without changing it
+TRACKED = KEEP | frozenset([
+    '_source',
+    '_cells',
+    '_current_row',
+    '_changed',
+    '_unused',
+])
+
+
+class _Tracked:
+    """
+    Cells of a worksheet read from the source which record when anything
+    is written to them
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        self.parent._change()
+        object.__setattr__(self, name, value)
+
+
+    # comments and hyperlinks can be changed in place
+
+    def _get_comment(self):
+        if self._comment is not None:
+            self.parent._change()
+        return self._comment
+
+    comment = property(_get_comment, Cell.comment.fset, doc=Cell.comment.__doc__)
+
+
+    def _get_hyperlink(self):
+        if self._hyperlink is not None:
+            self.parent._change()
+        return self._hyperlink
+
+    hyperlink = property(_get_hyperlink, Cell.hyperlink.fset, doc=Cell.hyperlink.__doc__)
+
+
+class _TrackedCell(_Tracked, Cell):
+
+    __slots__ = ()
+
+
+class _TrackedView(_Tracked, CellView):
+
+    __slots__ = ()
+
+
+class LazyWorksheet(Worksheet):
+    """
+    Placeholder for a worksheet in an archive.
+
+    The worksheet is only parsed when any of its contents are accessed.
+    Once it has been parsed, writing to it or to its cells, or using any of
+    the objects it contains, such as charts or dimensions, which can be
+    changed in place, is recorded. Until then it can be copied unchanged
+    when the workbook is saved.
+    """
+
+    _changed = False
+
+    def __init__(self, parent, title, source, loader):
+        Worksheet.__init__(self, parent, title)
+        for name in set(self.__dict__) - KEEP:
+            del self.__dict__[name]
+        self.__dict__.update(_source=source, _loader=loader)
+
+
+    @property
+    def _loaded(self):
+        return "_loader" not in self.__dict__
+
+
+    def __getattr__(self, name):
+        # only called for attributes which do not exist yet
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if not self._loaded:
+            self._load()
+        elif name in self.__dict__.get("_unused", ()):
+            self._change()
+            self.__dict__[name] = self._unused.pop(name)
+        else:
+            raise AttributeError(name)
+        return getattr(self, name)
+
+
+    def __setattr__(self, name, value):
+        if name not in KEEP:
+            # changes must not be overwritten by loading
+            self._change()
+            self.__dict__.get("_unused", {}).pop(name, None)
+        super().__setattr__(name, value)
+
+
+    def __delitem__(self, key):
+        self._change()
+        super().__delitem__(key)
+
+
+    def _add_cell(self, cell):
+        """
+        Empty cells are not saved so creating them does not change the worksheet
+        """
+        if (self.__dict__.get("_changed", True) or type(cell) is not Cell
+            or cell._value is not None or cell.has_style
+            or cell._hyperlink or cell._comment):
+            super()._add_cell(cell)
+            return
+        cell.__class__ = _TrackedCell
+        self.__dict__["_current_row"] = max(cell.row, self._current_row)
+        self._cells[(cell.row, cell.column)] = cell
+
+
+    def _load(self):
+        """
+        Read the worksheet from the source
+        """
+        if self._loaded:
+            return
+        loader = self.__dict__.pop("_loader")
+        kept = {k:v for k, v in self.__dict__.items() if k in KEEP}
+        self._setup()
+        self.HeaderFooter = HeaderFooter()
+        self.__dict__.update(kept)
+        loader(self, self._source)
+        self._track()
+
+
+    def _track(self):
+        """
+        Start recording changes. Objects which can be changed in place are
+        kept aside until they are used.
+        """
+        d = self.__dict__
+        d["_changed"] = False
+        # defaults of the class would hide attributes which are kept aside
+        d["_unused"] = {name: d.pop(name) for name in set(d) - TRACKED
+                        if not hasattr(type(self), name)}
+        cells = self._cells
+        if isinstance(cells, ColumnarCellStore):
+            cells.view = _TrackedView
+            return
+        for cell in cells.values():
+            if type(cell) is Cell:
+                cell.__class__ = _TrackedCell
+
+
+    def _change(self):
+        """
+        Record that the worksheet may differ from its source
+        """
+        self._load()
+        d = self.__dict__
+        if d.get("_changed", True):
+            return
+        d["_changed"] = True
+        cells = self._cells
+        if isinstance(cells, ColumnarCellStore):
+            cells.view = CellView
+            return
+        for cell in cells.values():
+            if type(cell) is _TrackedCell:
+                cell.__class__ = Cell
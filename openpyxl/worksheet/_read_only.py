@@ -3,11 +3,16 @@
 """ Read worksheets on-demand
 """
 
+import os
+
 from .worksheet import Worksheet
 from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
-from openpyxl.utils import get_column_letter
+from openpyxl.formula.translate import Translator
+from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.xml.constants import MAX_COLUMN
 
 from ._reader import WorkSheetParser
+from ._row_index import RowIndex, cache_path
 from openpyxl.workbook.defined_name import DefinedNameDict
 
 
@@ -21,31 +26,32 @@ class ReadOnlyWorksheet(object):
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
+    _row_index = None
 
     # from Standard Worksheet
     # Methods from Worksheet
     cell = Worksheet.cell
-    iter_rows = Worksheet.iter_rows
     values = Worksheet.values
     rows = Worksheet.rows
     __getitem__ = Worksheet.__getitem__
     __iter__ = Worksheet.__iter__
 
 
-    def __init__(self, parent_workbook, title, worksheet_path, shared_strings):
+    def __init__(self, parent_workbook, title, worksheet_path, shared_strings, engine=None):
         self.parent = parent_workbook
         self.title = title
         self.sheet_state = 'visible'
         self._current_row = None
         self._worksheet_path = worksheet_path
         self._shared_strings = shared_strings
+        self._engine = engine
         self._get_size()
         self.defined_names = DefinedNameDict()
 
 
     def _get_size(self):
         src = self._get_source()
-        parser = WorkSheetParser(src, [])
+        parser = WorkSheetParser(src, [], engine=self._engine)
         dimensions = parser.parse_dimensions()
         src.close()
         if dimensions is not None:
@@ -57,51 +63,193 @@ class ReadOnlyWorksheet(object):
         return self.parent._archive.open(self._worksheet_path)
 
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+    def build_row_index(self, step=1000, cache_dir=None):
         """
-        The source worksheet file may have columns or rows missing.
-        Missing cells will be created.
+        Record where every `step` rows start in the source so that reading
+        rows further down the worksheet does not have to parse all the rows
+        before them.
+
+        If a directory is provided then indices are stored there and reused
+        for identical worksheets.
         """
-        filler = EMPTY_CELL
-        if values_only:
-            filler = None
+        path = None
+        if cache_dir is not None:
+            info = self.parent._archive.getinfo(self._worksheet_path)
+            path = cache_path(cache_dir, info, step)
+            if os.path.exists(path):
+                index = RowIndex.load(path)
+                if index is not None:
+                    self._row_index = index
+                    return index
 
-        max_col = max_col or self.max_column
-        max_row = max_row or self.max_row
-        empty_row = []
-        if max_col is not None:
-            empty_row = (filler,) * (max_col + 1 - min_col)
+        src = self._get_source()
+        try:
+            index = RowIndex.from_source(src, step)
+        finally:
+            src.close()
 
-        counter = min_row
-        idx = 1
+        if path is not None:
+            index.save(path)
+        self._row_index = index
+        return index
+
+
+    def _get_parser_at(self, row, columns=None):
+        """
+        Use the row index, if there is one, to start parsing close to a row.
+        """
         src = self._get_source()
+        row_counter, formulae = 0, {}
+        if self._row_index is not None and src.seekable():
+            src, row_counter, formulae = self._row_index.open(src, row)
         parser = WorkSheetParser(src,
                                  self._shared_strings,
                                  data_only=self.parent.data_only,
                                  epoch=self.parent.epoch,
                                  date_formats=self.parent._date_formats,
-                                 timedelta_formats=self.parent._timedelta_formats)
+                                 timedelta_formats=self.parent._timedelta_formats,
+                                 engine=self._engine,
+                                 columns=columns)
+        parser.row_counter = row_counter
+        # cells after the checkpoint may use formulae defined before it
+        for si, (coordinate, text) in formulae.items():
+            parser.shared_formulae[si] = Translator("=" + text, coordinate)
+        return src, parser
+
+
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None,
+                  values_only=False, columns=None, where=None, stop_when=None):
+        """
+        Produces cells from the worksheet, by row. Specify the iteration range
+        using indices of rows and columns.
 
-        for idx, row in parser.parse():
-            if max_row is not None and idx > max_row:
-                break
+        If no indices are specified the range starts at A1.
 
-            # some rows are missing
-            for _ in range(counter, idx):
-                counter += 1
-                yield empty_row
+        Cells outside the requested columns are skipped by the parser without
+        their values being read.
 
-            # return cells from a row
-            if counter <= idx:
-                row = self._get_row(row, min_col, max_col, values_only)
-                counter += 1
-                yield row
+        :param min_col: smallest column index (1-based index)
+        :type min_col: int
 
-        src.close() # make sure source is always closed
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_col: largest column index (1-based index)
+        :type max_col: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :param values_only: whether only cell values should be returned
+        :type values_only: bool
+
+        :param columns: column letters or indices to return, in order.
+            Takes precedence over `min_col` and `max_col`.
+        :type columns: iterable
+
+        :param where: mapping of column to a function of the cell value.
+            Only rows for which every function returns True are returned.
+        :type where: dict
+
+        :param stop_when: mapping of column to a function of the cell value.
+            Iteration stops, without returning it, at the first row for which
+            every function returns True.
+        :type stop_when: dict
+
+        Functions in `where` and `stop_when` are passed None for cells
+        missing from the source, including those of missing rows, so they
+        must accept None if the worksheet has gaps.
+
+        :rtype: generator
+        """
+        if columns is not None:
+            columns = tuple(_column_index(c) for c in columns)
+        min_col = min_col or 1
+        min_row = min_row or 1
+        max_col = max_col or self.max_column
+        max_row = max_row or self.max_row
+
+        return self._cells_by_row(min_col, min_row, max_col, max_row, values_only,
+                                  columns, where, stop_when)
+
+
+    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False,
+                      columns=None, where=None, stop_when=None):
+        """
+        The source worksheet file may have columns or rows missing.
+        Missing cells will be created.
+
+        Conditions are checked against the values from the parser before any
+        cells are created.
+        """
+        filler = EMPTY_CELL
+        if values_only:
+            filler = None
+
+        max_col = max_col or self.max_column
+        max_row = max_row or self.max_row
+        empty_row = []
+        if columns is not None:
+            empty_row = (filler,) * len(columns)
+            selected = frozenset(columns)
+        else:
+            if max_col is not None:
+                empty_row = (filler,) * (max_col + 1 - min_col)
+            selected = _column_range(min_col, max_col, self.max_column)
+
+        where = _conditions(where)
+        stop_when = _conditions(stop_when)
+        # conditions also apply to rows missing from the source, if there are any
+        missing = None
+        if selected is not None:
+            needed = {col for col, _ in where + stop_when}
+            if not needed.issubset(selected):
+                selected = frozenset(selected) | needed
+
+        counter = min_row
+        idx = 1
+        src, parser = self._get_parser_at(min_row, selected)
+
+        try:
+            for idx, row in parser.parse():
+                if max_row is not None and idx > max_row:
+                    break
+
+                # some rows are missing
+                for _ in range(counter, idx):
+                    counter += 1
+                    if missing is None:
+                        missing = _missing_row(where, stop_when)
+                    stop, keep = missing
+                    if stop:
+                        return
+                    if keep:
+                        yield empty_row
+
+                # return cells from a row
+                if counter <= idx:
+                    counter += 1
+                    if stop_when and _matches(stop_when, row):
+                        return
+                    if where and not _matches(where, row):
+                        continue
+                    if columns is not None:
+                        row = self._get_columns(row, columns, values_only)
+                    else:
+                        row = self._get_row(row, min_col, max_col, values_only)
+                    yield row
+        finally:
+            src.close() # make sure source is always closed
 
         if max_row is not None and max_row < idx:
             for _ in range(counter, max_row+1):
-                yield empty_row
+                if missing is None:
+                    missing = _missing_row(where, stop_when)
+                stop, keep = missing
+                if stop:
+                    return
+                if keep:
+                    yield empty_row
 
 
     def _get_row(self, row, min_col=1, max_col=None, values_only=False):
@@ -129,6 +277,159 @@ class ReadOnlyWorksheet(object):
         return tuple(new_row)
 
 
+    def _get_columns(self, row, columns, values_only=False):
+        """
+        Return the cells or values of a row for a selection of columns
+        """
+        filler = None if values_only else EMPTY_CELL
+        cells = {cell['column']:cell for cell in row}
+        new_row = []
+        for col in columns:
+            cell = cells.get(col)
+            if cell is None:
+                new_row.append(filler)
+            elif values_only:
+                new_row.append(cell['value'])
+            else:
+                new_row.append(ReadOnlyCell(self, **cell))
+        return tuple(new_row)
+
+
+    def to_arrays(self, min_row=None, max_row=None, columns=None, dtypes=None,
+                  min_col=None, max_col=None):
+        """
+        Return the values of the worksheet as one NumPy array per column.
+
+        Values are written straight from the parser into preallocated arrays
+        so that no cell objects are created.
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :param columns: column letters or indices to extract. Takes precedence
+            over `min_col` and `max_col`.
+        :type columns: iterable
+
+        :param dtypes: a NumPy dtype for all columns, or a mapping of column to dtype.
+            Columns without a dtype are inferred from their values and strings
+            are kept as objects. String dtypes without a length, such as `str`,
+            are sized for the longest value.
+        :type dtypes: dtype or dict
+
+        :param min_col: smallest column index (1-based index)
+        :type min_col: int
+
+        :param max_col: largest column index (1-based index), defaults to the
+            last column of the worksheet
+        :type max_col: int
+
+        Every column in the range is returned, even if it is empty. If the
+        worksheet has no dimensions, the range ends at the last column with
+        any values.
+
+        Gaps are NaN for floats, NaT for dates and times and None for objects.
+        Columns of other types are returned as masked arrays if they have gaps.
+
+        :rtype: dict of column letter to array
+        """
+        import numpy
+
+        min_row = min_row or 1
+        max_row = max_row or self.max_row
+        if columns is None:
+            min_col = min_col or self.min_column
+            max_col = max_col or self.max_column
+            selected = _column_range(min_col, max_col, self.max_column)
+            if max_col is not None:
+                columns = range(min_col, max_col + 1)
+        if columns is not None:
+            columns = [_column_index(c) for c in columns]
+            selected = frozenset(columns)
+
+        if dtypes is None or isinstance(dtypes, dict):
+            dtypes = {_column_index(k):numpy.dtype(v) for k, v in (dtypes or {}).items()}
+            default = None
+        else:
+            default = numpy.dtype(dtypes)
+            dtypes = {}
+
+        size = 1024
+        if max_row is not None:
+            size = max_row + 1 - min_row
+
+        arrays = {}
+
+        def column_array(idx, size):
+            dtype = dtypes.get(idx, default)
+            if dtype is None or dtype.kind in "US" and not dtype.itemsize:
+                # strings are kept as objects until their length is known
+                dtype = numpy.dtype(object)
+            arr = numpy.empty(size, dtype=dtype)
+            arr[:] = _gap_for(dtype)
+            return arr, numpy.ones(size, dtype=bool)
+
+        if columns is not None:
+            for idx in columns:
+                arrays[idx] = column_array(idx, size)
+
+        last = -1
+        src, parser = self._get_parser_at(min_row, selected)
+        try:
+            for idx, row in parser.parse(values_only=True):
+                if max_row is not None and idx > max_row:
+                    break
+                if idx < min_row:
+                    continue
+                pos = idx - min_row
+                if pos >= size:
+                    size = max(size * 2, pos + 1)
+                    for col, (arr, mask) in arrays.items():
+                        arrays[col] = _grow(arr, mask, size)
+                for col, value in row:
+                    if value is None:
+                        continue
+                    if col not in arrays:
+                        if columns is not None or col < min_col:
+                            continue
+                        arrays[col] = column_array(col, size)
+                    arr, mask = arrays[col]
+                    try:
+                        arr[pos] = value
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(
+                            f"Cell {get_column_letter(col)}{idx} value {value!r} cannot be converted to {arr.dtype}"
+                        ) from e
+                    mask[pos] = False
+                last = pos
+        finally:
+            src.close()
+
+        if max_row is None:
+            size = last + 1
+        if columns is None:
+            # the range ends with the last column with values
+            columns = range(min_col, max(arrays, default=min_col - 1) + 1)
+
+        result = {}
+        for col in columns:
+            if col not in arrays:
+                arrays[col] = column_array(col, size)
+            arr, mask = arrays[col]
+            arr, mask = arr[:size], mask[:size]
+            dtype = dtypes.get(col, default)
+            if dtype is None:
+                arr = _infer_array(arr, mask)
+            elif dtype != arr.dtype:
+                arr = numpy.where(mask, "", arr).astype(dtype)
+            if arr.dtype.kind in "iubUS" and mask.any():
+                arr = numpy.ma.MaskedArray(arr, mask)
+            result[get_column_letter(col)] = arr
+        return result
+
+
     def _get_cell(self, row, column):
         """Cells are returned by a generator which can be empty"""
         for row in self._cells_by_row(column, row, column, row):
@@ -190,3 +491,101 @@ class ReadOnlyWorksheet(object):
     @property
     def max_column(self):
         return self._max_column
+
+
+def _column_index(column):
+    if isinstance(column, str):
+        return column_index_from_string(column)
+    return column
+
+
+def _column_range(min_col, max_col, max_column):
+    """
+    Columns the parser has to read for a range of columns, or None for all of
+    them
+    """
+    if min_col <= 1 and (max_col is None or max_column is not None and max_col >= max_column):
+        return None
+    return range(min_col, (max_col or MAX_COLUMN) + 1)
+
+
+def _conditions(conditions):
+    """
+    Normalise a mapping of column to function
+    """
+    if not conditions:
+        return []
+    return [(_column_index(col), fn) for col, fn in conditions.items()]
+
+
+def _matches(conditions, row):
+    """
+    Check whether the values of cells parsed from a row meet all conditions
+    """
+    values = {cell['column']:cell['value'] for cell in row}
+    return all(fn(values.get(col)) for col, fn in conditions)
+
+
+def _missing_row(where, stop_when):
+    """
+    Check whether rows missing from the source stop iteration or are kept
+    """
+    stop = bool(stop_when) and _matches(stop_when, ())
+    keep = not stop and _matches(where, ())
+    return stop, keep
+
+
+def _gap_for(dtype):
+    """
+    Value used for cells missing from the source
+    """
+    if dtype.kind in "fc":
+        return float("nan")
+    elif dtype.kind in "mM":
+        return dtype.type("NaT")
+    elif dtype.kind == "O":
+        return None
+    return dtype.type()
+
+
+def _grow(arr, mask, size):
+    import numpy
+    new = numpy.empty(size, dtype=arr.dtype)
+    new[:len(arr)] = arr
+    new[len(arr):] = _gap_for(arr.dtype)
+    new_mask = numpy.ones(size, dtype=bool)
+    new_mask[:len(mask)] = mask
+    return new, new_mask
+
+
+def _infer_array(arr, mask):
+    """
+    Convert an object array to the narrowest type suitable for all its values
+    """
+    import numpy
+    from datetime import datetime, timedelta
+    from numbers import Number
+
+    values = arr[~mask]
+    if not len(values):
+        return arr
+
+    types = set(type(v) for v in values)
+    if types == {bool}:
+        dtype = bool
+    elif all(issubclass(t, Number) and t is not bool for t in types):
+        dtype = float
+        if all(issubclass(t, int) for t in types) and not mask.any():
+            dtype = numpy.int64
+    elif types == {datetime}:
+        dtype = "datetime64[us]"
+    elif types == {timedelta}:
+        dtype = "timedelta64[us]"
+    else:
+        return arr
+
+    dtype = numpy.dtype(dtype)
+    new = numpy.empty(len(arr), dtype=dtype)
+    new[:] = _gap_for(dtype)
+    new[~mask] = values.astype(dtype)
+    return new
@@ -2,10 +2,11 @@
 
 """Reader for a single worksheet."""
 from copy import copy
+from string import digits
 from warnings import warn
 
 # compatibility imports
-from openpyxl.xml.functions import iterparse
+from openpyxl.xml.functions import get_iterparse
 
 # package imports
 from openpyxl.cell import Cell, MergedCell
@@ -24,6 +25,7 @@ from openpyxl.formatting.formatting import ConditionalFormatting
 from openpyxl.formula.translate import Translator
 from openpyxl.utils import (
     get_column_letter,
+    column_index_from_string,
     coordinate_to_tuple,
     )
 from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH
@@ -100,7 +102,8 @@ class WorkSheetParser(object):
 
     def __init__(self, src, shared_strings, data_only=False,
                  epoch=WINDOWS_EPOCH, date_formats=set(),
-                 timedelta_formats=set(), rich_text=False):
+                 timedelta_formats=set(), rich_text=False, engine=None,
+                 columns=None):
         self.min_row = self.min_col = None
         self.epoch = epoch
         self.source = src
@@ -123,9 +126,15 @@ class WorkSheetParser(object):
         self.col_breaks = ColBreak()
         self.controls = None
         self.rich_text = rich_text
+        self.engine = engine
+        self.columns = columns
 
 
-    def parse(self):
+    def parse(self, values_only=False):
+        """
+        Produce the number and cells of each row. Cells are dictionaries or,
+        with `values_only`, tuples of column and value.
+        """
         dispatcher = {
             COL_TAG: self.parse_column_dimensions,
             PROT_TAG: self.parse_sheet_protection,
@@ -154,7 +163,9 @@ class WorkSheetParser(object):
             CONTROLS_TAG: ("controls", ControlList),
         }
 
-        it = iterparse(self.source) # add a finaliser to close the source when this becomes possible
+        iterparse = get_iterparse(self.engine)
+        tags = set(dispatcher) | set(properties) | {ROW_TAG}
+        it = iterparse(self.source, tag=tags) # add a finaliser to close the source when this becomes possible
 
         for _, element in it:
             tag_name = element.tag
@@ -167,7 +178,7 @@ class WorkSheetParser(object):
                 setattr(self, prop[0], obj)
                 element.clear()
             elif tag_name == ROW_TAG:
-                row = self.parse_row(element)
+                row = self.parse_row(element, values_only)
                 element.clear()
                 yield row
 
@@ -176,7 +187,10 @@ class WorkSheetParser(object):
         """
         Get worksheet dimensions if they are provided.
         """
-        it = iterparse(self.source)
+        iterparse = get_iterparse(self.engine)
+        # attributes are available at the start of an element and any
+        # dimension must appear before the data
+        it = iterparse(self.source, events=("start",), tag=(DIMENSION_TAG, DATA_TAG))
 
         for _event, element in it:
             if element.tag == DIMENSION_TAG:
@@ -186,10 +200,21 @@ class WorkSheetParser(object):
             elif element.tag == DATA_TAG:
                 # Dimensions missing
                 break
-            element.clear()
 
 
     def parse_cell(self, element):
+        row, column, value, data_type, style_id = self._parse_cell(element)
+        return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+
+
+    def parse_value(self, element):
+        """
+        Column and value of a cell
+        """
+        return self._parse_cell(element)[1:3]
+
+
+    def _parse_cell(self, element):
         data_type = element.get('t', 'n')
         coordinate = element.get('r')
         style_id = element.get('s', 0)
@@ -244,7 +269,7 @@ class WorkSheetParser(object):
                     else:
                         value = Text.from_tree(child).content
 
-        return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+        return row, column, value, data_type, style_id
 
 
     def parse_formula(self, element):
@@ -282,7 +307,7 @@ class WorkSheetParser(object):
         self.column_dimensions[column] = attrs
 
 
-    def parse_row(self, row):
+    def parse_row(self, row, values_only=False):
         attrs = dict(row.attrib)
 
         if "r" in attrs:
@@ -303,10 +328,38 @@ class WorkSheetParser(object):
             # don't create dimension objects unless they have relevant information
             self.row_dimensions[str(self.row_counter)] = attrs
 
-        cells = [self.parse_cell(el) for el in row]
+        parse = self.parse_value if values_only else self.parse_cell
+        if self.columns is None:
+            cells = [parse(el) for el in row]
+        else:
+            cells = [parse(el) for el in row if not self.skip_cell(el)]
         return self.row_counter, cells
 
 
+    def skip_cell(self, element):
+        """
+        Check whether a cell is outside the selected columns using only its
+        coordinate so that its value is never converted.
+        """
+        coordinate = element.get('r')
+        if coordinate:
+            column = column_index_from_string(coordinate.rstrip(digits))
+        else:
+            column = self.col_counter + 1
+        if column in self.columns:
+            return False
+
+        self.col_counter = column
+        # cells in selected columns may depend upon this one
+        # the formula is always the first child so avoid searching for it
+        if not self.data_only and len(element) and element[0].tag == FORMULA_TAG:
+            formula = element[0]
+            if (formula.get('t') == "shared"
+                and formula.get('si') not in self.shared_formulae):
+                self.parse_formula(element)
+        return True
+
+
     def parse_formatting(self, element):
         try:
             cf = ConditionalFormatting.from_tree(element)
@@ -359,16 +412,21 @@ class WorksheetReader(object):
     Create a parser and apply it to a workbook
     """
 
-    def __init__(self, ws, xml_source, shared_strings, data_only, rich_text):
+    def __init__(self, ws, xml_source, shared_strings, data_only, rich_text, engine=None):
         self.ws = ws
         self.parser = WorkSheetParser(xml_source, shared_strings,
                 data_only, ws.parent.epoch, ws.parent._date_formats,
-                ws.parent._timedelta_formats, rich_text)
+                ws.parent._timedelta_formats, rich_text, engine)
         self.tables = []
 
 
-    def bind_cells(self):
-        for idx, row in self.parser.parse():
+    def bind_cells(self, rows=None):
+        """
+        Create cells from the parser or from rows that have already been parsed
+        """
+        if rows is None:
+            rows = self.parser.parse()
+        for idx, row in rows:
             for cell in row:
                 style = self.ws.parent._cell_styles[cell['style_id']]
                 c = Cell(self.ws, row=cell['row'], column=cell['column'], style_array=style)
@@ -432,9 +490,8 @@ class WorksheetReader(object):
         Returns the appropriate cell to which a hyperlink, which references a merged cell at the specified coordinates,
         should be bound.
         """
-        for rng in self.ws.merged_cells:
-            if coord in rng:
-                return self.ws.cell(*rng.top[0])
+        for rng in self.ws.merged_cells.containing(coord):
+            return self.ws.cell(*rng.top[0])
 
     def bind_col_dimensions(self):
         for col, cd in self.parser.column_dimensions.items():
@@ -464,8 +521,8 @@ class WorksheetReader(object):
                 setattr(self.ws, k, v)
 
 
-    def bind_all(self):
-        self.bind_cells()
+    def bind_all(self, rows=None):
+        self.bind_cells(rows)
         self.bind_merged_cells()
         self.bind_hyperlinks()
         self.bind_formatting()
@@ -0,0 +1,217 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Checkpoints into the XML of a worksheet so that reading can start close to
+a particular row instead of at the beginning.
+"""
+
+from array import array
+from html import unescape
+import json
+import os
+import re
+from bisect import bisect_right
+
+
+ROOT_RE = re.compile(rb"<(?:[\w.-]+:)?worksheet\b[^>]*>")
+DATA_RE = re.compile(rb"<(?:[\w.-]+:)?sheetData\b[^>]*?(/?)>")
+ROW_RE = re.compile(rb"<(?:[\w.-]+:)?row(?=[\s/>])([^>]*)>")
+ROW_NUMBER_RE = re.compile(rb"""\sr\s*=\s*["']([^"']+)["']""")
+DECLARATION_RE = re.compile(rb"<\?xml[^>]*\?>")
+# the first cell of a shared formula holds its text and the range it covers
+MASTER_RE = re.compile(rb"<(?:[\w.-]+:)?f\b([^>]*\sref\s*=[^>]*)>([^<]*)<")
+SHARED_RE = re.compile(rb"""\st\s*=\s*["']shared["']""")
+SI_RE = re.compile(rb"""\ssi\s*=\s*["']([^"']*)["']""")
+CELL_RE = re.compile(rb"<(?:[\w.-]+:)?c\b([^>]*)>\s*")
+
+CHUNK_SIZE = 2**20
+
+
+class PrefixedSource:
+
+    """
+    A file-like object that returns the prefix before the rest of a stream
+    """
+
+    def __init__(self, prefix, stream):
+        self.prefix = prefix
+        self.stream = stream
+
+
+    def read(self, size=-1):
+        if not self.prefix:
+            return self.stream.read(size)
+        if size is None or size < 0:
+            data = self.prefix + self.stream.read()
+            self.prefix = b""
+            return data
+        data, self.prefix = self.prefix[:size], self.prefix[size:]
+        return data
+
+
+    def close(self):
+        self.stream.close()
+
+
+    @property
+    def closed(self):
+        return self.stream.closed
+
+
+class RowIndex:
+
+    """
+    Record the uncompressed offset of every `step` rows of a worksheet.
+
+    Parsing can resume at an offset by prepending the start tags of the
+    worksheet and its data, which are stored as the prefix.
+
+    Cells after an offset may use shared formulae defined before it so the
+    offset, identifier, coordinate and text of each of these are also kept.
+    """
+
+    version = 2
+
+    def __init__(self, prefix=b"", rows=(), offsets=(), step=1000, formulae=()):
+        self.prefix = prefix
+        self.rows = array("L", rows)
+        self.offsets = array("Q", offsets)
+        self.step = step
+        self.formulae = [tuple(f) for f in formulae]
+
+
+    @classmethod
+    def from_source(cls, src, step=1000):
+        """
+        Scan the raw XML for rows. This avoids parsing the XML.
+        """
+        index = cls(step=step)
+        buf = b""
+        pos = 0 # absolute offset of the start of the buffer
+        counter = 0 # row number as the parser would calculate it
+        seen = 0 # number of row elements
+        shared = set() # identifiers of shared formulae
+
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            buf += chunk
+            start = 0
+
+            if not index.prefix:
+                data = DATA_RE.search(buf)
+                if data is None:
+                    if not chunk:
+                        break
+                    continue
+                if data.group(1): # no rows
+                    break
+                root = ROOT_RE.search(buf)
+                decl = DECLARATION_RE.match(buf)
+                index.prefix = (decl and decl.group() or b"") + root.group() + data.group()
+                start = data.end()
+
+            end = start
+            for m in ROW_RE.finditer(buf, start):
+                number = ROW_NUMBER_RE.search(m.group(1))
+                if number is not None:
+                    counter = int(float(number.group(1)))
+                else:
+                    counter += 1
+                if seen % step == 0:
+                    index.rows.append(counter)
+                    index.offsets.append(pos + m.start())
+                seen += 1
+                end = m.end()
+
+            for m in MASTER_RE.finditer(buf, start):
+                attrs, text = m.groups()
+                si = SI_RE.search(attrs)
+                if si is None or not text or not SHARED_RE.search(attrs):
+                    continue
+                si = si.group(1).decode("utf-8")
+                # the formula is always the first child of the cell
+                cell = CELL_RE.match(buf, max(buf.rfind(b"<", 0, m.start()), 0))
+                if si in shared or cell is None or cell.end() != m.start():
+                    continue
+                coordinate = ROW_NUMBER_RE.search(cell.group(1))
+                if coordinate is None:
+                    continue
+                shared.add(si)
+                index.formulae.append((pos + cell.start(), si,
+                                       coordinate.group(1).decode("utf-8"),
+                                       unescape(text.decode("utf-8"))))
+                end = max(end, m.end())
+
+            if not chunk:
+                break
+
+            # keep anything which might be the start of a tag, and the tag
+            # before it which might be the cell of a formula
+            tail = buf.rfind(b"<", end)
+            if tail == -1:
+                tail = len(buf)
+            else:
+                cell = buf.rfind(b"<", end, tail)
+                if cell != -1:
+                    tail = cell
+            pos += tail
+            buf = buf[tail:]
+
+        return index
+
+
+    def find(self, row):
+        """
+        Return the row number and offset of the closest checkpoint before a row
+        """
+        idx = bisect_right(self.rows, row) - 1
+        if idx < 1: # no benefit in seeking to the first row
+            return
+        return self.rows[idx], self.offsets[idx]
+
+
+    def open(self, src, row):
+        """
+        Return a source positioned at the closest checkpoint before a row, the
+        row counter to use with it and the coordinate and text of the shared
+        formulae defined before it.
+        """
+        checkpoint = self.find(row)
+        if checkpoint is None:
+            return src, 0, {}
+        row, offset = checkpoint
+        src.seek(offset)
+        formulae = {si:(coordinate, text)
+                    for pos, si, coordinate, text in self.formulae if pos < offset}
+        return PrefixedSource(self.prefix, src), row - 1, formulae
+
+
+    def save(self, path):
+        data = {
+            "version": self.version,
+            "step": self.step,
+            "prefix": self.prefix.decode("latin-1"),
+            "rows": self.rows.tolist(),
+            "offsets": self.offsets.tolist(),
+            "formulae": self.formulae,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != cls.version:
+            return
+        return cls(data["prefix"].encode("latin-1"), data["rows"],
+                   data["offsets"], data["step"], data["formulae"])
+
+
+def cache_path(cache_dir, info, step):
+    """
+    Indices are identified by the checksum and size of an archive member
+    """
+    name = f"{info.CRC:08x}-{info.file_size}-{step}.json"
+    return os.path.join(cache_dir, name)
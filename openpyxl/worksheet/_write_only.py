@@ -3,16 +3,166 @@
 
 """Write worksheets to xml representations in an optimized way"""
 
+from copy import copy
+import datetime
 from inspect import isgenerator
+from math import isnan
 
 from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
+from openpyxl.cell._writer import raw_content
 from openpyxl.workbook.child import _WorkbookChild
 from .worksheet import Worksheet
-from openpyxl.utils.exceptions import WorkbookAlreadySaved
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import WINDOWS_EPOCH
+from openpyxl.utils.exceptions import (
+    IllegalCharacterError,
+    WorkbookAlreadySaved,
+)
 
 from ._writer import WorksheetWriter
 
 
+# number of rows converted at once by append_columns()
+CHUNK_ROWS = 10000
+
+
+def _excel_days(values, epoch):
+    """
+    Convert an array of datetime64 or timedelta64 values to Excel serials.
+    Missing values become NaN.
+    """
+    import numpy
+
+    day = numpy.timedelta64(1, "D")
+    if values.dtype.kind == "m":
+        return values / day
+
+    days = (values - numpy.datetime64(epoch)) / day
+    if epoch == WINDOWS_EPOCH:
+        # adjust for < 1900-03-01
+        whole = numpy.floor(days)
+        days = numpy.where((whole > 0) & (whole <= 60), days - 1, days)
+    return days
+
+
+class _ColumnWriter:
+    """
+    Serialise chunks of a column of values whose type is known.
+
+    Each value becomes None if it is missing, the markup following the row
+    index if cells are being written as text, or a cell.
+    """
+
+    def __init__(self, ws, col_idx, values, style=None, number_format=None, raw=True):
+        self.ws = ws
+        self.col_idx = col_idx
+        self.raw = raw
+
+        kind = values.dtype.kind
+        template = None
+        if kind == "M":
+            template = datetime.datetime(1900, 1, 1)
+        elif kind == "m":
+            template = datetime.timedelta()
+        elif kind in "biuf":
+            template = 0
+        self.kind = kind
+
+        cell = WriteOnlyCell(ws)
+        if style is not None:
+            cell.style = style
+        if number_format is not None:
+            cell.number_format = number_format
+        cell.value = template
+        self.style = cell._style
+        self.attrs = '"'
+        if cell.has_style:
+            self.attrs = f'" s="{cell.style_id}"'
+        self.prefix = f'<c r="{get_column_letter(col_idx)}'
+
+
+    def _cell(self, value, data_type=None):
+        cell = WriteOnlyCell(self.ws)
+        cell.column = self.col_idx
+        cell._style = copy(self.style)
+        if data_type is None:
+            cell.value = value
+        else:
+            cell._value = value
+            cell.data_type = data_type
+        return cell
+
+
+    def _number(self, value, data_type="n"):
+        if self.raw:
+            return f"{self.attrs}{raw_content(data_type, value, None)}"
+        return self._cell(value, data_type)
+
+
+    def _string(self, value):
+        value = value[:32767]
+        if ((len(value) > 1 and value.startswith("="))
+            or value in ERROR_CODES
+            or not self.raw):
+            return self._cell(value)
+        if ILLEGAL_CHARACTERS_RE.search(value):
+            raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+        return f"{self.attrs}{raw_content('s', value, self.ws.parent)}"
+
+
+    def serialise(self, values):
+        kind = self.kind
+        if kind == "b":
+            return [self._number(value, "b") for value in values.tolist()]
+
+        if kind in "iu":
+            return [self._number(value) for value in values.tolist()]
+
+        if kind in "mM":
+            values = _excel_days(values, self.ws.parent.epoch)
+            kind = "f"
+        if kind == "f":
+            return [None if isnan(value) else self._number(value)
+                    for value in values.tolist()]
+
+        row = []
+        for value in values.tolist():
+            if value is None or (type(value) is float and isnan(value)):
+                row.append(None)
+            elif type(value) is str:
+                row.append(self._string(value))
+            elif type(value) in (int, float):
+                row.append(self._number(value))
+            else:
+                row.append(self._cell(value))
+        return row
+
+
+class _SerialisedRow:
+    """
+    Cells from columns which only need the row index to be written
+    """
+
+    __slots__ = ("columns", "items")
+
+    def __init__(self, columns, items):
+        self.columns = columns
+        self.items = items
+
+
+    def cells(self, row_idx):
+        idx = str(row_idx)
+        for column, item in zip(self.columns, self.items):
+            if item is None:
+                continue
+            if isinstance(item, str):
+                yield f"{column.prefix}{idx}{item}"
+            else:
+                item.row = row_idx
+                yield item
+
+
 class WriteOnlyWorksheet(_WorkbookChild):
     """
     Streaming worksheet. Optimised to reduce memory by writing rows just in
@@ -24,9 +174,11 @@ class WriteOnlyWorksheet(_WorkbookChild):
     __saved = False
     _writer = None
     _rows = None
+    reorder_window = 1000
     _rel_type = Worksheet._rel_type
     _path = Worksheet._path
     mime_type = Worksheet.mime_type
+    _raw_drawing = None
 
     # copy methods from Standard worksheet
     _add_row = Worksheet._add_row
@@ -47,6 +199,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
         super(WriteOnlyWorksheet, self).__init__(parent, title)
         self._max_col = 0
         self._max_row = 0
+        self._pending = {}
         self._setup()
 
     @property
@@ -64,13 +217,16 @@ class WriteOnlyWorksheet(_WorkbookChild):
             self._already_saved()
 
         with xf.element("sheetData"):
-            row_idx = 1
             try:
                 while True:
                     row = (yield)
-                    row = self._values_to_row(row, row_idx)
+                    row_idx = self._max_row + 1
+                    if isinstance(row, _SerialisedRow):
+                        row = row.cells(row_idx)
+                    else:
+                        row = self._values_to_row(row, row_idx)
                     self._writer.write_row(xf, row, row_idx)
-                    row_idx += 1
+                    self._max_row = row_idx
             except GeneratorExit:
                 pass
 
@@ -89,6 +245,9 @@ class WriteOnlyWorksheet(_WorkbookChild):
 
         self._get_writer()
 
+        if self._pending:
+            self._flush_pending(all=True)
+
         if self._rows is None:
             self._writer.write_rows()
         else:
@@ -110,14 +269,146 @@ class WriteOnlyWorksheet(_WorkbookChild):
             not isinstance(row, (list, tuple, range))
             ):
             self._invalid_row(row)
+        self._check_pending()
+
+        self._start_rows()
+        self._rows.send(row)
+
+
+    def append_at(self, row_idx, row):
+        """
+        Append a row which may arrive before the rows above it.
+
+        Rows are kept until all the rows above them have been appended, but
+        no more than `reorder_window` rows beyond the last one written.
+        Any rows which are missing when the worksheet is closed are left
+        empty.
+
+        :param row_idx: the index of the row starting from 1
+        :type row_idx: int
+
+        :param row: iterable containing values to append
+        :type row: iterable
+        """
+        if (not isgenerator(row) and
+            not isinstance(row, (list, tuple, range))
+            ):
+            self._invalid_row(row)
+        if row_idx <= self._max_row:
+            raise ValueError(f"Row {row_idx} has already been written")
+        if row_idx > self._max_row + self.reorder_window:
+            raise ValueError(
+                f"Row {row_idx} is more than {self.reorder_window} rows after row {self._max_row}"
+            )
+        if row_idx in self._pending:
+            raise ValueError(f"Row {row_idx} has already been appended")
+
+        self._start_rows()
+        self._pending[row_idx] = row
+        self._flush_pending()
+
+
+    def _flush_pending(self, all=False):
+        """
+        Write rows which follow the last row written, or all of them
+        """
+        pending = self._pending
+        if all:
+            for row_idx in sorted(pending):
+                self._max_row = row_idx - 1
+                self._rows.send(pending[row_idx])
+            pending.clear()
+            return
+
+        while self._max_row + 1 in pending:
+            self._rows.send(pending.pop(self._max_row + 1))
+
+
+    def _check_pending(self):
+        if self._pending:
+            raise ValueError("Rows appended with append_at() are waiting to be written")
+
 
+    def _start_rows(self):
         self._get_writer()
 
         if self._rows is None:
             self._rows = self._write_rows()
             next(self._rows)
 
-        self._rows.send(row)
+
+    def append_columns(self, columns, styles=None, number_formats=None, min_col=1):
+        """
+        Append rows from columns of values such as NumPy arrays.
+
+        The type of each column is decided once from its dtype, so that
+        values can be written without inspecting each of them. Dates and
+        times are converted to Excel serials. Missing values (None, NaN and
+        NaT) are skipped.
+
+        :param columns: columns of equal length
+        :type columns: sequence of arrays or sequences
+
+        :param styles: optional named style, or its name, for each column
+        :type styles: sequence
+
+        :param number_formats: optional number format for each column
+        :type number_formats: sequence
+
+        :param min_col: the column of the first values
+        :type min_col: int
+        """
+        import numpy
+
+        columns = [numpy.asarray(col) if hasattr(col, "dtype")
+                   else numpy.asarray(col, dtype=object)
+                   for col in columns]
+        lengths = {len(col) for col in columns}
+        if len(lengths) > 1:
+            raise ValueError("Columns must all have the same length")
+        if styles is None:
+            styles = [None] * len(columns)
+        elif len(styles) != len(columns):
+            raise ValueError("There must be a style for each column")
+        if number_formats is None:
+            number_formats = [None] * len(columns)
+        elif len(number_formats) != len(columns):
+            raise ValueError("There must be a number format for each column")
+        self._check_pending()
+
+        self._start_rows()
+
+        raw = self._writer._raw is not None
+        writers = [_ColumnWriter(self, idx, col, style, fmt, raw)
+                   for idx, (col, style, fmt)
+                   in enumerate(zip(columns, styles, number_formats), min_col)]
+
+        size = lengths.pop() if lengths else 0
+        for start in range(0, size, CHUNK_ROWS):
+            chunks = [writer.serialise(col[start:start+CHUNK_ROWS])
+                      for writer, col in zip(writers, columns)]
+            for items in zip(*chunks):
+                self._rows.send(_SerialisedRow(writers, items))
+
+
+    def append_frame(self, df, index=False, header=True, styles=None):
+        """
+        Append a pandas DataFrame using :meth:`append_columns`
+
+        :param index: include the index as the first columns
+        :type index: bool
+
+        :param header: include the column names as the first row(s)
+        :type header: bool
+
+        :param styles: optional named style, or its name, for each column
+            including those of the index
+        :type styles: sequence
+        """
+        from openpyxl.utils.dataframe import write_dataframe
+
+        write_dataframe(self, df, index=index, header=header,
+                        start=f"A{self._max_row + 1}", styles=styles)
 
 
     def _values_to_row(self, values, row_idx):
@@ -1,10 +1,11 @@
 # Copyright (c) 2010-2024 openpyxl
 
 import atexit
-from collections import defaultdict
+from heapq import merge
 from io import BytesIO
+from operator import itemgetter
 import os
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
 from warnings import warn
 
 from openpyxl.xml.functions import xmlfile
@@ -21,7 +22,8 @@ from .merge import MergeCell, MergeCells
 from .related import Related
 from .table import TablePartList
 
-from openpyxl.cell._writer import write_cell
+from openpyxl import LXML
+from openpyxl.cell._writer import write_cell, raw_write_cell
 
 
 ALL_TEMP_FILES = []
@@ -52,7 +54,11 @@ class WorksheetWriter:
         self.controls = []
         self.control_images = []
         if out is None:
-            out = create_temporary_file()
+            spool_size = ws.parent.spool_size
+            if spool_size is None:
+                out = create_temporary_file()
+            else:
+                out = SpooledTemporaryFile(max_size=spool_size)
         self.out = out
         self._rels = RelationshipList()
         self.xf = self.get_stream()
@@ -108,23 +114,25 @@ class WorksheetWriter:
 
     def rows(self):
         """Return all rows, and any cells that they contain"""
-        # order cells by row
-        rows = defaultdict(list)
-        for (row, col), cell in sorted(self.ws._cells.items()):
-            rows[row].append(cell)
+        return list(self.iter_rows())
 
-        # add empty rows if styling has been applied
-        for row in self.ws.row_dimensions.keys() - rows.keys():
-            rows[row] = []
 
-        return sorted(rows.items())
+    def iter_rows(self):
+        """
+        Return all rows in order, and any cells that they contain
+        """
+        cells = self.ws._cells
+        # add empty rows if styling has been applied
+        empty = sorted(self.ws.row_dimensions.keys() - cells.rows.keys())
+        return merge(cells.sorted_rows(), ((row, []) for row in empty),
+                     key=itemgetter(0))
 
 
     def write_rows(self):
         xf = self.xf.send(True)
 
         with xf.element("sheetData"):
-            for row_idx, row in self.rows():
+            for row_idx, row in self.iter_rows():
                 self.write_row(xf, row, row_idx)
 
         self.xf.send(None) # return control to generator
@@ -137,7 +145,11 @@ class WorksheetWriter:
 
         with xf.element("row", attrs):
 
+            raw = []
             for cell in row:
+                if isinstance(cell, str): # already serialised
+                    raw.append(cell)
+                    continue
                 if cell._comment is not None:
                     comment = CommentRecord.from_cell(cell)
                     self.ws._comments.append(comment)
@@ -147,7 +159,26 @@ class WorksheetWriter:
                     and not cell._comment
                     ):
                     continue
-                write_cell(xf, self.ws, cell, cell.has_style)
+                styled = cell.has_style
+                if self._raw is not None:
+                    text = raw_write_cell(cell, styled)
+                    if text is not None:
+                        raw.append(text)
+                        continue
+                    self.write_raw(xf, raw)
+                write_cell(xf, self.ws, cell, styled)
+            self.write_raw(xf, raw)
+
+
+    def write_raw(self, xf, raw):
+        """
+        Write serialised cells directly to the output
+        """
+        if raw:
+            xf.flush()
+            # lxml writes ASCII
+            self._raw.write("".join(raw).encode("ascii", "xmlcharrefreplace"))
+            raw.clear()
 
 
     def write_protection(self):
@@ -245,7 +276,8 @@ class WorksheetWriter:
 
 
     def write_drawings(self):
-        if self.ws._charts or self.ws._images or self.ws._shapes:
+        if (self.ws._charts or self.ws._images or self.ws._shapes
+            or self.ws._raw_drawing is not None):
             rel = Relationship(type="drawing", Target="")
             self._rels.append(rel)
             drawing = Related()
@@ -321,19 +353,28 @@ class WorksheetWriter:
 
 
     def get_stream(self):
-        with xmlfile(self.out) as xf:
-            with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
-                try:
-                    while True:
-                        el = (yield)
-                        if el is True:
-                            yield xf
-                        elif el is None: # et_xmlfile chokes
-                            continue
-                        else:
-                            xf.write(el)
-                except GeneratorExit:
-                    pass
+        out = self.out
+        if LXML and isinstance(out, str):
+            out = open(out, "wb")
+        # lxml can be flushed so that cells can be written directly
+        self._raw = out if LXML else None
+        try:
+            with xmlfile(out) as xf:
+                with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
+                    try:
+                        while True:
+                            el = (yield)
+                            if el is True:
+                                yield xf
+                            elif el is None: # et_xmlfile chokes
+                                continue
+                            else:
+                                xf.write(el)
+                    except GeneratorExit:
+                        pass
+        finally:
+            if out is not self.out:
+                out.close()
 
 
     def write_tail(self):
@@ -413,6 +454,9 @@ class WorksheetWriter:
         self.close()
         if isinstance(self.out, BytesIO):
             return self.out.getvalue()
+        if not isinstance(self.out, str):
+            self.out.seek(0)
+            return self.out.read()
         with open(self.out, "rb") as src:
             out = src.read()
 
@@ -423,5 +467,8 @@ class WorksheetWriter:
         """
         Remove tempfile
         """
+        if not isinstance(self.out, str):
+            self.out.close()
+            return
         os.remove(self.out)
         ALL_TEMP_FILES.remove(self.out)
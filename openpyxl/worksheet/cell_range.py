@@ -2,6 +2,7 @@
 
 from copy import copy
 from operator import attrgetter
+import weakref
 
 from openpyxl.descriptors import Strict
 from openpyxl.descriptors import MinMax
@@ -15,6 +16,36 @@ from openpyxl.utils import (
     quote_sheetname,
 )
 
+
+def _watch(obj, owner):
+    """
+    Tell an index owner when an object it has indexed is changed
+    """
+    owners = obj.__dict__.setdefault("_owners", [])
+    if not any(ref() is owner for ref in owners):
+        owners.append(weakref.ref(owner))
+
+
+def _changed(obj):
+    """
+    Make the indexes which contain an object out of date
+    """
+    for ref in obj.__dict__.get("_owners", ()):
+        owner = ref()
+        if owner is not None:
+            owner._changed()
+
+
+class _Bound(MinMax):
+    """
+    Bound of a range which may be in the index of a MultiCellRange
+    """
+
+    def __set__(self, instance, value):
+        super().__set__(instance, value)
+        _changed(instance)
+
+
 class CellRange(Serialisable):
     """
     Represents a range in a sheet: title and coordinates.
@@ -39,10 +70,10 @@ class CellRange(Serialisable):
 
     """
 
-    min_col = MinMax(min=1, max=18278, expected_type=int)
-    min_row = MinMax(min=1, max=1048576, expected_type=int)
-    max_col = MinMax(min=1, max=18278, expected_type=int)
-    max_row = MinMax(min=1, max=1048576, expected_type=int)
+    min_col = _Bound(min=1, max=18278, expected_type=int)
+    min_row = _Bound(min=1, max=1048576, expected_type=int)
+    max_col = _Bound(min=1, max=18278, expected_type=int)
+    max_row = _Bound(min=1, max=1048576, expected_type=int)
 
 
     def __init__(self, range_string=None, min_col=None, min_row=None,
@@ -422,6 +453,90 @@ class CellRange(Serialisable):
         return [(row, self.max_col) for row in range(self.min_row, self.max_row+1)]
 
 
+class RangeIndex:
+    """
+    Index of the bounds of cell ranges for finding those which intersect a
+    cell or range.
+
+    Ranges are kept in grids of square blocks. Each range is put into the
+    grid whose blocks are at least as large as the range so that it is in at
+    most four blocks. Looking up a cell only needs one block from each grid
+    and the number of grids is logarithmic in the size of the worksheet.
+    """
+
+    def __init__(self, items=()):
+        self._grids = {} # level: {(block row, block column): [entries]}
+        self._count = 0
+        for bounds, item in items:
+            self.add(bounds, item)
+
+
+    @staticmethod
+    def _level(bounds):
+        min_col, min_row, max_col, max_row = bounds
+        size = max(max_col - min_col, max_row - min_row) + 1
+        return (size - 1).bit_length()
+
+
+    @staticmethod
+    def _blocks(level, bounds):
+        min_col, min_row, max_col, max_row = bounds
+        cols = range((min_col - 1) >> level, ((max_col - 1) >> level) + 1)
+        rows = range((min_row - 1) >> level, ((max_row - 1) >> level) + 1)
+        return [(row, col) for row in rows for col in cols]
+
+
+    def add(self, bounds, item):
+        level = self._level(bounds)
+        grid = self._grids.setdefault(level, {})
+        entry = (bounds, self._count, item)
+        self._count += 1
+        for block in self._blocks(level, bounds):
+            grid.setdefault(block, []).append(entry)
+
+
+    def remove(self, bounds, item):
+        """
+        Remove an item which is equal to the one given
+        """
+        level = self._level(bounds)
+        grid = self._grids.get(level, {})
+        for block in self._blocks(level, bounds):
+            entries = grid.get(block, [])
+            for entry in entries:
+                if entry[0] == bounds and entry[2] == item:
+                    entries.remove(entry)
+                    break
+            if not entries:
+                grid.pop(block, None)
+        if not grid:
+            self._grids.pop(level, None)
+
+
+    def intersecting(self, bounds):
+        """
+        Return the items whose ranges intersect the bounds in the order they
+        were added
+        """
+        min_col, min_row, max_col, max_row = bounds
+        found = {}
+        for level, grid in self._grids.items():
+            blocks = ((((max_row - 1) >> level) - ((min_row - 1) >> level) + 1)
+                      * (((max_col - 1) >> level) - ((min_col - 1) >> level) + 1))
+            if blocks <= len(grid):
+                entries = (grid.get(block) for block in self._blocks(level, bounds))
+            else:
+                entries = grid.values()
+            for block in entries:
+                if not block:
+                    continue
+                for (lo_col, lo_row, hi_col, hi_row), order, item in block:
+                    if (lo_row <= max_row and hi_row >= min_row
+                        and lo_col <= max_col and hi_col >= min_col):
+                        found[order] = item
+        return [found[order] for order in sorted(found)]
+
+
 class MultiCellRange(Strict):
 
 
@@ -432,15 +547,60 @@ class MultiCellRange(Strict):
         if isinstance(ranges, str):
             ranges = [CellRange(r) for r in ranges.split()]
         self.ranges = set(ranges)
+        self._index = None
+        self._indexed = None
+        self._version = 0
 
 
-    def __contains__(self, coord):
+    def _changed(self):
+        """
+        One of the ranges has been changed
+        """
+        self._version += 1
+
+
+    def _get_index(self):
+        """
+        Index of the ranges. This is rebuilt if any range or the set of
+        ranges has been changed other than with `add()` or `remove()`
+        """
+        if (self._index is None
+            or self._indexed[0] is not self.ranges
+            or self._indexed[1:] != (len(self.ranges), self._version)):
+            for r in self.ranges:
+                _watch(r, self)
+            self._index = RangeIndex((r.bounds, r) for r in self.ranges)
+            self._index_updated()
+        return self._index
+
+
+    def _index_updated(self):
+        """
+        The index has been updated along with the ranges
+        """
+        self._indexed = self.ranges, len(self.ranges), self._version
+
+
+    def intersecting(self, coord):
+        """
+        Return the ranges which have any cells in common with a cell or range
+        """
+        if isinstance(coord, str):
+            coord = CellRange(coord)
+        return self._get_index().intersecting(coord.bounds)
+
+
+    def containing(self, coord):
+        """
+        Return the ranges which contain a cell or range
+        """
         if isinstance(coord, str):
             coord = CellRange(coord)
-        for r in self.ranges:
-            if coord <= r:
-                return True
-        return False
+        return [r for r in self.intersecting(coord) if coord <= r]
+
+
+    def __contains__(self, coord):
+        return bool(self.containing(coord))
 
 
     def __repr__(self):
@@ -474,7 +634,11 @@ class MultiCellRange(Strict):
         elif not isinstance(coord, CellRange):
             raise ValueError("You can only add CellRanges")
         if cr not in self:
+            index = self._get_index()
             self.ranges.add(cr)
+            _watch(cr, self)
+            index.add(cr.bounds, cr)
+            self._index_updated()
 
 
     def __iadd__(self, coord):
@@ -499,7 +663,10 @@ class MultiCellRange(Strict):
     def remove(self, coord):
         if not isinstance(coord, CellRange):
             coord = CellRange(coord)
+        index = self._get_index()
         self.ranges.remove(coord)
+        index.remove(coord.bounds, coord)
+        self._index_updated()
 
 
     def __iter__(self):
@@ -381,8 +381,70 @@ class TestMultiCellRange:
         assert list(cells) == [CellRange("A1")]
 
 
+    def test_containing(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2 D4 C1:C100000 A5:XFD5")
+        assert cells.containing("C50") == [CellRange("C1:C100000")]
+        assert cells.containing("D5:E5") == [CellRange("A5:XFD5")]
+        assert cells.containing("B2:C2") == []
+        assert set(cells.intersecting("B2:C5")) == {
+            CellRange("A1:B2"), CellRange("C1:C100000"), CellRange("A5:XFD5")
+        }
+        cells.add("E10:F11")
+        cells.remove("D4")
+        assert cells.containing("F11") == [CellRange("E10:F11")]
+        assert cells.containing("D4") == []
+
+
+    def test_index_rebuilt(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1")
+        assert "A1" in cells
+        cells.ranges = {CellRange("B2")}
+        assert "A1" not in cells
+        assert "B2" in cells
+
+
+    def test_index_after_mutation(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2 D4:E5")
+        assert "A1" in cells
+        cr = cells.containing("A1")[0]
+        cr.shift(row_shift=10)
+        assert "A1" not in cells
+        assert "A11" in cells
+        cr.expand(down=5)
+        assert "B17" in cells
+        cr.shrink(bottom=5)
+        assert "B17" not in cells
+        cr.min_row = 1
+        assert "A1" in cells
+
+
+    def test_index_scoped(self, MultiCellRange, CellRange):
+        cells = MultiCellRange("A1:B2")
+        other = MultiCellRange("D4")
+        assert "D4" in other
+        index = other._get_index()
+        cr = cells.containing("A1")[0]
+        cr.shift(row_shift=10)
+        assert "A11" in cells
+        assert other._get_index() is index
+
+
     def test_copy(self, MultiCellRange, CellRange):
         r1 = MultiCellRange("A1")
         from copy import copy
         r2 = copy(r1)
         assert list(r1)[0] is not list(r2)[0]
+
+
+class TestRangeIndex:
+
+    def test_intersecting(self):
+        from ..cell_range import RangeIndex
+        index = RangeIndex([((1, 1, 2, 2), "a"), ((3, 1, 3, 1048576), "b")])
+        index.add((1, 3, 16384, 3), "c")
+        assert index.intersecting((2, 2, 2, 2)) == ["a"]
+        assert index.intersecting((1, 1, 16384, 1048576)) == ["a", "b", "c"]
+        assert index.intersecting((3, 3, 3, 3)) == ["b", "c"]
+        index.remove((3, 1, 3, 1048576), "b")
+        assert index.intersecting((3, 500, 3, 500)) == []
+        assert index.intersecting((4, 4, 5, 5)) == []
@@ -0,0 +1,277 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import copy
+
+import pytest
+
+
+@pytest.fixture
+def CellStore():
+    from .._cell_store import CellStore
+    return CellStore
+
+
+class TestCellStore:
+
+    def test_ctor(self, CellStore):
+        cells = CellStore()
+        assert cells.row_range is None
+        assert cells.col_range is None
+
+
+    def test_set(self, CellStore):
+        cells = CellStore({(2, 3): "a"})
+        cells[5, 1] = "b"
+        cells[5, 1] = "c"
+        assert cells.rows == {2: 1, 5: 1}
+        assert cells.columns == {1: 1, 3: 1}
+        assert cells.row_range == (2, 5)
+        assert cells.col_range == (1, 3)
+        cells[1, 4] = "d"
+        assert cells.row_range == (1, 5)
+        assert cells.col_range == (1, 4)
+
+
+    def test_delete(self, CellStore):
+        cells = CellStore({(1, 1): "a", (3, 1): "b", (3, 2): "c"})
+        del cells[3, 2]
+        assert cells.row_range == (1, 3)
+        assert cells.col_range == (1, 1)
+        cells.pop((3, 1))
+        assert cells.row_range == (1, 1)
+        assert cells.pop((3, 1), None) is None
+        cells.popitem()
+        assert cells.row_range is None
+        assert cells.rows == {}
+
+
+    def test_clear(self, CellStore):
+        cells = CellStore({(1, 1): "a"})
+        cells.clear()
+        assert cells.col_range is None
+        cells.setdefault((4, 4), "b")
+        assert cells.row_range == (4, 4)
+
+
+    @pytest.mark.parametrize("start, offset, axis, expected",
+                             [
+                                 (2, 1, 0, {(1, 1): "a", (4, 1): "b", (4, 2): "c"}),
+                                 (2, 1, 1, {(1, 1): "a", (3, 1): "b", (3, 3): "c"}),
+                                 (3, -1, 0, {(1, 1): "a", (2, 1): "b", (2, 2): "c"}),
+                                 (2, -1, 1, {(3, 1): "c"}),
+                             ]
+                             )
+    def test_shift(self, CellStore, start, offset, axis, expected):
+        from openpyxl.cell import Cell
+        cells = CellStore()
+        for (row, column), value in {(1, 1): "a", (3, 1): "b", (3, 2): "c"}.items():
+            cells[row, column] = Cell(None, row=row, column=column, value=value)
+        cells.shift(start, offset, axis)
+        assert {key: cell.value for key, cell in cells.items()} == expected
+        assert all(key == (cell.row, cell.column) for key, cell in cells.items())
+        assert cells.row_range == (min(cells.rows), max(cells.rows))
+
+
+    def test_copy(self, CellStore):
+        cells = CellStore({(1, 1): "a", (2, 2): "b"})
+        cp = copy.copy(cells)
+        assert cp == cells
+        assert cp.rows == {1: 1, 2: 1}
+
+
+def test_worksheet_bounds():
+    from openpyxl import Workbook
+
+    ws = Workbook().active
+    ws["C3"] = 1
+    ws["E7"] = 2
+    assert (ws.min_row, ws.max_row, ws.min_column, ws.max_column) == (3, 7, 3, 5)
+    assert ws.calculate_dimension() == "C3:E7"
+    del ws["E7"]
+    assert ws.calculate_dimension() == "C3:C3"
+    ws.delete_rows(3)
+    assert ws.calculate_dimension() == "A1:A1"
+    assert ws.max_row == 1
+
+
+@pytest.fixture
+def CompactWorksheet():
+    from openpyxl import Workbook
+    return Workbook(compact_cells=True).active
+
+
+class TestColumnarCellStore:
+
+    def test_ctor(self, CompactWorksheet):
+        from .._cell_store import ColumnarCellStore
+        cells = CompactWorksheet._cells
+        assert isinstance(cells, ColumnarCellStore)
+        assert len(cells) == 0
+        assert cells.row_range is None
+
+
+    @pytest.mark.parametrize("value, data_type",
+                             [
+                                 (1.5, "n"),
+                                 (2**60, "n"),
+                                 (-3, "n"),
+                                 (True, "b"),
+                                 ("text", "s"),
+                                 ("=SUM(A1:A2)", "f"),
+                                 (None, "n"),
+                             ]
+                             )
+    def test_values(self, CompactWorksheet, value, data_type):
+        ws = CompactWorksheet
+        ws["B200"] = value
+        cell = ws["B200"]
+        assert cell.value == value
+        assert type(cell.value) is type(value)
+        assert cell.data_type == data_type
+        assert (200, 2) in ws._cells
+
+
+    def test_style(self, CompactWorksheet):
+        from openpyxl.styles import Font
+        ws = CompactWorksheet
+        ws["A1"] = 1
+        ws["A1"].font = Font(bold=True)
+        ws["A1"].number_format = "0.00"
+        assert ws["A1"].font.b is True
+        assert ws["A1"].number_format == "0.00"
+        assert ws["A2"].has_style is False
+
+
+    def test_extras(self, CompactWorksheet):
+        from openpyxl.comments import Comment
+        ws = CompactWorksheet
+        ws["A1"].hyperlink = "http://example.com"
+        ws["A2"].comment = Comment("note", "author")
+        assert ws["A1"].hyperlink.target == "http://example.com"
+        assert ws["A2"].comment.text == "note"
+        del ws["A2"]
+        assert ws._cells.comments == {}
+
+
+    def test_views(self, CompactWorksheet):
+        ws = CompactWorksheet
+        c1 = ws["C3"]
+        c2 = ws.cell(3, 3)
+        assert c1 == c2
+        assert c1 is not c2
+        c1.value = 4
+        assert c2.value == 4
+
+
+    def test_delete(self, CompactWorksheet):
+        ws = CompactWorksheet
+        ws["A1"] = 1
+        ws["A300"] = 2
+        del ws["A300"]
+        assert len(ws._cells) == 1
+        assert list(ws._cells) == [(1, 1)]
+        assert ws.max_row == 1
+
+
+    def test_removed_view(self, CompactWorksheet):
+        ws = CompactWorksheet
+        ws["C5"] = 1
+        view = ws["C5"]
+        del ws._cells[5, 3]
+        assert view.value is None
+        assert view.data_type == "n"
+        assert view.has_style is False
+        assert 3 not in ws._cells._data
+        view.value = 9
+        assert ws["C5"].value == 9
+        assert len(ws._cells) == 1
+        assert ws.max_row == 5
+
+
+    def test_view_of_deleted_row(self, CompactWorksheet):
+        from openpyxl.styles import Font
+        ws = CompactWorksheet
+        ws["A1"] = 1
+        view = ws["B3"]
+        ws.delete_rows(3)
+        assert ws._cells._data.get(2) is None
+        view.font = Font(bold=True)
+        assert ws["B3"].font.b is True
+        assert len(ws._cells) == 2
+        assert ws.max_row == 3
+
+
+    def test_move(self, CompactWorksheet):
+        ws = CompactWorksheet
+        ws["A1"] = "a"
+        ws["A1"].hyperlink = "http://example.com"
+        ws["B2"] = 5
+        ws.insert_rows(1)
+        assert ws["A1"].value is None
+        assert ws["A2"].value == "a"
+        assert ws["A2"].hyperlink.target == "http://example.com"
+        assert ws["B3"].value == 5
+        assert ws.max_row == 3
+
+
+    def test_shift(self, CompactWorksheet):
+        ws = CompactWorksheet
+        ws["A1"] = 1
+        ws["A130"] = "a"
+        ws["A130"].hyperlink = "http://example.com"
+        ws["B300"] = 2.5
+        ws._cells.shift(2, 100)
+        assert ws["A230"].value == "a"
+        assert ws["A230"].hyperlink.target == "http://example.com"
+        assert ws["B400"].value == 2.5
+        ws._cells.shift(200, -150)
+        assert ws["A80"].value == "a"
+        assert ws.max_row == 250
+        ws._cells.shift(1, 2, axis=1)
+        assert ws["D250"].value == 2.5
+        assert ws["A1"].value is None
+        assert len(ws._cells) == 4
+
+
+    def test_merge(self, CompactWorksheet):
+        from openpyxl.cell.cell import MergedCell
+        ws = CompactWorksheet
+        ws["A1"] = 1
+        ws["B1"] = 2
+        ws.merge_cells("A1:B2")
+        assert isinstance(ws["B1"], MergedCell)
+        assert ws["A1"].value == 1
+        rows = dict(ws._cells.sorted_rows())
+        assert [c.coordinate for c in rows[1]] == ["A1", "B1"]
+
+
+    def test_sorted_rows(self, CompactWorksheet):
+        ws = CompactWorksheet
+        ws["B130"] = 3
+        ws["C1"] = 2
+        ws["A1"] = 1
+        rows = [(idx, [c.coordinate for c in cells])
+                for idx, cells in ws._cells.sorted_rows()]
+        assert rows == [(1, ["A1", "C1"]), (130, ["B130"])]
+
+
+def test_compact_roundtrip(tmpdir):
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.styles import Font
+
+    wb = Workbook(compact_cells=True)
+    ws = wb.active
+    ws.append(["name", "value"])
+    for idx in range(300):
+        ws.append([f"row {idx}", idx * 0.5])
+    ws["B2"].font = Font(italic=True)
+    path = str(tmpdir.join("compact.xlsx"))
+    wb.save(path)
+
+    wb = load_workbook(path, compact_cells=True)
+    ws = wb.active
+    assert wb.compact_cells is True
+    assert ws.max_row == 301
+    assert ws["A300"].value == "row 298"
+    assert ws["B301"].value == 149.5
+    assert ws["B2"].font.i is True
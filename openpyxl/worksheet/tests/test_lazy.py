@@ -0,0 +1,131 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from openpyxl.cell import Cell
+from openpyxl.comments import Comment
+from openpyxl.worksheet._cell_store import CellView
+from openpyxl.workbook import Workbook
+
+
+@pytest.fixture
+def LazyWorksheet():
+    from .._lazy import LazyWorksheet
+    return LazyWorksheet
+
+
+class TestLazyWorksheet:
+
+    def test_ctor(self, LazyWorksheet):
+        wb = Workbook()
+        calls = []
+        ws = LazyWorksheet(wb, "Lazy", "xl/worksheets/sheet1.xml", lambda ws, path: calls.append(path))
+        assert ws.title == "Lazy"
+        assert ws.sheet_state == "visible"
+        assert not ws._loaded
+        assert "_cells" not in ws.__dict__
+        assert calls == []
+
+
+    def test_load_on_read(self, LazyWorksheet):
+        wb = Workbook()
+        calls = []
+
+        def loader(ws, path):
+            calls.append(path)
+            ws["A1"] = 5
+
+        ws = LazyWorksheet(wb, "Lazy", "xl/worksheets/sheet1.xml", loader)
+        ws.print_area = "A1:B2"
+        assert not ws._loaded
+
+        assert ws.max_row == 1
+        assert ws._loaded
+        assert ws["A1"].value == 5
+        assert ws.print_area == "'Lazy'!$A$1:$B$2"
+        assert calls == ["xl/worksheets/sheet1.xml"]
+
+
+    def test_load_on_write(self, LazyWorksheet):
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", lambda ws, path: ws.append([1, 2]))
+        ws.sheet_properties = None
+        assert ws._loaded
+        assert ws.sheet_properties is None
+        assert ws.max_column == 2
+
+
+    def test_missing_attribute(self, LazyWorksheet):
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", lambda ws, path: None)
+        with pytest.raises(AttributeError):
+            ws.no_such_attribute
+        assert ws._loaded
+
+
+def load(ws, path):
+    ws.append(["a", 1])
+    ws["A1"].comment = Comment("note", "author")
+
+
+class TestTracking:
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_read(self, LazyWorksheet, compact):
+        wb = Workbook(compact_cells=compact)
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", load)
+        assert ws["B1"].value == 1
+        assert [c.value for c in ws[1]] == ["a", 1]
+        assert ws["C5"].value is None
+        assert ws["B1"].data_type == "n"
+        assert ws.max_row == 5
+        assert ws._loaded
+        assert not ws._changed
+
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_write_cell(self, LazyWorksheet, compact):
+        wb = Workbook(compact_cells=compact)
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", load)
+        cell = ws["B1"]
+        cell.value = 2
+        assert ws._changed
+        # cells are no longer tracked
+        assert type(ws["B1"]) is (CellView if compact else Cell)
+
+
+    def test_read_comment(self, LazyWorksheet):
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", load)
+        assert ws["B1"].comment is None
+        assert not ws._changed
+        ws["A1"].comment.text = "changed"
+        assert ws._changed
+
+
+    def test_use_attribute(self, LazyWorksheet):
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", load)
+        ws.title = "Renamed"
+        assert not ws._changed
+        ws.row_dimensions[1].height = 20
+        assert ws._changed
+        assert ws.row_dimensions[1].height == 20
+        assert "row_dimensions" not in ws._unused
+        assert "column_dimensions" in ws._unused
+
+
+    def test_set_attribute(self, LazyWorksheet):
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", load)
+        ws["A1"]
+        ws.freeze_panes = "B2"
+        assert ws._changed
+        assert ws.freeze_panes == "B2"
+
+
+    def test_delete(self, LazyWorksheet):
+        wb = Workbook()
+        ws = LazyWorksheet(wb, "Lazy", "sheet1.xml", load)
+        del ws["A1"]
+        assert ws._changed
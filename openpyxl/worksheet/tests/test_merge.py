@@ -213,3 +213,12 @@ class TestMergedCellRange:
 
         mcr.format()
         assert ws["C3"].border.bottom == Side(style="thin")
+
+
+def test_expand_merged_range():
+    from openpyxl import Workbook
+    ws = Workbook().active
+    ws.merge_cells("A1:B2")
+    mcr = ws.merged_cells.containing("A1")[0]
+    mcr.expand(down=5)
+    assert "A6" in ws.merged_cells
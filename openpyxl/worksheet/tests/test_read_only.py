@@ -219,6 +219,307 @@ class TestReadOnlyWorksheet:
         assert src.closed
 
 
+@pytest.mark.numpy_required
+class TestToArrays:
+
+    def test_shared_formulae(self, SharedFormulaWorksheet):
+        ws = SharedFormulaWorksheet
+        ws.build_row_index(step=10)
+        arrays = ws.to_arrays(min_row=25, max_row=26, columns=["B"])
+        assert arrays["B"].tolist() == ["=A25*2", "=A26*2"]
+
+
+    def test_all_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        arrays = ws.to_arrays(min_row=2)
+        assert list(arrays) == ["A", "B", "C"]
+        assert arrays["A"].dtype.kind == "f"
+        assert arrays["A"].tolist()[:3] == [1, 4, 7]
+
+
+    def test_select_columns(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        arrays = ws.to_arrays(min_row=2, max_row=4, columns=["C", 1], dtypes={"A":"int32"})
+        assert list(arrays) == ["C", "A"]
+        assert arrays["A"].dtype.name == "int32"
+        assert arrays["A"].tolist() == [1, 4, 7]
+
+
+    def test_gaps(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        arrays = ws.to_arrays(min_row=4, max_row=6, columns=["A"], dtypes="int64")
+        arr = arrays["A"]
+        assert arr.mask.tolist() == [False, True, True]
+        assert arr[0] == 7
+
+
+    def test_dates(self):
+        import numpy
+        from openpyxl import Workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.append([datetime.datetime(2024, 1, 1)])
+        ws.append([None])
+        ws.append([datetime.datetime(2024, 1, 3)])
+        out = BytesIO()
+        wb.save(out)
+
+        wb = load_workbook(out, read_only=True)
+        arr = wb.active.to_arrays()["A"]
+        assert arr.dtype.kind == "M"
+        assert numpy.isnat(arr[1])
+        assert arr[2] == numpy.datetime64("2024-01-03")
+
+
+    @pytest.mark.parametrize("dtype", [str, "U", object])
+    def test_strings(self, dtype):
+        from openpyxl import Workbook
+        wb = Workbook()
+        ws = wb.active
+        for value in ["a", None, "much longer", "abc"]:
+            ws.append([value])
+        out = BytesIO()
+        wb.save(out)
+
+        wb = load_workbook(out, read_only=True)
+        arr = wb.active.to_arrays(dtypes={"A": dtype})["A"]
+        assert arr.tolist() == ["a", None, "much longer", "abc"]
+        if dtype is not object:
+            assert arr.dtype.str == "<U11"
+        arr = wb.active.to_arrays()["A"]
+        assert arr.dtype.kind == "O"
+        assert arr.tolist() == ["a", None, "much longer", "abc"]
+
+
+    def test_invalid_value(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        with pytest.raises(ValueError):
+            ws.to_arrays(columns=["A"], dtypes=float)
+
+
+    def test_empty_column(self):
+        from openpyxl import Workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.append([1, None, 3])
+        ws.append([4, None, 6])
+        out = BytesIO()
+        wb.save(out)
+
+        ws = load_workbook(out, read_only=True).active
+        arrays = ws.to_arrays()
+        assert list(arrays) == ["A", "B", "C"]
+        assert arrays["B"].tolist() == [None, None]
+        ws.reset_dimensions()
+        assert list(ws.to_arrays()) == ["A", "B", "C"]
+        assert list(ws.to_arrays(min_col=2)) == ["B", "C"]
+        assert list(ws.to_arrays(max_col=5)) == ["A", "B", "C", "D", "E"]
+
+
+@pytest.fixture
+def LargeWorksheet():
+    from openpyxl import Workbook
+    wb = Workbook()
+    ws = wb.active
+    for i in range(1, 101):
+        ws.append([i, f"row {i}"])
+    ws.append([])
+    ws.cell(row=150, column=1, value=150)
+    out = BytesIO()
+    wb.save(out)
+    wb = load_workbook(out, read_only=True)
+    return wb.active
+
+
+@pytest.fixture
+def SharedFormulaWorksheet():
+    from openpyxl import Workbook
+    from zipfile import ZipFile
+    wb = Workbook()
+    ws = wb.active
+    for i in range(1, 30):
+        ws.append([i, f"=A{i}*2"])
+    out = BytesIO()
+    wb.save(out)
+
+    # share the formula of the first cell with the others
+    shared = BytesIO()
+    with ZipFile(out) as src, ZipFile(shared, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b"<f>A1*2</f>",
+                                    b'<f t="shared" ref="B1:B29" si="0">A1*2</f>')
+                for i in range(2, 30):
+                    data = data.replace(f"<f>A{i}*2</f>".encode(),
+                                        b'<f t="shared" si="0"/>')
+            dst.writestr(info, data)
+    wb = load_workbook(shared, read_only=True)
+    return wb.active
+
+
+class TestColumnSelection:
+
+    def test_columns(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(min_row=99, max_row=101, columns=["B", 1, "C"], values_only=True))
+        assert rows == [("row 99", 99, None), ("row 100", 100, None), (None, None, None)]
+
+
+    def test_columns_cells(self, LargeWorksheet):
+        ws = LargeWorksheet
+        row = next(ws.iter_rows(min_row=5, columns=["B"]))
+        assert [(c.coordinate, c.value) for c in row] == [("B5", "row 5")]
+
+
+    def test_min_col(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(min_row=3, max_row=4, min_col=2, values_only=True))
+        assert rows == [("row 3",), ("row 4",)]
+        assert ws["B7"].value == "row 7"
+
+
+    def test_columns_to_arrays(self, LargeWorksheet):
+        ws = LargeWorksheet
+        arrays = ws.to_arrays(max_row=3, columns=["B"])
+        assert list(arrays) == ["B"]
+        assert list(arrays["B"]) == ["row 1", "row 2", "row 3"]
+
+
+class TestConditions:
+
+    def test_where(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(values_only=True, where={"A": lambda v: v is not None and v % 40 == 0}))
+        assert rows == [(40, "row 40"), (80, "row 80")]
+
+
+    def test_where_cells(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(where={1: lambda v: v == 150}))
+        assert rows[0][0].coordinate == "A150"
+        assert rows[0][1] is EMPTY_CELL
+
+
+    def test_where_unselected_column(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(columns=["B"], values_only=True, where={"A": lambda v: v == 7}))
+        assert rows == [("row 7",)]
+
+
+    def test_where_missing_rows(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(min_row=95, values_only=True, where={"B": lambda v: v is None}))
+        assert len(rows) == 50
+        assert rows[0] == (None, None)
+        assert rows[-1] == (150, None)
+
+
+    def test_stop_when(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(min_row=90, values_only=True, stop_when={"A": lambda v: v == 95}))
+        assert [r[0] for r in rows] == [90, 91, 92, 93, 94]
+
+
+    def test_conditions_without_gaps(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(max_row=100, values_only=True,
+                                 where={"A": lambda v: v > 90},
+                                 stop_when={"B": lambda v: v.endswith("95")}))
+        assert [r[0] for r in rows] == [91, 92, 93, 94]
+
+
+    def test_stop_at_missing_row(self, LargeWorksheet):
+        ws = LargeWorksheet
+        rows = list(ws.iter_rows(values_only=True, stop_when={"A": lambda v: v is None}))
+        assert len(rows) == 100
+
+
+class TestRowIndex:
+
+    def test_from_source(self):
+        from .._row_index import RowIndex
+        src = b"""<?xml version="1.0"?>
+        <x:worksheet xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <x:dimension ref="A1:A6"/><x:sheetData>
+        <x:row r="1"><x:c r="A1"><x:v>1</x:v></x:c></x:row>
+        <x:row r="3"/><x:row><x:c><x:v>4</x:v></x:c></x:row>
+        <x:row r="6" spans="1:1"></x:row>
+        </x:sheetData></x:worksheet>"""
+        index = RowIndex.from_source(BytesIO(src), step=2)
+        assert index.rows.tolist() == [1, 4]
+        assert src[index.offsets[1]:].startswith(b"<x:row><x:c>")
+        assert index.prefix.endswith(b"<x:sheetData>")
+        assert index.find(3) is None
+        assert index.find(5) == (4, index.offsets[1])
+
+
+    def test_no_data(self):
+        from .._row_index import RowIndex
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData/></worksheet>"""
+        index = RowIndex.from_source(BytesIO(src))
+        assert len(index.rows) == 0
+        assert index.find(10) is None
+
+
+    def test_small_chunks(self, monkeypatch):
+        from .. import _row_index
+        monkeypatch.setattr(_row_index, "CHUNK_SIZE", 7)
+        src = b"""<worksheet><sheetData>""" + b"".join(
+            f'<row r="{i}" spans="1:1"><c><v>{i}</v></c></row>'.encode() for i in range(1, 21)
+        ) + b"</sheetData></worksheet>"
+        index = _row_index.RowIndex.from_source(BytesIO(src), step=5)
+        assert index.rows.tolist() == [1, 6, 11, 16]
+        for row, offset in zip(index.rows, index.offsets):
+            assert src[offset:].startswith(f'<row r="{row}"'.encode())
+
+
+    def test_small_chunks_formulae(self, monkeypatch):
+        from .. import _row_index
+        monkeypatch.setattr(_row_index, "CHUNK_SIZE", 7)
+        src = b"""<worksheet><sheetData>""" + b"".join(
+            f'<row r="{i}"><c r="B{i}"><f t="shared" ref="B{i}:B20" si="{i}">A{i}&amp;1</f></c></row>'.encode()
+            for i in range(1, 21)
+        ) + b"</sheetData></worksheet>"
+        index = _row_index.RowIndex.from_source(BytesIO(src), step=5)
+        assert [f[1:] for f in index.formulae] == [
+            (str(i), f"B{i}", f"A{i}&1") for i in range(1, 21)]
+        for offset, si, coordinate, text in index.formulae:
+            assert src[offset:].startswith(f'<c r="{coordinate}">'.encode())
+
+
+    def test_iter_rows(self, LargeWorksheet):
+        ws = LargeWorksheet
+        expected = list(ws.iter_rows(min_row=45, max_row=160, values_only=True))
+        ws.build_row_index(step=10)
+        assert list(ws.iter_rows(min_row=45, max_row=160, values_only=True)) == expected
+        assert ws["B99"].value == "row 99"
+        assert ws["A150"].value == 150
+
+
+    def test_shared_formulae(self, SharedFormulaWorksheet):
+        ws = SharedFormulaWorksheet
+        index = ws.build_row_index(step=10)
+        assert index.formulae[0][1:] == ("0", "B1", "A1*2")
+        assert ws["B25"].value == "=A25*2"
+        rows = list(ws.iter_rows(min_row=25, max_row=26, columns=["B"], values_only=True))
+        assert rows == [("=A25*2",), ("=A26*2",)]
+
+
+    def test_cache(self, LargeWorksheet, tmpdir):
+        ws = LargeWorksheet
+        index = ws.build_row_index(step=10, cache_dir=str(tmpdir))
+        assert len(tmpdir.listdir()) == 1
+
+        ws._row_index = None
+        cached = ws.build_row_index(step=10, cache_dir=str(tmpdir))
+        assert cached is not index
+        assert cached.rows == index.rows
+        assert cached.offsets == index.offsets
+        assert cached.prefix == index.prefix
+        assert cached.formulae == index.formulae
+
+
 def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
     from ..worksheet import Worksheet
     std = Worksheet(DummyWorkbook)
@@ -266,7 +567,8 @@ def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
     ro_only = set(['_worksheet_path',
                    'parent',
                    'title',
-                   '_shared_strings']
+                   '_shared_strings',
+                   '_engine']
                   )
     assert std_attrs > std_only
     assert ro_attrs > ro_only
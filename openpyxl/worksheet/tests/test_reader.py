@@ -121,6 +121,19 @@ class TestWorksheetParser:
         assert dimension == expected
 
 
+    @pytest.mark.parametrize("engine", ["stdlib", "lxml"])
+    def test_parse_with_engine(self, WorkSheetParser, datadir, engine):
+        datadir.chdir()
+        parser = WorkSheetParser
+        parser.engine = engine
+        with open("sheet_inline_strings.xml", "rb") as src:
+            parser.source = src
+            rows = list(parser.parse())
+        assert [idx for idx, row in rows] == [1, 2, 3, 4, 10]
+        assert rows[0][1][0]['value'] == "col1"
+        assert parser.sheet_format.defaultRowHeight == 15
+
+
     def test_col_width(self, datadir, WorkSheetParser):
         datadir.chdir()
         parser = WorkSheetParser
@@ -619,6 +632,43 @@ class TestWorksheetParser:
             assert expected_cell == cell
 
 
+    def test_row_selected_columns(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.columns = {2, 4}
+        parser.shared_strings = ["a", "b"]
+        src = """
+        <row r="3" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A3" t="s"><v>99</v></c>
+          <c r="B3" t="s"><v>1</v></c>
+          <c t="b"><v>1</v></c>
+          <c><v>4</v></c>
+          <c r="AA3"><v>27</v></c>
+        </row>
+        """
+        element = fromstring(src)
+        row, cells = parser.parse_row(element)
+        assert row == 3
+        assert cells == [
+            {'column': 2, 'row': 3, 'data_type': 's', 'value': 'b', 'style_id': 0},
+            {'column': 4, 'row': 3, 'data_type': 'n', 'value': 4, 'style_id': 0},
+        ]
+        assert parser.col_counter == 27
+
+
+    def test_skipped_shared_formula(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.columns = {2}
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1"><f t="shared" ref="A1:B1" si="0">C1*2</f><v>0</v></c>
+          <c r="B1"><f t="shared" si="0"/><v>0</v></c>
+        </row>
+        """
+        element = fromstring(src)
+        row, cells = parser.parse_row(element)
+        assert cells[0]['value'] == "=D1*2"
+
+
     def test_row_and_cell_skipping_coordinates(self, WorkSheetParser):
         parser = WorkSheetParser
         src = """
@@ -88,6 +88,50 @@ class TestWorksheet:
             assert tuple(c.coordinate for c in row) == coord
 
 
+    def test_iter_rows_sparse(self, Worksheet):
+        from openpyxl.cell.read_only import EMPTY_CELL
+        ws = Worksheet(Workbook())
+        ws["B2"] = 1
+        ws["D5"] = 2
+        rows = list(ws.iter_rows(sparse=True))
+        assert len(rows) == 5
+        assert rows[0] == (EMPTY_CELL,) * 4
+        assert rows[1] == (EMPTY_CELL, ws._cells[2, 2], EMPTY_CELL, EMPTY_CELL)
+        assert list(ws.iter_rows(min_row=4, max_col=4, sparse=True, values_only=True)) == [
+            (None, None, None, None),
+            (None, None, None, 2),
+        ]
+        assert len(ws._cells) == 2
+
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_iter_rows_sparse_range(self, Worksheet, compact):
+        ws = Worksheet(Workbook(compact_cells=compact))
+        for row in range(1, 101):
+            ws.cell(row, 2, row)
+        rows = list(ws.iter_rows(min_row=50, max_row=51, max_col=3, sparse=True, values_only=True))
+        assert rows == [(None, 50, None), (None, 51, None)]
+        assert len(ws._cells) == 100
+
+
+    def test_iter_cols_sparse(self, Worksheet):
+        from openpyxl.cell.read_only import EMPTY_CELL
+        ws = Worksheet(Workbook())
+        ws["B2"] = 1
+        ws["D5"] = 2
+        cols = list(ws.iter_cols(min_col=2, values_only=True, sparse=True))
+        assert cols == [
+            (None, 1, None, None, None),
+            (None, None, None, None, None),
+            (None, None, None, None, 2),
+        ]
+        ws.sparse = True
+        assert ws["C"] == (EMPTY_CELL,) * 5
+        assert ws["A1:B2"] == ((EMPTY_CELL, EMPTY_CELL), (EMPTY_CELL, ws._cells[2, 2]))
+        assert list(ws.values)[1] == (None, 1, None, None)
+        assert len(ws._cells) == 2
+
+
     def test_cell_alternate_coordinates(self, Worksheet):
         ws = Worksheet(Workbook())
         cell = ws.cell(row=8, column=4)
@@ -656,22 +700,6 @@ class TestEditableWorksheet:
         assert ws['B3'].value is None
 
 
-    @pytest.mark.parametrize("idx, offset, max_val, remainder",
-                             [
-                                 (1, 3, 6, {4}),
-                                 (2, 3, 6, {4, 5}),
-                                 (3, 3, 6, {4, 5, 6}),
-                                 (4, 3, 6, {4, 5, 6}),
-                                 (5, 3, 6, {5, 6}),
-                                 (6, 3, 6, {6}),
-                                 (6, 1, 6, {6}),
-                             ]
-                             )
-    def test_remainder(self, dummy_worksheet, idx, offset, max_val, remainder):
-        from ..worksheet import _gutter
-        assert set(_gutter(idx, offset, max_val)) == remainder
-
-
     def test_delete_last_col(self, dummy_worksheet):
         ws = dummy_worksheet
         ws.delete_cols(8)
@@ -686,6 +714,70 @@ class TestEditableWorksheet:
         assert ws['A6'].value == None
 
 
+    def test_insert_rows_moves_ranges(self, Worksheet):
+        from openpyxl.formatting.rule import CellIsRule
+        from openpyxl.worksheet.datavalidation import DataValidation
+        ws = Worksheet(Workbook())
+        ws["A1"] = "title"
+        ws.merge_cells("A1:C1")
+        ws.merge_cells("A3:A5")
+        ws.merge_cells("B8:C9")
+        ws.row_dimensions[8].height = 30
+        ws.conditional_formatting.add("A7:A10", CellIsRule(operator="equal", formula=["1"]))
+        dv = DataValidation(type="whole", sqref="B2:B10")
+        ws.add_data_validation(dv)
+
+        ws.insert_rows(4, 2)
+
+        assert str(ws.merged_cells) == "A1:C1 A3:A7 B10:C11"
+        assert ws["A5"].__class__.__name__ == "MergedCell"
+        assert ws.row_dimensions[10].height == 30
+        assert 8 not in ws.row_dimensions
+        assert [str(cf.sqref) for cf in ws.conditional_formatting] == ["A9:A12"]
+        assert str(dv.sqref) == "B2:B12"
+
+
+    def test_delete_rows_moves_ranges(self, Worksheet):
+        from openpyxl.formatting.rule import CellIsRule
+        from openpyxl.worksheet.datavalidation import DataValidation
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A2:B3")
+        ws.merge_cells("A5:A7")
+        ws.merge_cells("C5:D5")
+        ws["A8"] = "last"
+        ws.row_dimensions[8].height = 30
+        ws.conditional_formatting.add("A4:A4", CellIsRule(operator="equal", formula=["1"]))
+        ws.conditional_formatting.add("B4:B8", CellIsRule(operator="equal", formula=["2"]))
+        dv = DataValidation(type="whole", sqref="C1:C2 C5")
+        ws.add_data_validation(dv)
+
+        ws.delete_rows(3, 3)
+
+        assert str(ws.merged_cells) == "A2:B2 A3:A4"
+        assert ws["A3"].__class__.__name__ == "Cell"
+        assert ws["B2"].__class__.__name__ == "MergedCell"
+        assert ws["A5"].value == "last"
+        assert ws.row_dimensions[5].height == 30
+        assert [str(cf.sqref) for cf in ws.conditional_formatting] == ["B3:B5"]
+        assert str(dv.sqref) == "C1:C2"
+
+
+    def test_insert_cols_moves_dimensions(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.column_dimensions["B"].width = 20
+        ws.column_dimensions.group("D", "F", outline_level=1)
+
+        ws.insert_cols(2)
+        ws.insert_cols(6)
+
+        assert ws.column_dimensions["C"].width == 20
+        assert ws.column_dimensions["E"].range == "E:H"
+        assert "B" not in ws.column_dimensions
+
+        ws.delete_cols(5, 2)
+        assert ws.column_dimensions["E"].range == "E:F"
+
+
     def test_move_cell(self, dummy_worksheet):
         ws = dummy_worksheet
         ws._move_cell(1, 1, 3, 6)
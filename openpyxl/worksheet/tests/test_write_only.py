@@ -8,6 +8,8 @@ from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.utils.datetime  import CALENDAR_WINDOWS_1900
 from openpyxl.styles.styleable import StyleArray
 from openpyxl.tests.helper import compare_xml
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import fromstring, tostring
 
 import pytest
 
@@ -24,6 +26,9 @@ class DummyWorkbook:
         self.epoch = CALENDAR_WINDOWS_1900
         self.sheetnames = []
         self.iso_dates = False
+        self.use_shared_strings = False
+        self.shared_strings_limit = None
+        self.spool_size = None
 
 
 @pytest.fixture
@@ -209,3 +214,185 @@ def test_hyperlink(WriteOnlyWorksheet):
     ws.append([cell])
     assert cell.hyperlink.ref == "A2"
     ws.close()
+
+
+def _sheet_data(ws):
+    ws.close()
+    with open(ws._writer.out, "rb") as src:
+        xml = src.read()
+    tree = fromstring(xml)
+    return tostring(tree.find("{%s}sheetData" % SHEET_MAIN_NS))
+
+
+def test_append_columns(WriteOnlyWorksheet):
+    numpy = pytest.importorskip("numpy")
+    ws = WriteOnlyWorksheet
+    ws.append(["first"])
+    ws.append_columns([
+        numpy.array([1, 2]),
+        numpy.array([1.5, numpy.nan]),
+        numpy.array([True, False]),
+        ["a", None],
+    ])
+
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1">
+        <c r="A1" t="inlineStr"><is><t>first</t></is></c>
+      </row>
+      <row r="2">
+        <c r="A2" t="n"><v>1</v></c>
+        <c r="B2" t="n"><v>1.5</v></c>
+        <c r="C2" t="b"><v>1</v></c>
+        <c r="D2" t="inlineStr"><is><t>a</t></is></c>
+      </row>
+      <row r="3">
+        <c r="A3" t="n"><v>2</v></c>
+        <c r="C3" t="b"><v>0</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_append_dates(WriteOnlyWorksheet):
+    numpy = pytest.importorskip("numpy")
+    ws = WriteOnlyWorksheet
+    ws.append_columns([
+        numpy.array(["1900-01-15", "2024-01-01T12:00", "NaT"], dtype="datetime64[ns]"),
+        numpy.array([1, 36, 0], dtype="timedelta64[h]"),
+    ])
+
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1">
+        <c r="A1" s="1" t="n"><v>15</v></c>
+        <c r="B1" s="2" t="n"><v>0.04166666666666666</v></c>
+      </row>
+      <row r="2">
+        <c r="A2" s="1" t="n"><v>45292.5</v></c>
+        <c r="B2" s="2" t="n"><v>1.5</v></c>
+      </row>
+      <row r="3">
+        <c r="B3" s="2" t="n"><v>0</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_append_objects(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    ws.append_columns([["=A2", "#N/A", 1, datetime.date(2001, 1, 1)]])
+
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1"><c r="A1"><f>A2</f><v></v></c></row>
+      <row r="2"><c r="A2" t="e"><v>#N/A</v></c></row>
+      <row r="3"><c r="A3" t="n"><v>1</v></c></row>
+      <row r="4"><c r="A4" t="n" s="1"><v>36892</v></c></row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_append_columns_length(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    with pytest.raises(ValueError):
+        ws.append_columns([[1, 2], [1]])
+
+
+def test_append_columns_styles(tmpdir):
+    from openpyxl import Workbook, load_workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append_columns([[0.5, 0.25], ["a", "b"]], styles=["Percent", None])
+    out = str(tmpdir.join("styles.xlsx"))
+    wb.save(out)
+
+    ws = load_workbook(out).active
+    assert ws["A2"].style == "Percent"
+    assert ws["A2"].number_format == "0%"
+    assert ws["B2"].style == "Normal"
+
+
+def test_append_frame(tmpdir):
+    pandas = pytest.importorskip("pandas")
+    from openpyxl import Workbook, load_workbook
+
+    df = pandas.DataFrame(
+        {
+            "int": pandas.array([1, None], dtype="Int64"),
+            "date": pandas.to_datetime(["2024-01-01", None]),
+            "cat": pandas.Categorical(["x", "y"]),
+        },
+        index=pandas.Index(["a", "b"], name="key"),
+    )
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append_frame(df, index=True)
+    out = str(tmpdir.join("frame.xlsx"))
+    wb.save(out)
+
+    ws = load_workbook(out).active
+    assert list(ws.values) == [
+        ("key", "int", "date", "cat"),
+        ("a", 1, datetime.datetime(2024, 1, 1), "x"),
+        ("b", None, None, "y"),
+    ]
+
+
+def test_append_at(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    ws.append_at(2, [2])
+    ws.append_at(3, [3])
+    assert ws._max_row == 0
+    ws.append_at(1, [1])
+    assert ws._max_row == 3
+    assert ws._pending == {}
+    ws.append_at(6, [6])
+    ws.append_at(4, [4])
+
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1"><c r="A1" t="n"><v>1</v></c></row>
+      <row r="2"><c r="A2" t="n"><v>2</v></c></row>
+      <row r="3"><c r="A3" t="n"><v>3</v></c></row>
+      <row r="4"><c r="A4" t="n"><v>4</v></c></row>
+      <row r="6"><c r="A6" t="n"><v>6</v></c></row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+@pytest.mark.parametrize("row_idx, pending",
+                         [
+                             (1, ()), # already written
+                             (3, (3,)), # already appended
+                             (12, ()), # outside the window
+                         ]
+                         )
+def test_append_at_invalid(WriteOnlyWorksheet, row_idx, pending):
+    ws = WriteOnlyWorksheet
+    ws.reorder_window = 10
+    ws.append([1])
+    for idx in pending:
+        ws.append_at(idx, [idx])
+    with pytest.raises(ValueError):
+        ws.append_at(row_idx, [row_idx])
+
+
+def test_append_while_pending(WriteOnlyWorksheet):
+    ws = WriteOnlyWorksheet
+    ws.append_at(2, [2])
+    with pytest.raises(ValueError):
+        ws.append([1])
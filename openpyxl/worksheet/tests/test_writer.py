@@ -1,8 +1,10 @@
 # Copyright (c) 2010-2024 openpyxl
 
-import pytest
+import datetime
 import os
 
+import pytest
+
 from openpyxl.tests.helper import compare_xml
 
 from openpyxl.worksheet.datavalidation import DataValidation
@@ -611,6 +613,30 @@ class TestWorksheetWriter:
         assert len(writer.ws._comments) == 1
 
 
+    def test_write_rows_mixed(self, writer):
+
+        ws = writer.ws
+        ws.append([1, "=A1", "text", datetime.date(2024, 1, 1), True])
+        writer.write_rows()
+
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1">
+            <c r="A1" t="n"><v>1</v></c>
+            <c r="B1"><f>A1</f><v></v></c>
+            <c r="C1" t="inlineStr"><is><t>text</t></is></c>
+            <c r="D1" s="1" t="d"><v>2024-01-01</v></c>
+            <c r="E1" t="b"><v>1</v></c>
+          </row>
+        </sheetData>
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
     def test_write_row(self, writer):
 
         writer.ws['A10'] = 15
@@ -676,3 +702,16 @@ class TestWorksheetWriter:
         writer.close()
         writer.cleanup()
         assert os.path.exists(writer.out) is False
+
+
+    def test_spooled(self):
+        from .._writer import WorksheetWriter
+        wb = Workbook(spool_size=2**20)
+        ws = wb.active
+        ws["A1"] = 1
+        writer = WorksheetWriter(ws)
+        writer.write()
+        assert not isinstance(writer.out, str)
+        assert b'<v>1</v>' in writer.read()
+        writer.cleanup()
+        assert writer.out.closed
@@ -4,8 +4,8 @@
 
 
 # Python stdlib imports
-from itertools import chain
-from operator import itemgetter
+from collections import defaultdict, OrderedDict
+from itertools import chain, product
 from inspect import isgenerator
 from warnings import warn
 
@@ -22,6 +22,7 @@ from openpyxl.utils import (
     coordinate_to_tuple,
 )
 from openpyxl.cell import Cell, MergedCell
+from openpyxl.cell.read_only import EMPTY_CELL
 from openpyxl.formatting.formatting import ConditionalFormattingList
 from openpyxl.packaging.relationship import RelationshipList
 from openpyxl.workbook.child import _WorkbookChild
@@ -51,6 +52,7 @@ from .views import (
     SheetViewList,
 )
 from .controls import ControlList
+from ._cell_store import CellStore, ColumnarCellStore
 from .cell_range import MultiCellRange, CellRange
 from .merge import MergedCellRange
 from .properties import WorksheetProperties
@@ -77,6 +79,8 @@ class Worksheet(_WorkbookChild):
     _rel_type = "worksheet"
     _path = "/xl/worksheets/sheet{0}.xml"
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+    sparse = False # iterate without creating missing cells
+    _raw_drawing = None # drawing kept unchanged when charts or images are skipped
 
     BREAK_NONE = 0
     BREAK_ROW = 1
@@ -114,7 +118,10 @@ class Worksheet(_WorkbookChild):
                                                  default_factory=self._add_column)
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
-        self._cells = {}
+        if getattr(self.parent, "compact_cells", False):
+            self._cells = ColumnarCellStore(self)
+        else:
+            self._cells = CellStore()
         self._charts = []
         self._images = []
         self._shapes = []
@@ -336,11 +343,8 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
-            min_row = min(rows)
-        return min_row
+        rows = self._cells.row_range
+        return rows[0] if rows else 1
 
 
     @property
@@ -349,11 +353,8 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
-            max_row = max(rows)
-        return max_row
+        rows = self._cells.row_range
+        return rows[1] if rows else 1
 
 
     @property
@@ -362,11 +363,8 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
-            min_col = min(cols)
-        return min_col
+        cols = self._cells.col_range
+        return cols[0] if cols else 1
 
 
     @property
@@ -375,11 +373,8 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
-            max_col = max(cols)
-        return max_col
+        cols = self._cells.col_range
+        return cols[1] if cols else 1
 
 
     def calculate_dimension(self):
@@ -387,19 +382,11 @@ class Worksheet(_WorkbookChild):
 
         :rtype: string
         """
-        if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
-        else:
+        if not self._cells:
             return "A1:A1"
 
+        min_row, max_row = self._cells.row_range
+        min_col, max_col = self._cells.col_range
         return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
 
 
@@ -409,7 +396,7 @@ class Worksheet(_WorkbookChild):
         return self.calculate_dimension()
 
 
-    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False, sparse=None):
         """
         Produces cells from the worksheet, by row. Specify the iteration range
         using indices of rows and columns.
@@ -433,6 +420,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param sparse: whether missing cells should be returned as `EMPTY_CELL` instead of being created. The default is `ws.sparse`
+        :type sparse: bool
+
         :rtype: generator
         """
 
@@ -445,6 +435,10 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
+        if sparse is None:
+            sparse = self.sparse
+        if sparse:
+            return self._cells_sparse(min_col, min_row, max_col, max_row, values_only)
         return self._cells_by_row(min_col, min_row, max_col, max_row, values_only)
 
 
@@ -476,7 +470,7 @@ class Worksheet(_WorkbookChild):
             yield row
 
 
-    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False):
+    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False, sparse=None):
         """
         Produces cells from the worksheet, by column. Specify the iteration range
         using indices of rows and columns.
@@ -500,6 +494,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param sparse: whether missing cells should be returned as `EMPTY_CELL` instead of being created. The default is `ws.sparse`
+        :type sparse: bool
+
         :rtype: generator
         """
 
@@ -511,6 +508,11 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
+        if sparse is None:
+            sparse = self.sparse
+        if sparse:
+            return self._cells_sparse(min_col, min_row, max_col, max_row, values_only,
+                                      by_col=True)
         return self._cells_by_col(min_col, min_row, max_col, max_row, values_only)
 
 
@@ -527,6 +529,48 @@ class Worksheet(_WorkbookChild):
                 yield tuple(cells)
 
 
+    def _cells_sparse(self, min_col, min_row, max_col, max_row, values_only=False, by_col=False):
+        """
+        Get cells by row or column without creating missing cells.
+        Only cells in the range are looked at and any gaps are filled with
+        `EMPTY_CELL` or None.
+        """
+        cells = self._cells
+        rows = _used(cells.rows, min_row, max_row)
+        columns = _used(cells.columns, min_col, max_col)
+        if len(rows) * len(columns) < len(cells):
+            # only look up the rows and columns in the range which have cells
+            found = ((key, cells.get(key)) for key in product(rows, columns))
+        else:
+            found = ((key, cell) for key, cell in cells.items()
+                     if min_row <= key[0] <= max_row and min_col <= key[1] <= max_col)
+
+        lines = defaultdict(dict)
+        for (row, column), cell in found:
+            if cell is None:
+                continue
+            if by_col:
+                lines[column][row] = cell
+            else:
+                lines[row][column] = cell
+
+        if by_col:
+            first, last, start, size = min_col, max_col, min_row, max_row - min_row + 1
+        else:
+            first, last, start, size = min_row, max_row, min_col, max_col - min_col + 1
+        blank = (None if values_only else EMPTY_CELL,) * size
+
+        for idx in range(first, last + 1):
+            cells = lines.get(idx)
+            if cells is None:
+                yield blank
+                continue
+            line = list(blank)
+            for pos, cell in cells.items():
+                line[pos - start] = cell.value if values_only else cell
+            yield tuple(line)
+
+
     @property
     def columns(self):
         """Produces all cells in the worksheet, by column  (see :func:`iter_cols`)"""
@@ -695,30 +739,87 @@ class Worksheet(_WorkbookChild):
 
     def _move_cells(self, min_row=None, min_col=None, offset=0, row_or_col="row"):
         """
-        Move either rows or columns around by the offset
+        Move either rows or columns around by the offset.
+        Cells which are moved over are removed. Dimensions, merged cells,
+        conditional formatting and data validations are moved as well.
         """
-        reverse = offset > 0 # start at the end if inserting
-        row_offset = 0
-        col_offset = 0
-
-        # need to make affected ranges contiguous
-        if row_or_col == 'row':
-            cells = self.iter_rows(min_row=min_row)
-            row_offset = offset
-            key = 0
+        if row_or_col == "row":
+            start, axis = min_row, 0
         else:
-            cells = self.iter_cols(min_col=min_col)
-            col_offset = offset
-            key = 1
-        cells = list(cells)
-
-        for row, column in sorted(self._cells, key=itemgetter(key), reverse=reverse):
-            if min_row and row < min_row:
+            start, axis = min_col, 1
+
+        self._cells.shift(start, offset, axis)
+        self._move_dimensions(start, offset, axis)
+        self._move_merged_cells(start, offset, axis)
+
+        cf_rules = {}
+        for cf, rules in self.conditional_formatting._cf_rules.items():
+            ranges = _shift_ranges(cf.sqref.ranges, start, offset, axis)
+            if ranges:
+                cf.sqref = MultiCellRange(ranges)
+                cf_rules.setdefault(cf, []).extend(rules)
+        self.conditional_formatting._cf_rules = OrderedDict(cf_rules)
+
+        validations = []
+        for dv in self.data_validations.dataValidation:
+            ranges = _shift_ranges(dv.sqref.ranges, start, offset, axis)
+            if ranges:
+                dv.sqref = MultiCellRange(ranges)
+                validations.append(dv)
+        self.data_validations.dataValidation = validations
+
+
+    def _move_dimensions(self, start, offset, axis):
+        """
+        Move row or column dimensions. Column dimensions may cover several
+        columns and are widened when columns are inserted into them.
+        """
+        dims = self.column_dimensions if axis else self.row_dimensions
+        moved = []
+        for key, dim in dims.items():
+            if axis:
+                low = dim.min or column_index_from_string(key)
+                high = dim.max or low
+            else:
+                low = high = key
+            bounds = _shift_span(low, high, start, offset)
+            if bounds is None:
                 continue
-            elif min_col and column < min_col:
+            if axis:
+                if dim.min is not None:
+                    dim.min, dim.max = bounds
+                key = get_column_letter(bounds[0])
+            else:
+                key = bounds[0]
+            dim.index = key
+            moved.append((key, dim))
+        dims.clear()
+        dims.update(moved)
+
+
+    def _move_merged_cells(self, start, offset, axis):
+        """
+        Move merged cells. Merged cells are extended when rows or columns
+        are inserted into them and are unmerged if only one cell is left.
+        """
+        merged = []
+        for mcr in self.merged_cells.ranges:
+            low, high = (mcr.min_col, mcr.max_col) if axis else (mcr.min_row, mcr.max_row)
+            grown = offset > 0 and low < start <= high
+            if not _shift_ranges([mcr], start, offset, axis):
                 continue
 
-            self._move_cell(row, column, row_offset, col_offset)
+            # the top left cell must not be a merged cell
+            corner = (mcr.min_row, mcr.min_col)
+            if isinstance(self._cells.get(corner), MergedCell):
+                del self._cells[corner]
+            if mcr.min_row == mcr.max_row and mcr.min_col == mcr.max_col:
+                continue
+            mcr.start_cell = self._get_cell(*corner)
+            if grown:
+                mcr.format()
+            merged.append(mcr)
+        self.merged_cells = MultiCellRange(merged)
 
 
     def insert_rows(self, idx, amount=1):
@@ -740,18 +841,7 @@ class Worksheet(_WorkbookChild):
         """
         Delete row or rows from row==idx
         """
-
-        remainder = _gutter(idx, amount, self.max_row)
-
         self._move_cells(min_row=idx+amount, offset=-amount, row_or_col="row")
-
-        # calculating min and max col is an expensive operation, do it only once
-        min_col = self.min_column
-        max_col = self.max_column + 1
-        for row in remainder:
-            for col in range(min_col, max_col):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
         self._current_row = self.max_row
         if not self._cells:
             self._current_row = 0
@@ -761,19 +851,8 @@ class Worksheet(_WorkbookChild):
         """
         Delete column or columns from col==idx
         """
-
-        remainder = _gutter(idx, amount, self.max_column)
-
         self._move_cells(min_col=idx+amount, offset=-amount, row_or_col="column")
 
-        # calculating min and max row is an expensive operation, do it only once
-        min_row = self.min_row
-        max_row = self.max_row + 1
-        for col in remainder:
-            for row in range(min_row, max_row):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
-
 
     def move_range(self, cell_range, rows=0, cols=0, translate=False):
         """
@@ -904,11 +983,56 @@ class Worksheet(_WorkbookChild):
             self._print_area = PrintArea.from_string(",".join(value))
 
 
-def _gutter(idx, offset, max_val):
+def _used(counts, low, high):
+    """
+    Rows or columns between low and high which contain cells
+    """
+    if high - low < len(counts):
+        return [idx for idx in range(low, high + 1) if idx in counts]
+    return [idx for idx in counts if low <= idx <= high]
+
+
+def _shift_span(low, high, start, offset):
+    """
+    Return the bounds of a span of rows or columns after those from start
+    have been moved by offset, or None if the span has been removed.
+    Spans are extended by insertions and shortened by deletions within them.
+    """
+    if offset > 0:
+        if low >= start:
+            return low + offset, high + offset
+        if high >= start:
+            return low, high + offset
+        return low, high
+
+    first = start + offset # first row or column removed
+    if high < first:
+        return low, high
+    if low >= start:
+        return low + offset, high + offset
+    low = min(low, first)
+    high = high + offset if high >= start else first - 1
+    if high < low:
+        return None
+    return low, high
+
+
+def _shift_ranges(ranges, start, offset, axis):
     """
-    When deleting rows and columns are deleted we rely on overwriting.
-    This may not be the case for a large offset on small set of cells:
-    range(cells_to_delete) > range(cell_to_be_moved)
+    Move cell ranges in place by rows (axis 0) or columns (axis 1) and return
+    those which have not been removed
     """
-    gutter = range(max(max_val+1-offset, idx), min(idx+offset, max_val)+1)
-    return gutter
+    kept = []
+    for cr in ranges:
+        if axis:
+            bounds = _shift_span(cr.min_col, cr.max_col, start, offset)
+        else:
+            bounds = _shift_span(cr.min_row, cr.max_row, start, offset)
+        if bounds is None:
+            continue
+        if axis:
+            cr.min_col, cr.max_col = bounds
+        else:
+            cr.min_row, cr.max_row = bounds
+        kept.append(cr)
+    return kept
@@ -0,0 +1,202 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Copy members between archives without decompressing them.
+
+zipfile can only add members by compressing their contents. Copied members
+are therefore added once an archive has been closed: their compressed data is
+written where the central directory was, followed by the central directory
+with entries for the new members and the end records. Only the documented
+layout of archives and attributes of ZipInfo are used.
+"""
+
+import struct
+from zipfile import BadZipFile, ZIP64_LIMIT
+
+
+LOCAL = struct.Struct("<4s5H3L2H")
+CENTRAL = struct.Struct("<4s6H3L5H2L")
+END = struct.Struct("<4s4H2LH")
+END64 = struct.Struct("<4sQ2H2L4Q")
+LOCATOR = struct.Struct("<4sLQL")
+
+LOCAL_SIG = b"PK\x03\x04"
+CENTRAL_SIG = b"PK\x01\x02"
+END_SIG = b"PK\x05\x06"
+END64_SIG = b"PK\x06\x06"
+LOCATOR_SIG = b"PK\x06\x07"
+
+DATA_DESCRIPTOR = 0x08
+UTF8 = 0x800
+ZIP64_EXTRA = 0x0001
+ZIP64_VERSION = 45
+DEFAULT_VERSION = 20
+
+MAX_ENTRIES = 0xFFFF
+MAX_SIZE = 0xFFFFFFFF
+MAX_COMMENT = 0xFFFF
+
+CHUNK_SIZE = 2**20
+
+
+def fingerprint(archive):
+    """
+    Names, checksums and positions of the members of an archive. Archives
+    with the same fingerprint have the same contents in the same places.
+    """
+    return [(info.filename, info.CRC, info.compress_size, info.header_offset)
+            for info in archive.infolist()]
+
+
+def data_offset(fileobj, info):
+    """
+    Return the position of the compressed data of a member after checking
+    that the local header at its position belongs to it
+    """
+    fileobj.seek(info.header_offset)
+    header = fileobj.read(LOCAL.size)
+    if len(header) != LOCAL.size:
+        raise BadZipFile(f"Truncated header of {info.filename}")
+    sig, _, flags, method, _, _, _, _, _, name_len, extra_len = LOCAL.unpack(header)
+    name = fileobj.read(name_len)
+    try:
+        name = name.decode("utf-8" if flags & UTF8 else "cp437")
+    except UnicodeDecodeError:
+        name = None
+    if sig != LOCAL_SIG or method != info.compress_type or name != info.filename:
+        raise BadZipFile(f"Bad header of {info.filename}")
+    return info.header_offset + LOCAL.size + name_len + extra_len
+
+
+def _encode(name, flags):
+    """
+    Return the encoded name and flags of a member whose sizes are known
+    """
+    flags &= ~(DATA_DESCRIPTOR | UTF8)
+    try:
+        return name.encode("ascii"), flags
+    except UnicodeEncodeError:
+        return name.encode("utf-8"), flags | UTF8
+
+
+def _dos_time(date_time):
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11 | minute << 5 | second // 2,
+            (year - 1980) << 9 | month << 5 | day)
+
+
+def _zip64(*values):
+    return struct.pack(f"<2H{len(values)}Q", ZIP64_EXTRA, 8 * len(values), *values)
+
+
+def _large(info):
+    return info.file_size > ZIP64_LIMIT or info.compress_size > ZIP64_LIMIT
+
+
+def _local_header(name, info):
+    name, flags = _encode(name, info.flag_bits)
+    file_size, compress_size = info.file_size, info.compress_size
+    extra = b""
+    version = max(info.extract_version, DEFAULT_VERSION)
+    if _large(info):
+        extra = _zip64(file_size, compress_size)
+        file_size = compress_size = MAX_SIZE
+        version = max(version, ZIP64_VERSION)
+    return LOCAL.pack(LOCAL_SIG, version, flags, info.compress_type,
+                      *_dos_time(info.date_time), info.CRC, compress_size,
+                      file_size, len(name), len(extra)) + name + extra
+
+
+def _central_header(name, info, offset):
+    name, flags = _encode(name, info.flag_bits)
+    file_size, compress_size = info.file_size, info.compress_size
+    values = []
+    if _large(info):
+        values.extend([file_size, compress_size])
+        file_size = compress_size = MAX_SIZE
+    if offset > ZIP64_LIMIT:
+        values.append(offset)
+        offset = MAX_SIZE
+    extra = b""
+    version = max(info.extract_version, DEFAULT_VERSION)
+    if values:
+        extra = _zip64(*values)
+        version = max(version, ZIP64_VERSION)
+    return CENTRAL.pack(CENTRAL_SIG, info.create_system << 8 | max(info.create_version, version),
+                        version, flags, info.compress_type, *_dos_time(info.date_time),
+                        info.CRC, compress_size, file_size, len(name), len(extra), 0, 0,
+                        info.internal_attr, info.external_attr, offset) + name + extra
+
+
+def _read_directory(fileobj):
+    """
+    Return the position, number of entries and contents of the central
+    directory of an archive, and the archive's comment
+    """
+    size = fileobj.seek(0, 2)
+    start = max(0, size - END.size - MAX_COMMENT)
+    fileobj.seek(start)
+    tail = fileobj.read()
+    pos = tail.rfind(END_SIG)
+    if pos < 0 or len(tail) - pos < END.size:
+        raise BadZipFile("End of central directory not found")
+    _, _, _, _, entries, cd_size, cd_offset, comment_len = END.unpack_from(tail, pos)
+    comment = tail[pos + END.size:pos + END.size + comment_len]
+
+    locator = pos - LOCATOR.size
+    if locator >= 0 and tail[locator:locator + 4] == LOCATOR_SIG:
+        _, _, end64, _ = LOCATOR.unpack_from(tail, locator)
+        fileobj.seek(end64)
+        record = fileobj.read(END64.size)
+        if len(record) != END64.size or record[:4] != END64_SIG:
+            raise BadZipFile("Zip64 end of central directory not found")
+        _, _, _, _, _, _, _, entries, cd_size, cd_offset = END64.unpack(record)
+
+    fileobj.seek(cd_offset)
+    directory = fileobj.read(cd_size)
+    if len(directory) != cd_size:
+        raise BadZipFile("Truncated central directory")
+    return cd_offset, entries, directory, comment
+
+
+def _write_directory(fileobj, directory, entries, comment):
+    offset = fileobj.tell()
+    fileobj.write(directory)
+    size = len(directory)
+    if entries > MAX_ENTRIES or offset > ZIP64_LIMIT or size > ZIP64_LIMIT:
+        end64 = fileobj.tell()
+        fileobj.write(END64.pack(END64_SIG, END64.size - 12, ZIP64_VERSION,
+                                 ZIP64_VERSION, 0, 0, entries, entries, size, offset))
+        fileobj.write(LOCATOR.pack(LOCATOR_SIG, 0, end64, 1))
+        entries = min(entries, MAX_ENTRIES)
+        size = min(size, MAX_SIZE)
+        offset = min(offset, MAX_SIZE)
+    fileobj.write(END.pack(END_SIG, 0, 0, entries, entries, size, offset, len(comment)))
+    fileobj.write(comment)
+    fileobj.truncate()
+
+
+def append_members(fileobj, source, members):
+    """
+    Add members of another archive to a closed archive.
+
+    :param fileobj: the archive, opened for reading and writing
+    :param source: the other archive, opened for reading
+    :param members: the names of the copies, the ZipInfo of the originals and the positions of their data
+    """
+    start, entries, directory, comment = _read_directory(fileobj)
+    fileobj.seek(start)
+    added = []
+    for name, info, offset in members:
+        header_offset = fileobj.tell()
+        fileobj.write(_local_header(name, info))
+        source.seek(offset)
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.read(min(remaining, CHUNK_SIZE))
+            if not chunk:
+                raise BadZipFile(f"Truncated data of {info.filename}")
+            fileobj.write(chunk)
+            remaining -= len(chunk)
+        added.append(_central_header(name, info, header_offset))
+    _write_directory(fileobj, directory + b"".join(added), entries + len(added), comment)
@@ -2,9 +2,20 @@
 
 
 # Python stdlib imports
+from concurrent.futures import ProcessPoolExecutor
 import datetime
+from functools import partial
+from io import BytesIO
+from itertools import chain
+import multiprocessing
+import os
+import posixpath
+import queue
 import re
-from zipfile import ZipFile, ZIP_DEFLATED
+import threading
+import warnings
+from shutil import copyfileobj
+from zipfile import BadZipFile, ZipFile, ZIP_DEFLATED, ZIP_STORED, ZIP64_LIMIT
 
 # package imports
 from openpyxl.utils.exceptions import InvalidFileException
@@ -19,33 +30,118 @@ from openpyxl.xml.constants import (
     ARC_THEME,
     ARC_STYLE,
     ARC_WORKBOOK,
+    ARC_CONTENT_TYPES,
+    ARC_SHARED_STRINGS,
     IMAGE_NS,
+    SHARED_STRINGS,
 )
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.drawing.legacy import LegacyDrawing
 from openpyxl.drawing.image import ImageGroup
-from openpyxl.xml.functions import tostring
-from openpyxl.packaging.manifest import Manifest
+from openpyxl.xml.functions import tostring, fromstring
+from openpyxl.packaging.manifest import Manifest, Override
 from openpyxl.packaging.relationship import (
+    get_dependents,
     get_rels_path,
     RelationshipList,
     Relationship,
 )
 from openpyxl.comments.comment_sheet import CommentSheet
 from openpyxl.packaging.extended import ExtendedProperties
-from openpyxl.styles.stylesheet import write_stylesheet
-from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.pivot.record import LazyRecordList
+from openpyxl.cell._writer import _shared_string
+from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.styles.stylesheet import style_state, write_stylesheet
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.worksheet._writer import (
+    WorksheetWriter,
+    ALL_TEMP_FILES,
+    create_temporary_file,
+)
+from openpyxl.worksheet._lazy import LazyWorksheet
 from openpyxl.workbook._writer import WorkbookWriter
+from .strings import read_source_items, write_string_table
+from ._zip import append_members, data_offset, fingerprint
 from .theme import theme_xml
 
 
+# relationships of worksheets which can be copied from the source
+COPYABLE = frozenset([
+    "hyperlink",
+    "drawing",
+    "chart",
+    "chartUserShapes",
+    "chartStyle",
+    "chartColorStyle",
+    "themeOverride",
+    "image",
+    "comments",
+    "vmlDrawing",
+])
+
+# size of the blocks in which parts are copied into the archive
+CHUNK_SIZE = 2**20
+
+
+# state of worker processes used to write worksheets in parallel
+_worker = {}
+
+
+def _init_worker(workbook):
+    """
+    Worker processes are forked so that they share the workbook with the
+    main process without it being copied
+    """
+    _worker['workbook'] = workbook
+
+
+def _detach(out, spool_size):
+    """
+    Spooled files cannot be sent to the main process. Small files are
+    sent in memory, others are copied to a named temporary file.
+    """
+    size = out.seek(0, os.SEEK_END)
+    out.seek(0)
+    if size <= spool_size:
+        return BytesIO(out.read())
+    path = create_temporary_file()
+    with open(path, "wb") as dest:
+        copyfileobj(out, dest)
+    out.close()
+    return path
+
+
+def _write_worksheet(idx):
+    """
+    Serialise a worksheet in a worker process.
+    Returns the writer, so that the worksheet can be added to the archive by
+    the main process, with the comments, the legacy drawing's relationship
+    and any warnings raised.
+    """
+    ws = _worker['workbook'].worksheets[idx]
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        writer = WorksheetWriter(ws)
+        writer.write()
+
+    # drop anything that cannot or should not be sent back
+    if not isinstance(writer.out, str):
+        writer.out = _detach(writer.out, ws.parent.spool_size)
+    writer.ws = None
+    writer.xf = None
+    writer._raw = None
+    legacy = getattr(ws.legacy_drawing, "_rel_id", None)
+    return writer, ws._comments, legacy, [(str(w.message), w.category) for w in caught]
+
+
 class ExcelWriter(object):
     """Write a workbook object to an Excel file."""
 
 
-    def __init__(self, workbook, archive):
+    def __init__(self, workbook, archive, workers=None, target=None):
         self.archive = archive
         self.workbook = workbook
+        self.workers = workers
         self.manifest = Manifest()
         self.vba_modified = set()
         self._tables = []
@@ -57,6 +153,54 @@ class ExcelWriter(object):
         self.activex = []
         self.legacy = []
         self.form_controls = []
+        self.copied = []
+        self.raw = {} # sheets with drawings copied or written unchanged, by id
+        self._copied_parts = {}
+        self._copyable = {}
+        self._source_types = None
+        self.strings = False
+        self.target = target if _appendable(target) else None
+        self.appended = {} # members added unchanged once the archive is closed
+        self._source_file = None
+        self._owned = None
+        self._open_source()
+
+
+    def _open_source(self):
+        """
+        Use the archive from which the workbook was read if it has not changed
+        since. Its members can then be copied without being decompressed.
+        """
+        wb = self.workbook
+        self.source = getattr(wb, "_archive", None)
+        self.source_path = None
+        path, expected = getattr(wb, "_source", (None, None))
+        if path is None:
+            return
+        try:
+            archive = ZipFile(path)
+        except (OSError, BadZipFile):
+            return
+        if fingerprint(archive) != expected:
+            archive.close()
+            return
+        self.source_path = path
+        if self.source is None:
+            self.source = self._owned = archive
+        else:
+            archive.close()
+
+
+    def close_source(self):
+        """
+        Close the files opened to copy members from the source
+        """
+        if self._source_file is not None:
+            self._source_file.close()
+            self._source_file = None
+        if self._owned is not None:
+            self._owned.close()
+            self._owned = None
 
 
     def write_data(self):
@@ -84,25 +228,43 @@ class ExcelWriter(object):
 
         self.write_volatile_deps()
         self.write_worksheets()
+        self.write_shared_strings()
         self.write_chartsheets()
         #self.write_images()
         self.write_charts()
 
         self.write_external_links()
-
-        stylesheet = write_stylesheet(self.workbook)
-        archive.writestr(ARC_STYLE, tostring(stylesheet))
+        self.write_copied()
+        self.write_stylesheet()
 
         writer = WorkbookWriter(self.workbook)
         archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
         archive.writestr(ARC_WORKBOOK, writer.write())
+        if self.strings:
+            rel = Relationship(type="sharedStrings", Target="sharedStrings.xml")
+            writer.rels.append(rel)
         archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
 
         self._merge_vba()
 
+        self.manifest._register_mimetypes(self.appended)
         self.manifest._write(archive, self.workbook)
 
 
+    def write_stylesheet(self):
+        """
+        The stylesheet is copied from the source unless styles have been added
+        or changed
+        """
+        wb = self.workbook
+        if (self.source is not None and ARC_STYLE in self.source.NameToInfo
+            and getattr(wb, "_source_styles", None) == style_state(wb)):
+            self.copy_member(ARC_STYLE, ARC_STYLE)
+            return
+        stylesheet = write_stylesheet(wb)
+        self.archive.writestr(ARC_STYLE, tostring(stylesheet))
+
+
     @property
     def images(self):
         return self._images
@@ -194,6 +356,12 @@ class ExcelWriter(object):
                 rels_path = get_rels_path(sheet.path[1:])
                 self.archive.writestr(rels_path, tostring(tree))
 
+            elif sheet._raw_drawing is not None:
+                sheet._rels = RelationshipList()
+                sheet._rels.append(Relationship(type="drawing", Target=""))
+                drawing = sheet._raw_drawing
+                self.raw[id(sheet)] = sheet, partial(self.write_raw_part, drawing, drawing.path)
+
 
     def write_comment(self, ws):
 
@@ -239,7 +407,8 @@ class ExcelWriter(object):
             self.archive.writestr(path[1:], tostring(xml))
 
 
-    def write_worksheet(self, ws):
+    def write_worksheet(self, ws, written=None):
+        source_drawing = self._source_drawing(ws)
         ws._drawing = SpreadsheetDrawing()
         ws._drawing.charts = ws._charts
         ws._drawing.images = ws._images
@@ -249,6 +418,8 @@ class ExcelWriter(object):
             if not ws.closed:
                 ws.close()
             writer = ws._writer
+        elif written is not None:
+            writer = self.bind_written(ws, written)
         else:
             writer = WorksheetWriter(ws)
             writer.write()
@@ -266,11 +437,16 @@ class ExcelWriter(object):
             rel = ws._rels.get(drawing._rel_id)
             rel.Target = drawing.path
 
-        if ws._drawing:
+        if ws._drawing and source_drawing is not None:
+            self.raw[id(ws)] = ws, partial(self.copy_part, source_drawing)
+        elif ws._drawing:
             self.write_drawing(ws._drawing)
             for r in ws._rels:
                 if "drawing" in r.Type:
                     r.Target = ws._drawing.path
+        elif ws._raw_drawing is not None:
+            drawing = ws._raw_drawing
+            self.raw[id(ws)] = ws, partial(self.write_raw_part, drawing, drawing.path)
 
         for t in ws._tables.values():
             self._tables.append(t)
@@ -279,12 +455,28 @@ class ExcelWriter(object):
             self.manifest.append(t)
             ws._rels.get(t._rel_id).Target = t.path
 
-        self.archive.write(writer.out, ws.path[1:])
+        self.write_file(writer.out, ws.path[1:])
         self.manifest.append(ws)
 
         writer.cleanup()
 
 
+    def write_file(self, src, arcname):
+        """
+        Add a temporary file or file object to the archive.
+        """
+        archive = self.archive
+        if isinstance(src, str):
+            archive.write(src, arcname)
+            return
+
+        size = src.seek(0, os.SEEK_END)
+        src.seek(0)
+        # members opened by name use the archive's compression and level
+        with archive.open(arcname, "w", force_zip64=size > ZIP64_LIMIT) as dest:
+            copyfileobj(src, dest, CHUNK_SIZE)
+
+
     def write_controls(self, ws, controls):
         """Serialise form controls for a specific worksheet"""
 
@@ -310,13 +502,348 @@ class ExcelWriter(object):
             obj.Target = img.path
 
 
+    def can_copy(self, ws):
+        """
+        Worksheets which have not been changed can be copied from the source
+        along with the parts they depend upon, such as drawings and comments,
+        unless these also depend upon other parts of the workbook
+        """
+        return (isinstance(ws, LazyWorksheet)
+                and self.source is not None
+                and not ws._changed
+                and all(self._can_copy_rel(rel) for rel in ws._rels))
+
+
+    def _source_drawing(self, ws):
+        """
+        Return the path of the drawing of a changed worksheet if none of its
+        charts, images or shapes have been used, so that it can be copied
+        """
+        if not isinstance(ws, LazyWorksheet) or self.source is None:
+            return
+        if not {"_charts", "_images", "_shapes"} <= ws._unused.keys():
+            return
+        rels = list(ws._rels.find(SpreadsheetDrawing._rel_type))
+        if len(rels) == 1 and self._can_copy_part(rels[0].target):
+            return rels[0].target
+
+
+    def _can_copy_rel(self, rel):
+        if rel.TargetMode == "External":
+            return True
+        if rel.Type.split("/")[-1] not in COPYABLE:
+            return False
+        return self._can_copy_part(rel.target)
+
+
+    def _can_copy_part(self, path):
+        if path not in self._copyable:
+            self._copyable[path] = True # guard against cycles
+            source = self.source
+            rels_path = get_rels_path(path)
+            rels = ()
+            if rels_path in source.NameToInfo:
+                rels = get_dependents(source, rels_path)
+            self._copyable[path] = (path in source.NameToInfo
+                                    and all(self._can_copy_rel(rel) for rel in rels))
+        return self._copyable[path]
+
+
+    def copy_member(self, name, arcname):
+        """
+        Copy a member of the source archive. Its compressed data is added
+        unchanged once the archive has been closed. If the archive cannot be
+        reopened or the source has changed it is recompressed instead.
+        """
+        source = self.source
+        info = source.getinfo(name)
+        if self.target is not None and self.source_path is not None:
+            if self._source_file is None:
+                self._source_file = open(self.source_path, "rb")
+            try:
+                offset = data_offset(self._source_file, info)
+            except BadZipFile:
+                pass
+            else:
+                self.appended[arcname] = info, offset
+                return
+        with source.open(info) as src:
+            with self.archive.open(arcname, "w", force_zip64=info.file_size > ZIP64_LIMIT) as dest:
+                copyfileobj(src, dest, CHUNK_SIZE)
+
+
+    def copy_worksheet(self, ws):
+        """
+        Copy an unchanged worksheet from the source archive.
+        Its relationships are written once the parts they refer to have been copied.
+        """
+        self.copy_member(ws._source, ws.path[1:])
+        self.manifest.append(ws)
+        self.copied.append(ws)
+
+
+    def _free_name(self, path):
+        """
+        Return the path or, if it is already used, the first free name with
+        a different number
+        """
+        stem, ext = posixpath.splitext(path)
+        stem = stem.rstrip("0123456789")
+        idx = 1
+        while path in self.archive.NameToInfo or path in self.appended:
+            path = f"{stem}{idx}{ext}"
+            idx += 1
+        return path
+
+
+    def copy_part(self, path):
+        """
+        Copy a part and the parts which it depends upon from the source archive.
+        Parts are renamed if the name is already used.
+        Returns the name of the copy.
+        """
+        if path in self._copied_parts:
+            return self._copied_parts[path]
+
+        source = self.source
+        if self._source_types is None:
+            package = Manifest.from_tree(fromstring(source.read(ARC_CONTENT_TYPES)))
+            self._source_types = {ct.PartName: ct.ContentType for ct in package.Override}
+
+        arcname = self._free_name(path)
+        self._copied_parts[path] = arcname
+        self.copy_member(path, arcname)
+        ct = self._source_types.get("/" + path)
+        if ct is not None:
+            self.manifest.Override.append(Override(PartName="/" + arcname, ContentType=ct))
+
+        rels_path = get_rels_path(path)
+        if rels_path in source.NameToInfo:
+            self.write_copied_rels(get_dependents(source, rels_path), arcname)
+        return arcname
+
+
+    def write_raw_part(self, raw, path):
+        """
+        Write a part which was read without being parsed and the parts which
+        it depends upon. Parts are renamed if the name is already used.
+        Returns the name of the part.
+        """
+        if path in self._copied_parts:
+            return self._copied_parts[path]
+
+        data, ct, rels = raw.parts[path]
+        arcname = self._free_name(path)
+        self._copied_parts[path] = arcname
+        self.archive.writestr(arcname, data)
+        if ct is not None:
+            self.manifest.Override.append(Override(PartName="/" + arcname, ContentType=ct))
+        self.write_copied_rels(rels, arcname, raw)
+        return arcname
+
+
+    def write_copied_rels(self, rels, path, raw=None):
+        """
+        Copy the targets of relationships and write them for the copy of a part.
+        Targets are copied from the source archive or from the parts which
+        were read without being parsed.
+        """
+        copied = RelationshipList()
+        for rel in rels:
+            target = rel.Target
+            if rel.TargetMode != "External":
+                if raw is None:
+                    target = "/" + self.copy_part(rel.target)
+                elif rel.target in raw.parts:
+                    target = "/" + self.write_raw_part(raw, rel.target)
+                else:
+                    continue # the target is missing from the source
+            copied.append(Relationship(Id=rel.Id, Type=rel.Type, Target=target,
+                                       TargetMode=rel.TargetMode))
+        if copied:
+            rels_path = get_rels_path(path)
+            self.archive.writestr(rels_path, tostring(copied.to_tree()))
+
+
+    def write_copied(self):
+        """
+        Copy the parts of copied worksheets, and drawings which are written
+        unchanged, after all other parts have been written so that their
+        names can be kept if possible
+        """
+        for ws in self.copied:
+            self.write_copied_rels(ws._rels, ws.path[1:])
+
+        for sheet, write in self.raw.values():
+            rel = next(sheet._rels.find(SpreadsheetDrawing._rel_type))
+            rel.Target = "/" + write()
+            rels_path = get_rels_path(sheet.path)[1:]
+            self.archive.writestr(rels_path, tostring(sheet._rels.to_tree()))
+
+
+    def source_strings(self):
+        """
+        Copied worksheets refer to the shared strings of the source archive
+        """
+        source = self.source
+        package = Manifest.from_tree(fromstring(source.read(ARC_CONTENT_TYPES)))
+        ct = package.find(SHARED_STRINGS)
+        if ct is not None:
+            return source.read(ct.PartName[1:])
+        return b'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="0" uniqueCount="0"/>'
+
+
+    def setup_shared_strings(self):
+        """
+        Start a new string table for the worksheets which are written.
+        Indices in copied worksheets are kept by starting with the source table.
+        """
+        wb = self.workbook
+        if not wb.use_shared_strings or wb.write_only:
+            return
+        items = ()
+        if any(self.can_copy(ws) for ws in wb.worksheets):
+            items = read_source_items(self.source_strings())
+        wb.shared_strings = IndexedList(items)
+        wb._shared_strings_size = sum(len(item.encode("utf-8")) for item in items
+                                      if isinstance(item, str))
+
+
+    def write_shared_strings(self):
+        wb = self.workbook
+        if wb.use_shared_strings and wb.shared_strings:
+            src = write_string_table(wb.shared_strings)
+        elif self.copied:
+            src = self.source_strings()
+        else:
+            return
+        self.archive.writestr(ARC_SHARED_STRINGS, src)
+        self.manifest.Override.append(
+            Override(PartName="/" + ARC_SHARED_STRINGS, ContentType=SHARED_STRINGS)
+        )
+        self.strings = True
+
+
+    def prepare_worksheet(self, ws):
+        """
+        Assign the indices of styles and strings shared by all worksheets
+        before any of them are written
+        """
+        wb = self.workbook
+        df = DifferentialStyle()
+        for cf in ws.conditional_formatting:
+            for rule in cf.rules:
+                if rule.dxf and rule.dxf != df:
+                    rule.dxfId = wb._differential_styles.add(rule.dxf)
+
+        for dim in chain(ws.row_dimensions.values(), ws.column_dimensions.values()):
+            if dim.has_style:
+                dim.style_id
+
+        strings = wb.use_shared_strings
+        for cell in ws._cells.values():
+            if cell._style is not None:
+                cell.style_id
+            if strings and cell.data_type == "s":
+                _shared_string(wb, cell._value)
+
+
+    def can_write_in_worker(self, ws):
+        """
+        Worksheets with tables or controls must be written in the main process
+        because these are updated when the worksheet is written
+        """
+        return not ws.tables and not ws.controls
+
+
+    def _use_workers(self):
+        """
+        Worksheets can only be written in parallel if worker processes can be
+        forked. Forking a process with other threads running can deadlock so,
+        for example, workbooks which are being streamed are written serially.
+        """
+        return (self.workers is not None
+                and self.workers > 1
+                and not self.workbook.write_only
+                and len(self.workbook.worksheets) > 1
+                and "fork" in multiprocessing.get_all_start_methods()
+                and threading.active_count() == 1)
+
+
+    def write_in_workers(self):
+        """
+        Submit worksheets to be written by a pool of processes.
+        Returns the pool and futures by worksheet index.
+        """
+        sheets = []
+        for idx, ws in enumerate(self.workbook.worksheets):
+            if self.can_copy(ws):
+                continue
+            self.prepare_worksheet(ws)
+            if self.can_write_in_worker(ws):
+                sheets.append(idx)
+
+        futures = {}
+        if len(sheets) < 2:
+            return None, futures
+        pool = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(sheets)),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.workbook,)
+        )
+        for idx in sheets:
+            futures[idx] = pool.submit(_write_worksheet, idx)
+        return pool, futures
+
+
+    def bind_written(self, ws, written):
+        """
+        Update a worksheet with the results from a worker process
+        """
+        writer, comments, legacy, caught = written.result()
+        for msg, category in caught:
+            warnings.warn(msg, category)
+        writer.ws = ws
+        if isinstance(writer.out, str):
+            ALL_TEMP_FILES.append(writer.out)
+        ws._comments = comments
+        if legacy is not None:
+            if ws.legacy_drawing is None:
+                ws.legacy_drawing = LegacyDrawing(vml=None)
+            ws.legacy_drawing._rel_id = legacy
+        return writer
+
+
     def write_worksheets(self):
 
+        self.setup_shared_strings()
+
+        pool = None
+        futures = {}
+        if self._use_workers():
+            pool, futures = self.write_in_workers()
+
+        try:
+            self._write_worksheets(futures)
+        finally:
+            if pool is not None:
+                for future in futures.values():
+                    future.cancel()
+                pool.shutdown()
+
+
+    def _write_worksheets(self, futures):
+
         pivot_caches = set()
 
         for idx, ws in enumerate(self.workbook.worksheets, 1):
             ws._id = idx
-            self.write_worksheet(ws)
+            if self.can_copy(ws):
+                self.copy_worksheet(ws)
+                continue
+
+            self.write_worksheet(ws, futures.get(idx - 1))
 
             for p in ws._pivots:
                 if p.cache not in pivot_caches:
@@ -325,17 +852,35 @@ class ExcelWriter(object):
 
                 self._pivots.append(p)
                 p._id = len(self._pivots)
-                p._write(self.archive, self.manifest)
+                self.write_pivot(p)
                 self.workbook._pivots.append(p)
                 r = Relationship(Type=p.rel_type, Target=p.path)
                 ws._rels.append(r)
 
-            if ws._rels:
+            if ws._rels and id(ws) not in self.raw:
                 tree = ws._rels.to_tree()
                 rels_path = get_rels_path(ws.path)[1:]
                 self.archive.writestr(rels_path, tostring(tree))
 
 
+    def write_pivot(self, pivot):
+        """
+        Write a pivot table. Cache records which have not been parsed are
+        copied from the source.
+        """
+        records = pivot.cache.records
+        copy = (isinstance(records, LazyRecordList) and not records.parsed
+                and self.source is not None
+                and records._member in self.source.NameToInfo)
+        if copy:
+            records._copy = self.copy_member
+        try:
+            pivot._write(self.archive, self.manifest)
+        finally:
+            if copy:
+                records._copy = None
+
+
     def write_external_links(self):
         # delegate to object
         """Write links to external workbooks"""
@@ -361,11 +906,61 @@ class ExcelWriter(object):
 
     def save(self):
         """Write data into the archive."""
-        self.write_data()
-        self.archive.close()
+        try:
+            self.write_data()
+            self.archive.close()
+            if self.appended:
+                self.append_copied()
+        finally:
+            self.close_source()
 
 
-def save_workbook(workbook, filename):
+    def append_copied(self):
+        """
+        Add the members copied from the source to the closed archive
+        """
+        members = [(name, info, offset) for name, (info, offset) in self.appended.items()]
+        if isinstance(self.target, (str, os.PathLike)):
+            with open(self.target, "r+b") as fileobj:
+                append_members(fileobj, self._source_file, members)
+        else:
+            append_members(self.target, self._source_file, members)
+
+
+def _appendable(target):
+    """
+    Copied members can only be added to archives which can be reopened or
+    read back
+    """
+    if isinstance(target, (str, os.PathLike)):
+        return True
+    try:
+        return target.seekable() and target.readable() and target.tell() == 0
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _load_from_target(workbook, filename):
+    """
+    Worksheets must be read before their source is overwritten.
+    Returns whether the source is overwritten.
+    """
+    source = getattr(workbook, "_source", None)
+    if source is None or not isinstance(source[0], (str, os.PathLike)):
+        return False
+    target = getattr(filename, "name", filename)
+    if not isinstance(target, (str, os.PathLike)) or not os.path.exists(target):
+        return False
+    if not os.path.exists(source[0]) or not os.path.samefile(source[0], target):
+        return False
+    for ws in workbook.worksheets:
+        if isinstance(ws, LazyWorksheet):
+            ws._load()
+    return True
+
+
+def save_workbook(workbook, filename, workers=None, compression=ZIP_DEFLATED,
+                  compresslevel=None):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -374,13 +969,129 @@ def save_workbook(workbook, filename):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param workers: number of processes used to write worksheets in parallel. Only used on platforms where processes can be forked and when no other threads are running. The default is None
+    :type workers: int
+
+    :param compression: either `zipfile.ZIP_DEFLATED` or `zipfile.ZIP_STORED` for no compression. The default is ZIP_DEFLATED
+    :type compression: int
+
+    :param compresslevel: level of compression from 0 (none) to 9 (smallest). The default is None, which uses zlib's default
+    :type compresslevel: int
+
     :rtype: bool
 
     """
     #if wb._vba and not filename.endswith(".xlsm"):
         #warn()
-    archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
+    if compression not in (ZIP_DEFLATED, ZIP_STORED):
+        raise ValueError("Compression must be either ZIP_DEFLATED or ZIP_STORED")
+    overwrite = _load_from_target(workbook, filename)
+    archive = ZipFile(filename, 'w', compression, allowZip64=True,
+                      compresslevel=compresslevel)
     workbook.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
-    writer = ExcelWriter(workbook, archive)
+    writer = ExcelWriter(workbook, archive, workers, target=filename)
+    if overwrite:
+        # nothing can be copied from the source
+        writer.close_source()
+        writer.source = writer.source_path = None
     writer.save()
     return True
+
+
+class _ChunkQueue:
+    """
+    Write-only file which passes chunks of data to another thread.
+
+    The file cannot be seeked so the archive uses data descriptors. The queue
+    is bounded so that the memory used does not depend upon the size of the
+    workbook.
+    """
+
+    def __init__(self, chunk_size, max_chunks):
+        self.chunk_size = chunk_size
+        self.queue = queue.Queue(max_chunks)
+        self.buffer = bytearray()
+        self.cancelled = threading.Event()
+
+
+    def _put(self, item):
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise OSError("The stream has been closed")
+
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.chunk_size:
+            self._put(bytes(self.buffer[:self.chunk_size]))
+            del self.buffer[:self.chunk_size]
+        return len(data)
+
+
+    def flush(self):
+        pass
+
+
+    def finish(self, error=None):
+        """
+        Send the remaining data and then either None or the error
+        """
+        if self.buffer and error is None:
+            self._put(bytes(self.buffer))
+            self.buffer.clear()
+        self._put(error)
+
+
+def stream_workbook(workbook, chunk_size=2**16, max_chunks=16, **kw):
+    """
+    Return a generator of chunks of the archive as it is saved.
+
+    This is suitable for the body of a WSGI or ASGI response. The workbook is
+    saved in a separate thread and no more than `max_chunks` are buffered.
+    Closing the generator stops the save. Any other arguments are passed to
+    :func:`save_workbook`.
+
+    :param chunk_size: the size of each chunk of bytes
+    :type chunk_size: int
+
+    :param max_chunks: the number of chunks that can wait to be consumed
+    :type max_chunks: int
+    """
+    if workbook.read_only:
+        raise TypeError("""Workbook is read-only""")
+    if workbook.write_only and not workbook.worksheets:
+        workbook.create_sheet()
+    return _stream(workbook, _ChunkQueue(chunk_size, max_chunks), kw)
+
+
+def _stream(workbook, sink, kw):
+
+    def save():
+        try:
+            save_workbook(workbook, sink, **kw)
+        except Exception as e:
+            error = e
+        else:
+            error = None
+        try:
+            sink.finish(error)
+        except OSError:
+            pass # nobody is listening
+
+    thread = threading.Thread(target=save, daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = sink.queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        sink.cancelled.set()
+        thread.join()
@@ -0,0 +1,51 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from io import BytesIO
+
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import Element, SubElement, fromstring, whitespace, xmlfile
+
+
+def read_source_items(xml_source):
+    """
+    Return the items of an existing string table.
+
+    Plain strings are returned as text so that they can be reused. Other items
+    are kept as elements so that rich text and phonetic runs are preserved.
+    """
+    SI = "{%s}si" % SHEET_MAIN_NS
+    T = "{%s}t" % SHEET_MAIN_NS
+
+    tree = fromstring(xml_source)
+    items = []
+    seen = set()
+    for node in tree.iterfind(SI):
+        if len(node) == 1 and node[0].tag == T:
+            text = node[0].text or ""
+            if text not in seen:
+                seen.add(text)
+                node = text
+        items.append(node)
+    return items
+
+
+def write_string_table(string_table):
+    """
+    Write the string table xml.
+
+    Items which are already elements are written as they are.
+    """
+    out = BytesIO()
+
+    with xmlfile(out) as xf:
+        with xf.element("sst", xmlns=SHEET_MAIN_NS, uniqueCount="%d" % len(string_table)):
+            for key in string_table:
+                if isinstance(key, str):
+                    el = Element("si")
+                    text = SubElement(el, "t")
+                    text.text = key
+                    whitespace(text)
+                    key = el
+                xf.write(key)
+
+    return out.getvalue()
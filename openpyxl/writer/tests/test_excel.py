@@ -2,16 +2,20 @@
 # Copyright (c) 2010-2024 openpyxl
 
 from io import BytesIO
+import multiprocessing
 import os
+import threading
 from string import ascii_letters
 import datetime
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED, ZIP_LZMA
 
 import pytest
 
 from openpyxl import load_workbook, Workbook
 from openpyxl.chart import BarChart
 from openpyxl.comments import Comment
+from openpyxl.formatting.rule import CellIsRule
+from openpyxl.styles import Font
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.drawing.legacy import LegacyDrawing
 from openpyxl.drawing.image import Image
@@ -366,3 +370,444 @@ def test_modified(tmpdir):
     dest_filename = 'empty_book.xlsx'
     save_workbook(wb, dest_filename)
     assert wb.properties.modified > modified
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+def test_shared_strings(tmpdir, write_only):
+    wb = Workbook(write_only=write_only, use_shared_strings=True)
+    ws = wb.create_sheet()
+    ws.append(["a", "b", "a"])
+    out = str(tmpdir.join("strings.xlsx"))
+    wb.save(out)
+
+    archive = ZipFile(out)
+    assert b"sharedStrings" in archive.read("[Content_Types].xml")
+    assert b"sharedStrings" in archive.read("xl/_rels/workbook.xml.rels")
+    assert b'uniqueCount="2"' in archive.read("xl/sharedStrings.xml")
+    wb = load_workbook(out)
+    assert list(wb.worksheets[-1].values) == [("a", "b", "a")]
+
+
+def test_no_shared_strings(ExcelWriter, archive):
+    wb = Workbook(use_shared_strings=True)
+    wb.active.append([1, 2])
+    writer = ExcelWriter(wb, archive)
+    writer.write_data()
+    assert "xl/sharedStrings.xml" not in archive.namelist()
+
+
+@pytest.mark.parametrize("compression, compresslevel",
+                         [
+                             (ZIP_STORED, None),
+                             (ZIP_DEFLATED, 1),
+                             (ZIP_DEFLATED, 9),
+                         ]
+                         )
+def test_compression(tmpdir, compression, compresslevel):
+    wb = Workbook()
+    wb.active.append(list(ascii_letters))
+    out = str(tmpdir.join("compressed.xlsx"))
+    wb.save(out, compression=compression, compresslevel=compresslevel)
+
+    archive = ZipFile(out)
+    assert archive.getinfo("xl/worksheets/sheet1.xml").compress_type == compression
+    wb = load_workbook(out)
+    assert wb.active["A1"].value == "a"
+
+
+@pytest.mark.parametrize("spool_size", [0, 2**20])
+def test_compresslevel(tmpdir, spool_size):
+    sizes = []
+    for level in (0, 9):
+        wb = Workbook(spool_size=spool_size)
+        ws = wb.active
+        for i in range(100):
+            ws.append([i, "compressible"])
+        out = str(tmpdir.join(f"level{level}.xlsx"))
+        wb.save(out, compresslevel=level)
+        info = ZipFile(out).getinfo("xl/worksheets/sheet1.xml")
+        sizes.append(info.compress_size)
+    assert sizes[0] > 2 * sizes[1]
+
+
+def test_unsupported_compression():
+    from ..excel import save_workbook
+    with pytest.raises(ValueError):
+        save_workbook(Workbook(), BytesIO(), compression=ZIP_LZMA)
+
+
+def test_write_file(ExcelWriter, archive):
+    wb = Workbook()
+    writer = ExcelWriter(wb, archive)
+    src = BytesIO(b"<worksheet/>")
+    src.read()
+    writer.write_file(src, "xl/worksheets/sheet1.xml")
+    assert archive.read("xl/worksheets/sheet1.xml") == b"<worksheet/>"
+
+
+def test_save_without_temporary_files(tmpdir, monkeypatch):
+    from openpyxl.worksheet import _writer
+
+    def create_temporary_file():
+        raise AssertionError("Temporary file created")
+    monkeypatch.setattr(_writer, "create_temporary_file", create_temporary_file)
+
+    wb = Workbook(spool_size=2**20)
+    wb.active.append(["a", 1])
+    out = str(tmpdir.join("spooled.xlsx"))
+    wb.save(out)
+
+    wb = load_workbook(out)
+    assert list(wb.active.values) == [("a", 1)]
+
+
+class UnseekableFile:
+    """
+    Like a pipe or a socket
+    """
+
+    def __init__(self):
+        self.data = BytesIO()
+
+    def write(self, data):
+        return self.data.write(data)
+
+    def flush(self):
+        pass
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+def test_save_unseekable(write_only):
+    wb = Workbook(write_only=write_only)
+    ws = wb.create_sheet()
+    ws.append(["a", 1])
+    out = UnseekableFile()
+    wb.save(out)
+
+    archive = ZipFile(out.data)
+    assert all(info.flag_bits & 0x08 for info in archive.infolist()) # data descriptors
+    wb = load_workbook(out.data)
+    assert list(wb.worksheets[-1].values) == [("a", 1)]
+
+
+def test_stream_workbook():
+    from ..excel import stream_workbook
+
+    wb = Workbook()
+    for idx in range(1000):
+        wb.active.append([idx, "row %d" % idx])
+    chunks = list(stream_workbook(wb, chunk_size=1024, compresslevel=1))
+    assert len(chunks) > 1
+    assert all(len(chunk) == 1024 for chunk in chunks[:-1])
+
+    wb = load_workbook(BytesIO(b"".join(chunks)))
+    assert wb.active.max_row == 1000
+
+
+def test_stream_workbook_closed():
+    from ..excel import stream_workbook
+
+    wb = Workbook()
+    for idx in range(1000):
+        wb.active.append([idx, "row %d" % idx])
+    stream = stream_workbook(wb, chunk_size=64, max_chunks=1)
+    next(stream)
+    stream.close() # the save is stopped and the thread joined
+
+
+def test_stream_workbook_error():
+    from ..excel import stream_workbook
+
+    stream = stream_workbook(Workbook(), compression=ZIP_LZMA)
+    with pytest.raises(ValueError):
+        next(stream)
+
+
+@pytest.fixture
+def ParallelWorkbook():
+    wb = Workbook(use_shared_strings=True)
+    ws1 = wb.active
+    ws1.append(["name", "value"])
+    ws1.append(["a", 1])
+    ws1["A1"].font = Font(bold=True)
+    ws1["A2"].hyperlink = "http://example.com"
+    ws1["B2"].comment = Comment("note", "author")
+    ws2 = wb.create_sheet()
+    ws2.append(["b", 2])
+    ws2["A1"].font = Font(italic=True)
+    ws2.conditional_formatting.add("B1:B2", CellIsRule(operator="lessThan", formula=["1"], font=Font(color="FF0000")))
+    ws3 = wb.create_sheet()
+    ws3.append(["c", "d"])
+    ws3.append([3, 4])
+    ws3.add_table(Table(displayName="Table1", ref="A1:B2"))
+    return wb
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="processes cannot be forked")
+def test_save_in_parallel(ParallelWorkbook, tmpdir):
+    wb = ParallelWorkbook
+    serial = str(tmpdir.join("serial.xlsx"))
+    parallel = str(tmpdir.join("parallel.xlsx"))
+    wb.save(serial)
+    wb.save(parallel, workers=2)
+
+    serial = load_workbook(serial)
+    parallel = load_workbook(parallel)
+    for ws1, ws2 in zip(serial.worksheets, parallel.worksheets):
+        assert list(ws1.values) == list(ws2.values)
+        assert [(c.font.b, c.font.i) for c in ws1._cells.values()] == [(c.font.b, c.font.i) for c in ws2._cells.values()]
+    ws1, ws2, ws3 = parallel.worksheets
+    assert ws1["A2"].hyperlink.target == "http://example.com"
+    assert ws1["B2"].comment.text == "note"
+    assert ws2.conditional_formatting
+    assert ws3.tables["Table1"].ref == "A1:B2"
+
+
+def test_write_in_workers(ExcelWriter, archive, ParallelWorkbook):
+    wb = ParallelWorkbook
+    writer = ExcelWriter(wb, archive, workers=2)
+    ws1, ws2, ws3 = wb.worksheets
+    assert writer.can_write_in_worker(ws1)
+    assert not writer.can_write_in_worker(ws3)
+
+    for ws in wb.worksheets:
+        writer.prepare_worksheet(ws)
+    assert len(wb._cell_styles) == 3
+    assert len(wb._differential_styles.styles) == 1
+    assert list(wb.shared_strings) == ["name", "value", "a", "b", "c", "d"]
+
+
+def test_no_workers_for_write_only(ExcelWriter, archive):
+    wb = Workbook(write_only=True)
+    wb.create_sheet()
+    wb.create_sheet()
+    writer = ExcelWriter(wb, archive, workers=2)
+    assert writer._use_workers() is False
+
+
+def test_no_workers_with_threads(ExcelWriter, archive, ParallelWorkbook):
+    writer = ExcelWriter(ParallelWorkbook, archive, workers=2)
+    done = threading.Event()
+    thread = threading.Thread(target=done.wait)
+    thread.start()
+    try:
+        assert writer._use_workers() is False
+    finally:
+        done.set()
+        thread.join()
+
+
+@pytest.fixture
+def LazyWorkbook(tmpdir):
+    wb = Workbook()
+    ws1 = wb.active
+    ws1.append(["name", "value"])
+    ws1.append(["a", 1])
+    ws1["A1"].hyperlink = "http://example.com"
+    ws2 = wb.create_sheet()
+    ws2.append(["b", 2])
+    ws2.auto_filter.ref = "A1:B1"
+    wb.create_sheet().add_table(Table(displayName="Table1", ref="A1:B2"))
+    wb._sheets[2].append(["c", 3])
+    wb._sheets[2].append(["d", 4])
+    path = str(tmpdir.join("lazy.xlsx"))
+    wb.save(path)
+    return load_workbook(path, lazy=True)
+
+
+class TestCopyWorksheets:
+
+    def test_can_copy(self, ExcelWriter, archive, LazyWorkbook):
+        wb = LazyWorkbook
+        writer = ExcelWriter(wb, archive)
+        ws1, ws2, ws3 = wb.worksheets
+        assert writer.can_copy(ws1) # external hyperlink
+        assert writer.can_copy(ws2)
+        assert not writer.can_copy(ws3) # table
+        assert ws2["A1"].value == "b"
+        assert writer.can_copy(ws2)
+        ws2["A1"].value = "c"
+        assert not writer.can_copy(ws2)
+
+
+    def test_save(self, LazyWorkbook, tmpdir):
+        wb = LazyWorkbook
+        wb["Sheet1"]["C1"] = "changed"
+        out = str(tmpdir.join("copy.xlsx"))
+        wb.save(out)
+        wb.close()
+
+        assert not wb["Sheet"]._loaded
+        archive = ZipFile(out)
+        assert "xl/sharedStrings.xml" in archive.namelist()
+        assert b"sharedStrings" in archive.read("[Content_Types].xml")
+        assert b"sharedStrings" in archive.read("xl/_rels/workbook.xml.rels")
+
+        wb = load_workbook(out)
+        ws1, ws2, ws3 = wb.worksheets
+        assert ws1["A1"].value == "name"
+        assert ws1["A1"].hyperlink.target == "http://example.com"
+        assert ws1["B2"].value == 1
+        assert ws2["C1"].value == "changed"
+        assert ws3.tables["Table1"].ref == "A1:B2"
+
+
+    def test_save_shared_strings(self, LazyWorkbook, tmpdir):
+        wb = LazyWorkbook
+        wb.use_shared_strings = True
+        wb["Sheet1"]["A1"] = "new"
+        out = str(tmpdir.join("copy.xlsx"))
+        wb.save(out)
+        wb.close()
+
+        archive = ZipFile(out)
+        assert archive.namelist().count("xl/sharedStrings.xml") == 1
+        wb = load_workbook(out)
+        ws1, ws2, ws3 = wb.worksheets
+        assert ws1["A1"].value == "name"
+        assert ws1["A2"].value == "a"
+        assert ws2["A1"].value == "new"
+        assert ws3["A2"].value == "d"
+
+
+    def test_save_over_source(self, LazyWorkbook):
+        wb = LazyWorkbook
+        path = wb._archive.filename
+        wb.save(path)
+        wb.close()
+
+        wb = load_workbook(path)
+        assert wb["Sheet"]["A2"].value == "a"
+        assert wb["Sheet2"]["B2"].value == 4
+
+
+    def test_copy_member(self, ExcelWriter, archive, LazyWorkbook):
+        wb = LazyWorkbook
+        writer = ExcelWriter(wb, archive)
+        writer.copy_member("xl/worksheets/sheet1.xml", "xl/worksheets/copy.xml")
+
+        info = archive.getinfo("xl/worksheets/copy.xml")
+        source = wb._archive.getinfo("xl/worksheets/sheet1.xml")
+        assert info.CRC == source.CRC
+        assert archive.read(info) == wb._archive.read(source)
+
+
+    def test_copy_member_unchanged(self, ExcelWriter, LazyWorkbook):
+        wb = LazyWorkbook
+        out = BytesIO()
+        archive = ZipFile(out, "w", ZIP_STORED)
+        writer = ExcelWriter(wb, archive, target=out)
+        writer.copy_member("xl/worksheets/sheet1.xml", "xl/worksheets/copy.xml")
+        archive.writestr("xl/worksheets/sheet2.xml", "<worksheet/>")
+        archive.close()
+        writer.append_copied()
+        writer.close_source()
+
+        archive = ZipFile(out)
+        assert archive.testzip() is None
+        assert archive.namelist() == ["xl/worksheets/sheet2.xml", "xl/worksheets/copy.xml"]
+        info = archive.getinfo("xl/worksheets/copy.xml")
+        source = wb._archive.getinfo("xl/worksheets/sheet1.xml")
+        assert info.compress_type == source.compress_type == ZIP_DEFLATED
+        assert (info.CRC, info.compress_size) == (source.CRC, source.compress_size)
+        assert archive.read(info) == wb._archive.read(source)
+
+
+    def test_copy_member_changed_source(self, ExcelWriter, LazyWorkbook, tmpdir):
+        wb = LazyWorkbook
+        other = str(tmpdir.join("other.xlsx"))
+        Workbook().save(other)
+        os.replace(other, wb._archive.filename)
+        out = BytesIO()
+        archive = ZipFile(out, "w", ZIP_STORED)
+        writer = ExcelWriter(wb, archive, target=out)
+        writer.copy_member("xl/worksheets/sheet1.xml", "xl/worksheets/copy.xml")
+
+        assert writer.appended == {}
+        info = archive.getinfo("xl/worksheets/copy.xml")
+        assert info.compress_type == ZIP_STORED
+        assert archive.read(info) == wb._archive.read("xl/worksheets/sheet1.xml")
+
+
+    def test_save_stylesheet(self, LazyWorkbook, tmpdir):
+        wb = LazyWorkbook
+        path = wb._archive.filename
+        out = str(tmpdir.join("copy.xlsx"))
+        wb.save(out)
+        assert ZipFile(out).read("xl/styles.xml") == ZipFile(path).read("xl/styles.xml")
+
+        wb["Sheet1"]["A1"].font = Font(bold=True)
+        wb.save(out)
+        wb.close()
+        assert ZipFile(out).read("xl/styles.xml") != ZipFile(path).read("xl/styles.xml")
+        wb = load_workbook(out)
+        assert wb["Sheet1"]["A1"].font.b
+
+
+    def test_save_loaded(self, LazyWorkbook, tmpdir):
+        path = LazyWorkbook._archive.filename
+        LazyWorkbook.close()
+        wb = load_workbook(path)
+        ws1, ws2, ws3 = wb.worksheets
+        assert ws1["A2"].value == "a"
+        ws2["A1"] = "changed"
+        out = str(tmpdir.join("copy.xlsx"))
+        wb.save(out)
+
+        assert not ws1._changed
+        archive = ZipFile(out)
+        source = ZipFile(path)
+        info = archive.getinfo("xl/worksheets/sheet1.xml")
+        assert info.CRC == source.getinfo("xl/worksheets/sheet1.xml").CRC
+        assert info.CRC != source.getinfo("xl/worksheets/sheet2.xml").CRC
+        wb = load_workbook(out)
+        assert wb["Sheet"]["A2"].value == "a"
+        assert wb["Sheet1"]["A1"].value == "changed"
+
+
+    def test_copy_dependent_parts(self, tmpdir):
+        from openpyxl.chart import Reference
+
+        wb = Workbook()
+        ws1 = wb.active
+        ws1.append([1, 2])
+        ws1["A1"].comment = Comment("first", "author")
+        chart = BarChart()
+        chart.add_data(Reference(ws1, min_col=1, max_col=2, min_row=1))
+        ws1.add_chart(chart, "D2")
+        ws2 = wb.create_sheet()
+        ws2.append([3, 4])
+        ws2["A1"].comment = Comment("second", "author")
+        ws2.add_chart(BarChart(), "D2")
+        path = str(tmpdir.join("charts.xlsx"))
+        wb.save(path)
+
+        wb = load_workbook(path, lazy=True)
+        wb["Sheet1"]["B1"] = 5
+        out = str(tmpdir.join("copy.xlsx"))
+        wb.save(out)
+        assert not wb["Sheet"]._loaded
+        wb.close()
+
+        archive = ZipFile(out)
+        assert archive.testzip() is None
+        rels = archive.read("xl/worksheets/_rels/sheet1.xml.rels")
+        assert b"/xl/drawings/drawing1.xml" in rels
+        assert b"/xl/comments/comment2.xml" in rels
+        # the drawing of the changed worksheet is copied because its chart is unused
+        rels = archive.read("xl/worksheets/_rels/sheet2.xml.rels")
+        assert b"/xl/drawings/drawing2.xml" in rels
+        assert b"/xl/comments/comment1.xml" in rels
+        assert b"/xl/charts/chart2.xml" in archive.read("xl/drawings/_rels/drawing2.xml.rels")
+        assert b"/xl/charts/chart2.xml" in archive.read("[Content_Types].xml")
+        source = ZipFile(path)
+        for name in ["xl/drawings/drawing2.xml", "xl/charts/chart2.xml"]:
+            assert archive.getinfo(name).CRC == source.getinfo(name).CRC
+
+        wb = load_workbook(out)
+        ws1, ws2 = wb.worksheets
+        assert ws1["A1"].comment.text == "first"
+        assert len(ws1._charts) == 1
+        assert ws2["A1"].comment.text == "second"
+        assert ws2["B1"].value == 5
+        assert len(ws2._charts) == 1
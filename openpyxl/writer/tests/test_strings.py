@@ -0,0 +1,54 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from openpyxl.tests.helper import compare_xml
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.utils.indexed_list import IndexedList
+
+
+def test_write_string_table():
+    from ..strings import write_string_table
+
+    table = IndexedList(['hello', ' world ', 'nice'])
+    xml = write_string_table(table)
+    expected = """
+    <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" uniqueCount="3">
+      <si>
+        <t>hello</t>
+      </si>
+      <si>
+        <t xml:space="preserve"> world </t>
+      </si>
+      <si>
+        <t>nice</t>
+      </si>
+    </sst>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_read_source_items():
+    from ..strings import read_source_items, write_string_table
+
+    src = """
+    <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <si><t>plain</t></si>
+      <si><r><rPr><b/></rPr><t>bold</t></r></si>
+      <si><t>plain</t></si>
+    </sst>
+    """
+    items = read_source_items(src)
+    assert items[0] == "plain"
+    assert items[1].tag == "{%s}si" % SHEET_MAIN_NS
+    assert not isinstance(items[2], str)
+
+    xml = write_string_table(IndexedList(items))
+    expected = """
+    <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" uniqueCount="3">
+      <si><t>plain</t></si>
+      <si><r><rPr><b/></rPr><t>bold</t></r></si>
+      <si><t>plain</t></si>
+    </sst>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
@@ -0,0 +1,85 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile, BadZipFile, ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+
+@pytest.fixture
+def source():
+    out = BytesIO()
+    with ZipFile(out, "w", ZIP_DEFLATED) as archive:
+        archive.writestr("first.xml", b"<first/>" * 100)
+        archive.writestr("second.xml", b"<second/>" * 100)
+    out.seek(0)
+    return out
+
+
+def copy(source, names, comment=b""):
+    """
+    Copy members of the source to a new archive
+    """
+    from .._zip import append_members, data_offset
+
+    members = []
+    for info in ZipFile(source).infolist():
+        if info.filename in names:
+            members.append((names[info.filename], info, data_offset(source, info)))
+    out = BytesIO()
+    with ZipFile(out, "w", ZIP_STORED) as dest:
+        dest.writestr("new.xml", b"<new/>")
+        dest.comment = comment
+    append_members(out, source, members)
+    return ZipFile(out)
+
+
+def test_fingerprint(source):
+    from .._zip import fingerprint
+
+    archive = ZipFile(source)
+    first, second = archive.infolist()
+    assert fingerprint(archive) == [
+        ("first.xml", first.CRC, first.compress_size, 0),
+        ("second.xml", second.CRC, second.compress_size, second.header_offset),
+    ]
+
+
+def test_data_offset(source):
+    from .._zip import data_offset
+
+    info = ZipFile(source).getinfo("second.xml")
+    offset = data_offset(source, info)
+    assert offset == info.header_offset + 30 + len("second.xml")
+
+    info.filename = "other.xml"
+    with pytest.raises(BadZipFile):
+        data_offset(source, info)
+
+
+def test_append_members(source):
+    archive = copy(source, {"first.xml": "first.xml", "second.xml": "xl/é.xml"})
+    assert archive.testzip() is None
+    assert archive.namelist() == ["new.xml", "first.xml", "xl/é.xml"]
+    assert archive.read("xl/é.xml") == b"<second/>" * 100
+
+    original = ZipFile(source).getinfo("first.xml")
+    info = archive.getinfo("first.xml")
+    assert info.compress_type == ZIP_DEFLATED
+    assert (info.CRC, info.compress_size) == (original.CRC, original.compress_size)
+
+
+def test_append_zip64(source, monkeypatch):
+    from .. import _zip
+    monkeypatch.setattr(_zip, "ZIP64_LIMIT", 0)
+
+    archive = copy(source, {"first.xml": "first.xml"})
+    assert archive.testzip() is None
+    assert archive.read("first.xml") == b"<first/>" * 100
+    assert archive.getinfo("first.xml").extract_version == 45
+
+
+def test_keep_comment(source):
+    archive = copy(source, {"first.xml": "first.xml"}, comment=b"comment")
+    assert archive.comment == b"comment"
+    assert archive.read("first.xml") == b"<first/>" * 100
@@ -40,3 +40,10 @@ def defusedxml_env_set():
 
 
 DEFUSEDXML = defusedxml_available() and defusedxml_env_set()
+
+
+def parser_env():
+    return os.environ.get("OPENPYXL_PARSER", "stdlib")
+
+
+PARSER = parser_env()
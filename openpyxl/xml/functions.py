@@ -9,6 +9,7 @@ import re
 from functools import partial
 
 from openpyxl import DEFUSEDXML, LXML
+from openpyxl.xml import PARSER
 
 if LXML is True:
     from lxml.etree import (
@@ -41,6 +42,59 @@ from xml.etree.ElementTree import iterparse
 if DEFUSEDXML is True:
     from defusedxml.ElementTree import iterparse
 
+
+def stdlib_iterparse(source, events=("end",), tag=None):
+    """
+    Parse incrementally using the standard library (or defusedxml).
+    Filtering by tag is done in Python so is for compatibility only.
+    """
+    it = iterparse(source, events)
+    if tag is None:
+        return it
+    if isinstance(tag, str):
+        tag = (tag,)
+    tags = frozenset(tag)
+    return ((event, element) for event, element in it if element.tag in tags)
+
+
+def lxml_iterparse(source, events=("end",), tag=None):
+    """
+    Parse incrementally using lxml. Only events for the requested tags are
+    generated and elements that have already been returned are removed from
+    the tree. Entities are not resolved and the network is never accessed.
+    """
+    from lxml.etree import iterparse as _lxml_iterparse
+
+    it = _lxml_iterparse(source, events=events, tag=tag, resolve_entities=False,
+                   no_network=True, load_dtd=False, remove_comments=True)
+    for event, element in it:
+        # free siblings that have already been processed
+        if event == "end":
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        yield event, element
+
+
+PARSERS = {
+    "stdlib": stdlib_iterparse,
+    "lxml": lxml_iterparse,
+}
+
+
+def get_iterparse(engine=None):
+    """
+    Return the incremental parser for the engine. The default is the
+    standard library's parser, or defusedxml's if it is installed, and can
+    be set using the OPENPYXL_PARSER environment variable.
+    """
+    engine = engine or PARSER
+    if engine == "lxml" and not LXML:
+        engine = "stdlib"
+    try:
+        return PARSERS[engine]
+    except KeyError:
+        raise ValueError(f"{engine} is not a supported parser. Use one of {', '.join(PARSERS)}")
+
 from openpyxl.xml.constants import (
     CHART_NS,
     DRAWING_NS,
@@ -87,3 +87,49 @@ def test_whitespace(value, preserve):
     whitespace(el)
     check = "{%s}space" % XML_NS in el.attrib
     assert check is preserve
+
+
+@pytest.mark.parametrize("engine", ["stdlib", "lxml"])
+def test_iterparse_filter(engine):
+    from ..functions import get_iterparse
+    iterparse = get_iterparse(engine)
+    xml = b"<root><a>1</a><b><a>2</a></b><c/></root>"
+    tags = [el.tag for _, el in iterparse(BytesIO(xml), tag=("a", "c"))]
+    assert tags == ["a", "a", "c"]
+
+
+@pytest.mark.parametrize("engine", ["stdlib", "lxml"])
+def test_iterparse_start(engine):
+    from ..functions import get_iterparse
+    iterparse = get_iterparse(engine)
+    xml = b"<root><a x='1'/><b/></root>"
+    events = [(ev, el.tag) for ev, el in iterparse(BytesIO(xml), events=("start",))]
+    assert events == [("start", "root"), ("start", "a"), ("start", "b")]
+
+
+@pytest.mark.lxml_required
+def test_lxml_iterparse_frees_siblings():
+    from ..functions import lxml_iterparse
+    xml = b"<root><a/><a/><a/></root>"
+    for _, el in lxml_iterparse(BytesIO(xml), tag="a"):
+        assert el.getprevious() is None
+
+
+@pytest.mark.lxml_required
+def test_lxml_iterparse_entities():
+    from ..functions import lxml_iterparse
+    f = BytesIO(vulnerable_xml_strings[0])
+    for _, el in lxml_iterparse(f, tag="foo"):
+        assert el.text is None
+
+
+def test_unknown_parser():
+    from ..functions import get_iterparse
+    with pytest.raises(ValueError):
+        get_iterparse("sax")
+
+
+def test_default_parser(monkeypatch):
+    from .. import parser_env
+    monkeypatch.delenv("OPENPYXL_PARSER", raising=False)
+    assert parser_env() == "stdlib"